@@ -0,0 +1,133 @@
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:  # pragma: no cover
+    import asyncio
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Bounded mapping evicting the least recently used entry when full.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._data
+
+    def get(self, key: K) -> V | None:
+        try:
+            value = self._data[key]
+        except KeyError:
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        return self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Bounded LRU mapping where each entry expires after its own time-to-live.
+    """
+
+    def __init__(
+        self, maxsize: int, *, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._data: LRUCache[K, tuple[float, V]] = LRUCache(maxsize)
+        self._clock = clock
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> V | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            self._data.pop(key)
+            return None
+        return value
+
+    def set(self, key: K, value: V, ttl: float) -> None:
+        if ttl <= 0:
+            self._data.pop(key)
+            return
+        self._data.set(key, (self._clock() + ttl, value))
+
+    def pop(self, key: K) -> V | None:
+        entry = self._data.pop(key)
+        return entry[1] if entry is not None else None
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Coalesces concurrent calls sharing the same key:
+    only the first one is actually run, and every caller gets its result or exception.
+
+    The call runs in its own task, so it's not interrupted if one of the callers is cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[K, asyncio.Future[V]] = {}
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def start(self, key: K, fn: Callable[[], Awaitable[V]]) -> "asyncio.Future[V]":
+        """
+        Starts the call if none is in flight for this key, without waiting for it.
+        """
+        import asyncio
+
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+        return task
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        import asyncio
+
+        return await asyncio.shield(self.start(key, fn))
+
+    def _done(self, key: K, task: "asyncio.Future[V]") -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # Mark the exception as retrieved, in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+
+def hash_token(token: str) -> bytes:
+    """
+    Returns a digest of a token, suitable as a cache key
+    without keeping the token itself in memory.
+    """
+    return hashlib.sha256(token.encode("utf-8")).digest()
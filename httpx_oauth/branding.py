@@ -1,6 +1,64 @@
+import functools
+from collections.abc import Callable
 from typing import Protocol
 
 
 class BrandingProtocol(Protocol):
     display_name: str
     logo_svg: str
+
+
+@functools.cache
+def load_logo_svg(name: str) -> str:
+    """
+    Loads the SVG logo of a provider from the package resources.
+
+    Args:
+        name: The provider module name, e.g. `google`.
+
+    Returns:
+        The SVG logo.
+    """
+    from importlib import resources
+
+    return (
+        resources.files("httpx_oauth.clients")
+        .joinpath("logos")
+        .joinpath(f"{name}.svg")
+        .read_text(encoding="utf-8")
+    )
+
+
+def logo_svg_getattr(module_name: str, name: str) -> Callable[[str], str]:
+    """
+    Creates a module-level `__getattr__` loading the `LOGO_SVG` constant
+    of a provider module on first access.
+
+    Args:
+        module_name: The provider module `__name__`.
+        name: The provider module name, e.g. `google`.
+
+    Returns:
+        The `__getattr__` function.
+    """
+
+    def __getattr__(attribute: str) -> str:
+        if attribute == "LOGO_SVG":
+            return load_logo_svg(name)
+        message = f"module {module_name!r} has no attribute {attribute!r}"
+        raise AttributeError(message)
+
+    return __getattr__
+
+
+class LogoSVG:
+    """
+    Descriptor loading the SVG logo of a provider on first access,
+    so it's not kept in memory by processes that never use it.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: object, owner: type | None = None) -> str:
+        return load_logo_svg(self.name)
@@ -0,0 +1,52 @@
+"""
+OAuth2 clients for popular providers.
+
+Provider modules are only imported when needed, either directly
+or through [get][httpx_oauth.clients.get]:
+
+```py
+from httpx_oauth import clients
+
+GoogleOAuth2 = clients.get("google")
+```
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from httpx_oauth.oauth2 import BaseOAuth2
+
+PROVIDERS: dict[str, tuple[str, str]] = {
+    "discord": ("httpx_oauth.clients.discord", "DiscordOAuth2"),
+    "facebook": ("httpx_oauth.clients.facebook", "FacebookOAuth2"),
+    "franceconnect": ("httpx_oauth.clients.franceconnect", "FranceConnectOAuth2"),
+    "github": ("httpx_oauth.clients.github", "GitHubOAuth2"),
+    "google": ("httpx_oauth.clients.google", "GoogleOAuth2"),
+    "kakao": ("httpx_oauth.clients.kakao", "KakaoOAuth2"),
+    "linkedin": ("httpx_oauth.clients.linkedin", "LinkedInOAuth2"),
+    "microsoft": ("httpx_oauth.clients.microsoft", "MicrosoftGraphOAuth2"),
+    "naver": ("httpx_oauth.clients.naver", "NaverOAuth2"),
+    "okta": ("httpx_oauth.clients.okta", "OktaOAuth2"),
+    "openid": ("httpx_oauth.clients.openid", "OpenID"),
+    "reddit": ("httpx_oauth.clients.reddit", "RedditOAuth2"),
+    "shopify": ("httpx_oauth.clients.shopify", "ShopifyOAuth2"),
+}
+"""Module and class name of each provided client, by provider name."""
+
+
+def get(name: str) -> "type[BaseOAuth2[Any]]":
+    """
+    Returns the client class of a provider, importing its module on first access.
+
+    Args:
+        name: The provider name, e.g. `google`. See `PROVIDERS` for the available names.
+
+    Returns:
+        The client class.
+
+    Raises:
+        KeyError: The provider is unknown.
+    """
+    module_name, class_name = PROVIDERS[name]
+    return getattr(importlib.import_module(module_name), class_name)
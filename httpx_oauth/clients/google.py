@@ -1,5 +1,6 @@
 from typing import Any, Literal, TypedDict, cast
 
+from httpx_oauth.branding import LogoSVG, logo_svg_getattr
 from httpx_oauth.exceptions import GetIdEmailError, GetProfileError
 from httpx_oauth.oauth2 import BaseOAuth2
 
@@ -13,16 +14,7 @@ BASE_SCOPES = [
 PROFILE_ENDPOINT = "https://people.googleapis.com/v1/people/me"
 
 
-LOGO_SVG = """
-<svg width="256px" height="262px" viewBox="0 0 256 262" version="1.1" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" preserveAspectRatio="xMidYMid">
-	<g>
-		<path d="M255.878,133.451 C255.878,122.717 255.007,114.884 253.122,106.761 L130.55,106.761 L130.55,155.209 L202.497,155.209 C201.047,167.249 193.214,185.381 175.807,197.565 L175.563,199.187 L214.318,229.21 L217.003,229.478 C241.662,206.704 255.878,173.196 255.878,133.451" fill="#4285F4"></path>
-		<path d="M130.55,261.1 C165.798,261.1 195.389,249.495 217.003,229.478 L175.807,197.565 C164.783,205.253 149.987,210.62 130.55,210.62 C96.027,210.62 66.726,187.847 56.281,156.37 L54.75,156.5 L14.452,187.687 L13.925,189.152 C35.393,231.798 79.49,261.1 130.55,261.1" fill="#34A853"></path>
-		<path d="M56.281,156.37 C53.525,148.247 51.93,139.543 51.93,130.55 C51.93,121.556 53.525,112.853 56.136,104.73 L56.063,103 L15.26,71.312 L13.925,71.947 C5.077,89.644 0,109.517 0,130.55 C0,151.583 5.077,171.455 13.925,189.152 L56.281,156.37" fill="#FBBC05"></path>
-		<path d="M130.55,50.479 C155.064,50.479 171.6,61.068 181.029,69.917 L217.873,33.943 C195.245,12.91 165.798,0 130.55,0 C79.49,0 35.393,29.301 13.925,71.947 L56.136,104.73 C66.726,73.253 96.027,50.479 130.55,50.479" fill="#EB4335"></path>
-	</g>
-</svg>
-"""
+__getattr__ = logo_svg_getattr(__name__, "google")
 
 
 class GoogleOAuth2AuthorizeParams(TypedDict, total=False):
@@ -36,7 +28,7 @@ class GoogleOAuth2(BaseOAuth2[GoogleOAuth2AuthorizeParams]):
     """OAuth2 client for Google."""
 
     display_name = "Google"
-    logo_svg = LOGO_SVG
+    logo_svg = LogoSVG("google")
 
     def __init__(
         self,
@@ -65,18 +57,14 @@ class GoogleOAuth2(BaseOAuth2[GoogleOAuth2AuthorizeParams]):
             revocation_endpoint_auth_method="client_secret_post",
         )
 
-    async def get_profile(self, token: str) -> dict[str, Any]:
-        async with self.get_httpx_client() as client:
-            response = await client.get(
-                PROFILE_ENDPOINT,
-                params={"personFields": "emailAddresses"},
-                headers={**self.request_headers, "Authorization": f"Bearer {token}"},
-            )
-
-            if response.status_code >= 400:
-                raise GetProfileError(response=response)
+    def get_warmup_endpoints(self) -> list[str]:
+        return [*super().get_warmup_endpoints(), PROFILE_ENDPOINT]
 
-            return cast(dict[str, Any], response.json())
+    async def get_profile(self, token: str) -> dict[str, Any]:
+        profile = await self.request_profile(
+            "GET", PROFILE_ENDPOINT, token, params={"personFields": "emailAddresses"}
+        )
+        return cast(dict[str, Any], profile)
 
     async def get_id_email(self, token: str) -> tuple[str, str | None]:
         try:
@@ -1,5 +1,6 @@
 from typing import Any, Literal, cast
 
+from httpx_oauth.branding import LogoSVG, logo_svg_getattr
 from httpx_oauth.exceptions import GetIdEmailError, GetProfileError
 from httpx_oauth.oauth2 import BaseOAuth2
 
@@ -9,21 +10,14 @@ BASE_SCOPES = ["User.Read"]
 PROFILE_ENDPOINT = "https://graph.microsoft.com/v1.0/me"
 
 
-LOGO_SVG = """
-<svg width="100%" height="100%" viewBox="0 0 110 110" version="1.1" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" xml:space="preserve" xmlns:serif="http://www.serif.com/" style="fill-rule:evenodd;clip-rule:evenodd;stroke-linejoin:round;stroke-miterlimit:2;">
-    <rect x="0" y="0" width="51.927" height="51.927" style="fill:rgb(241,81,27);fill-rule:nonzero;"/>
-    <rect x="57.334" y="0" width="51.926" height="51.927" style="fill:rgb(128,204,40);fill-rule:nonzero;"/>
-    <rect x="0" y="57.354" width="51.925" height="51.927" style="fill:rgb(0,173,239);fill-rule:nonzero;"/>
-    <rect x="57.334" y="57.354" width="51.926" height="51.927" style="fill:rgb(251,188,9);fill-rule:nonzero;"/>
-</svg>
-"""
+__getattr__ = logo_svg_getattr(__name__, "microsoft")
 
 
 class MicrosoftGraphOAuth2(BaseOAuth2[dict[str, Any]]):
     """OAuth2 client for Microsoft Graph API."""
 
     display_name = "Microsoft"
-    logo_svg = LOGO_SVG
+    logo_svg = LogoSVG("microsoft")
 
     def __init__(
         self,
@@ -41,6 +35,7 @@ class MicrosoftGraphOAuth2(BaseOAuth2[dict[str, Any]]):
             scopes: The default scopes to be used in the authorization URL.
             name: A unique name for the OAuth2 client.
         """
+        self.tenant = tenant
         access_token_endpoint = ACCESS_TOKEN_ENDPOINT.format(tenant=tenant)
         super().__init__(
             client_id,
@@ -53,6 +48,28 @@ class MicrosoftGraphOAuth2(BaseOAuth2[dict[str, Any]]):
             token_endpoint_auth_method="client_secret_post",
         )
 
+    def for_tenant(self, tenant: str) -> "MicrosoftGraphOAuth2":
+        """
+        Returns a lightweight client for another tenant.
+
+        It shares the pooled HTTPX client and the configuration of this client,
+        so you don't need to instantiate a full client for each tenant.
+        See [TenantRegistry][httpx_oauth.tenants.TenantRegistry] to manage them.
+
+        Args:
+            tenant: The tenant to use for the authorization URL.
+
+        Returns:
+            A client for the tenant.
+        """
+        access_token_endpoint = ACCESS_TOKEN_ENDPOINT.format(tenant=tenant)
+        return self._copy_with(
+            tenant=tenant,
+            authorize_endpoint=AUTHORIZE_ENDPOINT.format(tenant=tenant),
+            access_token_endpoint=access_token_endpoint,
+            refresh_token_endpoint=access_token_endpoint,
+        )
+
     async def get_authorization_url(
         self,
         redirect_uri: str,
@@ -74,17 +91,17 @@ class MicrosoftGraphOAuth2(BaseOAuth2[dict[str, Any]]):
             extras_params=extras_params,
         )
 
-    async def get_profile(self, token: str) -> dict[str, Any]:
-        async with self.get_httpx_client() as client:
-            response = await client.get(
-                PROFILE_ENDPOINT,
-                headers={"Authorization": f"Bearer {token}"},
-            )
+    def get_warmup_endpoints(self) -> list[str]:
+        return [*super().get_warmup_endpoints(), PROFILE_ENDPOINT]
 
-            if response.status_code >= 400:
-                raise GetProfileError(response=response)
-
-            return cast(dict[str, Any], response.json())
+    async def get_profile(self, token: str) -> dict[str, Any]:
+        profile = await self.request_profile(
+            "GET",
+            PROFILE_ENDPOINT,
+            token,
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        return cast(dict[str, Any], profile)
 
     async def get_id_email(self, token: str) -> tuple[str, str | None]:
         try:
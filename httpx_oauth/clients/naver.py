@@ -1,5 +1,6 @@
 from typing import Any, cast
 
+from httpx_oauth.branding import LogoSVG, logo_svg_getattr
 from httpx_oauth.exceptions import GetIdEmailError, GetProfileError
 from httpx_oauth.oauth2 import BaseOAuth2, RevokeTokenError
 
@@ -10,23 +11,15 @@ REVOKE_TOKEN_ENDPOINT = ACCESS_TOKEN_ENDPOINT
 PROFILE_ENDPOINT = "https://openapi.naver.com/v1/nid/me"
 BASE_SCOPES: list[str] = []
 
-LOGO_SVG = """
-<svg xmlns="http://www.w3.org/2000/svg" xmlns:svg="http://www.w3.org/2000/svg" version="1.1" xml:space="preserve" width="40" height="40" viewBox="0 0 40 40">
-  <g xmlns="http://www.w3.org/2000/svg" transform="translate(36,0)">
-    <path d="m 0,0 h -32 c -2.2,0 -4,1.8 -4,4 v 32 c 0,2.2 1.8,4 4,4 H 0 c 2.2,0 4,-1.8 4,-4 V 4 C 4,1.8 2.2,0 0,0" style="fill:#03c75a;fill-opacity:1;fill-rule:nonzero;stroke:none"/>
-  </g>
-  <g xmlns="http://www.w3.org/2000/svg" transform="translate(17.332,18.662) scale(-1,1)">
-    <path d="m 0,0 -5.683,8.135 h -4.711 V -7.064 h 4.935 V 1.071 L 0.224,-7.064 H 4.935 V 8.135 H 0 Z" style="fill:#ffffff;fill-opacity:1;fill-rule:nonzero;stroke:none"/>
-  </g>
-</svg>
-"""
+
+__getattr__ = logo_svg_getattr(__name__, "naver")
 
 
 class NaverOAuth2(BaseOAuth2[dict[str, Any]]):
     """OAuth2 client for Naver."""
 
     display_name = "Naver"
-    logo_svg = LOGO_SVG
+    logo_svg = LogoSVG("naver")
 
     def __init__(
         self,
@@ -69,29 +62,23 @@ class NaverOAuth2(BaseOAuth2[dict[str, Any]]):
             if token_type_hint is not None:
                 data["token_type_hint"] = token_type_hint
 
-            request, auth = self.build_request(
+            await self.send_authenticated_request(
                 client,
                 "POST",
                 self.revoke_token_endpoint,
                 auth_method=self.token_endpoint_auth_method,
                 data=data,
+                exc_class=RevokeTokenError,
             )
-            await self.send_request(client, request, auth, exc_class=RevokeTokenError)
 
         return None
 
-    async def get_profile(self, token: str) -> dict[str, Any]:
-        async with self.get_httpx_client() as client:
-            response = await client.post(
-                PROFILE_ENDPOINT,
-                headers={**self.request_headers, "Authorization": f"Bearer {token}"},
-            )
-
-            if response.status_code >= 400:
-                raise GetProfileError(response=response)
+    def get_warmup_endpoints(self) -> list[str]:
+        return [*super().get_warmup_endpoints(), PROFILE_ENDPOINT]
 
-            json = response.json()
-            return cast(dict[str, Any], json["response"])
+    async def get_profile(self, token: str) -> dict[str, Any]:
+        json = await self.request_profile("POST", PROFILE_ENDPOINT, token)
+        return cast(dict[str, Any], json["response"])
 
     async def get_id_email(self, token: str) -> tuple[str, str | None]:
         try:
@@ -1,3 +1,5 @@
+from typing import Any
+
 from httpx_oauth.clients.openid import OpenID
 
 BASE_SCOPES = ["openid", "email"]
@@ -13,6 +15,10 @@ class OktaOAuth2(OpenID):
         okta_domain: str,
         scopes: list[str] | None = BASE_SCOPES,
         name: str = "okta",
+        *,
+        openid_configuration: dict[str, Any] | None = None,
+        discovery_refresh_interval: float | None = None,
+        validate_openid_configuration: bool = False,
     ):
         """
         Args:
@@ -21,11 +27,25 @@ class OktaOAuth2(OpenID):
             okta_domain: The Okta organization domain.
             scopes: The default scopes to be used in the authorization URL.
             name: A unique name for the OAuth2 client.
+            openid_configuration: An already fetched OpenID configuration.
+                If set, the discovery endpoint is not requested.
+            discovery_refresh_interval: If set, the OpenID configuration is fetched again
+                in the background every `discovery_refresh_interval` seconds
+                while the client is open.
+            validate_openid_configuration: If set, the OpenID configuration is fetched again
+                in the background as soon as the client is open.
         """
         super().__init__(
             client_id,
             client_secret,
-            f"https://{okta_domain}/.well-known/openid-configuration",
+            self.get_openid_configuration_endpoint(okta_domain=okta_domain),
             name=name,
             base_scopes=scopes,
+            openid_configuration=openid_configuration,
+            discovery_refresh_interval=discovery_refresh_interval,
+            validate_openid_configuration=validate_openid_configuration,
         )
+
+    @classmethod
+    def get_openid_configuration_endpoint(cls, **kwargs: Any) -> str:
+        return f"https://{kwargs['okta_domain']}/.well-known/openid-configuration"
@@ -1,11 +1,14 @@
-from typing import Any, get_args
+import asyncio
+from typing import Any, cast, get_args
 
 import httpx
 
 from httpx_oauth.exceptions import GetIdEmailError, GetProfileError
 from httpx_oauth.oauth2 import BaseOAuth2, OAuth2ClientAuthMethod, OAuth2RequestError
+from httpx_oauth.tls import default_ssl_context
 
 BASE_SCOPES = ["openid", "email"]
+DISCOVERY_REFRESH_RETRY_INTERVAL = 60
 
 
 class OpenIDConfigurationError(OAuth2RequestError):
@@ -14,6 +17,69 @@ class OpenIDConfigurationError(OAuth2RequestError):
     """
 
 
+def fetch_openid_configuration(openid_configuration_endpoint: str) -> dict[str, Any]:
+    """
+    Fetches an OpenID configuration.
+
+    Args:
+        openid_configuration_endpoint: OpenID Connect discovery endpoint URL.
+
+    Returns:
+        The OpenID configuration.
+
+    Raises:
+        OpenIDConfigurationError:
+            An error occurred while fetching the OpenID configuration.
+    """
+    with httpx.Client(verify=default_ssl_context.get()) as client:
+        try:
+            response = client.get(openid_configuration_endpoint)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise OpenIDConfigurationError(str(e), e.response) from e
+        except httpx.HTTPError as e:
+            raise OpenIDConfigurationError(str(e)) from e
+    return _parse_openid_configuration(response)
+
+
+async def afetch_openid_configuration(
+    openid_configuration_endpoint: str, client: httpx.AsyncClient
+) -> dict[str, Any]:
+    """
+    Fetches an OpenID configuration asynchronously.
+
+    Args:
+        openid_configuration_endpoint: OpenID Connect discovery endpoint URL.
+        client: The HTTPX client used to fetch the configuration.
+
+    Returns:
+        The OpenID configuration.
+
+    Raises:
+        OpenIDConfigurationError:
+            An error occurred while fetching the OpenID configuration.
+    """
+    try:
+        response = await client.get(openid_configuration_endpoint)
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        raise OpenIDConfigurationError(str(e), e.response) from e
+    except httpx.HTTPError as e:
+        raise OpenIDConfigurationError(str(e)) from e
+    return _parse_openid_configuration(response)
+
+
+def _parse_openid_configuration(response: httpx.Response) -> dict[str, Any]:
+    message = "Invalid OpenID configuration"
+    try:
+        openid_configuration = response.json()
+    except ValueError as e:
+        raise OpenIDConfigurationError(message, response) from e
+    if not isinstance(openid_configuration, dict):
+        raise OpenIDConfigurationError(message, response)
+    return openid_configuration
+
+
 class OpenID(BaseOAuth2[dict[str, Any]]):
     """
     Generic client for providers following the [OpenID Connect protocol](https://openid.net/connect/).
@@ -28,6 +94,10 @@ class OpenID(BaseOAuth2[dict[str, Any]]):
         openid_configuration_endpoint: str,
         name: str = "openid",
         base_scopes: list[str] | None = BASE_SCOPES,
+        *,
+        openid_configuration: dict[str, Any] | None = None,
+        discovery_refresh_interval: float | None = None,
+        validate_openid_configuration: bool = False,
     ):
         """
         Args:
@@ -36,6 +106,14 @@ class OpenID(BaseOAuth2[dict[str, Any]]):
             openid_configuration_endpoint: OpenID Connect discovery endpoint URL.
             name: A unique name for the OAuth2 client.
             base_scopes: The base scopes to be used in the authorization URL.
+            openid_configuration: An already fetched OpenID configuration.
+                If set, the discovery endpoint is not requested.
+            discovery_refresh_interval: If set, the OpenID configuration is fetched again
+                in the background every `discovery_refresh_interval` seconds
+                while the client [is open][httpx_oauth.oauth2.BaseOAuth2.open].
+            validate_openid_configuration: If set, the OpenID configuration is fetched again
+                in the background as soon as the client is open, to catch drifts
+                from a preloaded `openid_configuration`.
 
         Raises:
             OpenIDConfigurationError:
@@ -48,27 +126,142 @@ class OpenID(BaseOAuth2[dict[str, Any]]):
             client = OpenID("CLIENT_ID", "CLIENT_SECRET", "https://example.fief.dev/.well-known/openid-configuration")
             ``
         """
-        with httpx.Client() as client:
+        if openid_configuration is None:
+            openid_configuration = fetch_openid_configuration(
+                openid_configuration_endpoint
+            )
+        self.openid_configuration_endpoint = openid_configuration_endpoint
+        self.openid_configuration: dict[str, Any] = openid_configuration
+        self.discovery_refresh_interval = discovery_refresh_interval
+        self.validate_openid_configuration = validate_openid_configuration
+        self._discovery_refresh_task: asyncio.Task[None] | None = None
+
+        super().__init__(
+            client_id,
+            client_secret,
+            **self._get_endpoints(openid_configuration),
+            name=name,
+            base_scopes=base_scopes,
+        )
+
+    @classmethod
+    def get_openid_configuration_endpoint(cls, **kwargs: Any) -> str:
+        """
+        Returns the OpenID configuration endpoint of a client,
+        from the keyword arguments of its constructor.
+
+        It allows to fetch the OpenID configuration asynchronously
+        before constructing the client, e.g. in
+        [ClientRegistry.aget][httpx_oauth.registry.ClientRegistry.aget].
+
+        Args:
+            **kwargs: Keyword arguments of the constructor.
+
+        Returns:
+            The OpenID configuration endpoint.
+        """
+        return kwargs["openid_configuration_endpoint"]
+
+    async def open(self) -> None:
+        await super().open()
+        if self._discovery_refresh_task is None and (
+            self.discovery_refresh_interval is not None
+            or self.validate_openid_configuration
+        ):
+            self._discovery_refresh_task = asyncio.create_task(
+                self._refresh_openid_configuration_loop(
+                    0
+                    if self.validate_openid_configuration
+                    else self.discovery_refresh_interval,
+                    self.discovery_refresh_interval,
+                )
+            )
+
+    async def aclose(self) -> None:
+        if self._discovery_refresh_task is not None:
+            task, self._discovery_refresh_task = self._discovery_refresh_task, None
+            task.cancel()
             try:
-                response = client.get(openid_configuration_endpoint)
-                response.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                raise OpenIDConfigurationError(str(e), e.response) from e
-            except httpx.HTTPError as e:
-                raise OpenIDConfigurationError(str(e)) from e
-            self.openid_configuration: dict[str, Any] = response.json()
-
-        token_endpoint = self.openid_configuration["token_endpoint"]
-        refresh_token_supported = "refresh_token" in self.openid_configuration.get(
+                await task
+            except asyncio.CancelledError:
+                pass
+        await super().aclose()
+
+    async def refresh_openid_configuration(self) -> dict[str, Any]:
+        """
+        Fetches the OpenID configuration again and updates the endpoints.
+
+        The endpoints are swapped all at once, so concurrent requests
+        see either the previous configuration or the new one, never a mix of both.
+        If the request fails, the current configuration is kept.
+
+        Returns:
+            The new OpenID configuration.
+
+        Raises:
+            OpenIDConfigurationError:
+                An error occurred while fetching the OpenID configuration.
+        """
+        async with self.get_httpx_client() as client:
+            openid_configuration = await afetch_openid_configuration(
+                self.openid_configuration_endpoint, client
+            )
+        try:
+            self.set_openid_configuration(openid_configuration)
+        except (KeyError, IndexError, TypeError) as e:
+            message = "Invalid OpenID configuration"
+            raise OpenIDConfigurationError(message) from e
+        return openid_configuration
+
+    async def _refresh_openid_configuration_loop(
+        self, delay: float | None, interval: float | None
+    ) -> None:
+        retry_interval = min(
+            interval or DISCOVERY_REFRESH_RETRY_INTERVAL,
+            DISCOVERY_REFRESH_RETRY_INTERVAL,
+        )
+        while delay is not None:
+            await asyncio.sleep(delay)
+            try:
+                await self.refresh_openid_configuration()
+            except OpenIDConfigurationError:
+                # Keep serving the current configuration and retry sooner
+                delay = retry_interval
+            else:
+                delay = interval
+
+    def set_openid_configuration(self, openid_configuration: dict[str, Any]) -> None:
+        """
+        Replaces the OpenID configuration and the endpoints derived from it,
+        all at once.
+
+        Args:
+            openid_configuration: The new OpenID configuration.
+
+        Raises:
+            KeyError: A required endpoint is missing.
+        """
+        endpoints = self._get_endpoints(openid_configuration)
+        self.openid_configuration = openid_configuration
+        self.__dict__.update(endpoints)
+
+    @staticmethod
+    def _get_endpoints(openid_configuration: dict[str, Any]) -> dict[str, Any]:
+        token_endpoint = openid_configuration["token_endpoint"]
+        refresh_token_supported = "refresh_token" in openid_configuration.get(
             "grant_types_supported", []
         )
-        revocation_endpoint = self.openid_configuration.get("revocation_endpoint")
-        token_endpoint_auth_methods_supported = self.openid_configuration.get(
+        revocation_endpoint = openid_configuration.get("revocation_endpoint")
+        token_endpoint_auth_methods_supported = openid_configuration.get(
             "token_endpoint_auth_methods_supported", ["client_secret_basic"]
         )
-        revocation_endpoint_auth_methods_supported = self.openid_configuration.get(
+        revocation_endpoint_auth_methods_supported = openid_configuration.get(
             "revocation_endpoint_auth_methods_supported", ["client_secret_basic"]
         )
+        introspection_endpoint = openid_configuration.get("introspection_endpoint")
+        introspection_endpoint_auth_methods_supported = openid_configuration.get(
+            "introspection_endpoint_auth_methods_supported", ["client_secret_basic"]
+        )
 
         supported_auth_methods = get_args(OAuth2ClientAuthMethod)
         # check if there is any supported and select the first one
@@ -82,35 +275,48 @@ class OpenID(BaseOAuth2[dict[str, Any]]):
             for method in revocation_endpoint_auth_methods_supported
             if method in supported_auth_methods
         ]
+        introspection_endpoint_auth_methods_supported = [
+            method
+            for method in introspection_endpoint_auth_methods_supported
+            if method in supported_auth_methods
+        ]
+        # the introspection endpoint can't be used without a supported auth method
+        if not introspection_endpoint_auth_methods_supported:
+            introspection_endpoint = None
 
-        super().__init__(
-            client_id,
-            client_secret,
-            self.openid_configuration["authorization_endpoint"],
-            token_endpoint,
-            token_endpoint if refresh_token_supported else None,
-            revocation_endpoint,
-            name=name,
-            base_scopes=base_scopes,
-            token_endpoint_auth_method=token_endpoint_auth_methods_supported[0],
-            revocation_endpoint_auth_method=(
+        return {
+            "authorize_endpoint": openid_configuration["authorization_endpoint"],
+            "access_token_endpoint": token_endpoint,
+            "refresh_token_endpoint": (
+                token_endpoint if refresh_token_supported else None
+            ),
+            "revoke_token_endpoint": revocation_endpoint,
+            "token_endpoint_auth_method": token_endpoint_auth_methods_supported[0],
+            "revocation_endpoint_auth_method": (
                 revocation_endpoint_auth_methods_supported[0]
                 if revocation_endpoint
                 else None
             ),
-        )
-
-    async def get_profile(self, token: str) -> dict[str, Any]:
-        async with self.get_httpx_client() as client:
-            response = await client.get(
-                self.openid_configuration["userinfo_endpoint"],
-                headers={**self.request_headers, "Authorization": f"Bearer {token}"},
-            )
+            "introspection_endpoint": introspection_endpoint,
+            "introspection_endpoint_auth_method": (
+                introspection_endpoint_auth_methods_supported[0]
+                if introspection_endpoint
+                else None
+            ),
+        }
 
-            if response.status_code >= 400:
-                raise GetProfileError(response=response)
+    def get_warmup_endpoints(self) -> list[str]:
+        endpoints = super().get_warmup_endpoints()
+        userinfo_endpoint = self.openid_configuration.get("userinfo_endpoint")
+        if userinfo_endpoint is not None:
+            endpoints.append(userinfo_endpoint)
+        return endpoints
 
-            return response.json()
+    async def get_profile(self, token: str) -> dict[str, Any]:
+        profile = await self.request_profile(
+            "GET", self.openid_configuration["userinfo_endpoint"], token
+        )
+        return cast(dict[str, Any], profile)
 
     async def get_id_email(self, token: str) -> tuple[str, str | None]:
         try:
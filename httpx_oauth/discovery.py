@@ -0,0 +1,350 @@
+import contextlib
+import time
+from types import TracebackType
+from typing import Any, NamedTuple
+
+import httpx
+
+from httpx_oauth._cache import LRUCache, SingleFlight
+from httpx_oauth.clients.openid import (
+    BASE_SCOPES,
+    OpenID,
+    afetch_openid_configuration,
+)
+from httpx_oauth.jwks import JWKSCache, default_jwks_cache
+from httpx_oauth.oauth2 import HTTPXClientFactory, HTTPXClientPool
+from httpx_oauth.tls import default_ssl_context
+
+DISCOVERY_CACHE_TTL = 3600
+DISCOVERY_CACHE_MAX_STALE = 86400
+DISCOVERY_CACHE_MAXSIZE = 1024
+OPENID_REGISTRY_MAXSIZE = 1024
+
+
+class OpenIDDiscoveryCache:
+    """
+    Cache of [OpenID configurations](https://openid.net/specs/openid-connect-discovery-1_0.html),
+    keyed by their discovery endpoint URL.
+
+    A configuration is fresh for `ttl` seconds. After that, the cached configuration
+    is still returned, while a new one is fetched in the background.
+    If it's older than `ttl + max_stale` seconds, the caller waits for the new one.
+
+    Concurrent fetches of the same configuration are coalesced into a single request.
+    The same cache can be shared by several clients and issuers.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DISCOVERY_CACHE_TTL,
+        max_stale: float = DISCOVERY_CACHE_MAX_STALE,
+        maxsize: int = DISCOVERY_CACHE_MAXSIZE,
+    ) -> None:
+        """
+        Args:
+            ttl: How long a configuration is considered fresh, in seconds.
+            max_stale: How long a configuration can be returned
+                while it's refreshed in the background once stale, in seconds.
+            maxsize: Maximum number of configurations kept in the cache.
+        """
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self._configurations: LRUCache[str, tuple[float, dict[str, Any]]] = LRUCache(
+            maxsize
+        )
+        self._fetches: SingleFlight[str, dict[str, Any]] = SingleFlight()
+
+    async def get(
+        self, openid_configuration_endpoint: str, get_httpx_client: HTTPXClientFactory
+    ) -> dict[str, Any]:
+        """
+        Returns an OpenID configuration, fetching it if needed.
+
+        Args:
+            openid_configuration_endpoint: OpenID Connect discovery endpoint URL.
+            get_httpx_client: Returns an async context manager yielding the HTTPX client
+                used to fetch the configuration. It's also used by background refreshes,
+                so it should still be usable after the call.
+
+        Returns:
+            The OpenID configuration.
+
+        Raises:
+            OpenIDConfigurationError:
+                An error occurred while fetching the OpenID configuration.
+        """
+        entry = self._configurations.get(openid_configuration_endpoint)
+        if entry is not None:
+            fetched_at, openid_configuration = entry
+            age = time.monotonic() - fetched_at
+            if age < self.ttl:
+                return openid_configuration
+            if age < self.ttl + self.max_stale:
+                self._fetches.start(
+                    openid_configuration_endpoint,
+                    lambda: self._fetch(
+                        openid_configuration_endpoint, get_httpx_client
+                    ),
+                )
+                return openid_configuration
+
+        return await self._fetches.do(
+            openid_configuration_endpoint,
+            lambda: self._fetch(openid_configuration_endpoint, get_httpx_client),
+        )
+
+    def set(
+        self, openid_configuration_endpoint: str, openid_configuration: dict[str, Any]
+    ) -> None:
+        """
+        Stores an already fetched OpenID configuration in the cache.
+
+        Args:
+            openid_configuration_endpoint: OpenID Connect discovery endpoint URL.
+            openid_configuration: The OpenID configuration.
+        """
+        self._configurations.set(
+            openid_configuration_endpoint, (time.monotonic(), openid_configuration)
+        )
+
+    def clear(self) -> None:
+        """Empties the cache."""
+        self._configurations.clear()
+
+    async def _fetch(
+        self, openid_configuration_endpoint: str, get_httpx_client: HTTPXClientFactory
+    ) -> dict[str, Any]:
+        async with get_httpx_client() as client:
+            openid_configuration = await afetch_openid_configuration(
+                openid_configuration_endpoint, client
+            )
+        self.set(openid_configuration_endpoint, openid_configuration)
+        return openid_configuration
+
+
+default_discovery_cache = OpenIDDiscoveryCache()
+"""Process-wide OpenID configuration cache, used when no cache is explicitly provided."""
+
+
+class _IssuerRegistration(NamedTuple):
+    client_id: str
+    client_secret: str
+    openid_configuration_endpoint: str
+    name: str
+    base_scopes: list[str] | None
+
+
+class OpenIDRegistry:
+    """
+    Registry of [OpenID][httpx_oauth.clients.openid.OpenID] clients, keyed by issuer.
+
+    Registering an issuer is cheap: no request is made until its client is first needed.
+    Clients are then created from a configuration fetched asynchronously
+    through a shared [OpenIDDiscoveryCache][httpx_oauth.discovery.OpenIDDiscoveryCache],
+    and only the `maxsize` most recently used ones are kept in memory.
+    Every client shares the pooled HTTPX client of the registry.
+
+    Examples:
+        ```py
+        from httpx_oauth.discovery import OpenIDRegistry
+
+        registry = OpenIDRegistry()
+        registry.register("https://example.fief.dev", "CLIENT_ID", "CLIENT_SECRET")
+
+        async with registry:
+            client = await registry.get("https://example.fief.dev")
+            user_id, user_email = await client.get_id_email("TOKEN")
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        discovery_cache: OpenIDDiscoveryCache = default_discovery_cache,
+        jwks_cache: JWKSCache = default_jwks_cache,
+        maxsize: int = OPENID_REGISTRY_MAXSIZE,
+    ) -> None:
+        """
+        Args:
+            discovery_cache: The cache of OpenID configurations.
+            jwks_cache: The cache of JSON Web Key Sets.
+            maxsize: Maximum number of clients kept in memory.
+        """
+        self.discovery_cache = discovery_cache
+        self.jwks_cache = jwks_cache
+        self._registrations: dict[str, _IssuerRegistration] = {}
+        self._clients: LRUCache[str, OpenID] = LRUCache(maxsize)
+        self.pool = HTTPXClientPool()
+
+    def __len__(self) -> int:
+        return len(self._registrations)
+
+    def __contains__(self, issuer: str) -> bool:
+        return issuer in self._registrations
+
+    def register(
+        self,
+        issuer: str,
+        client_id: str,
+        client_secret: str,
+        *,
+        openid_configuration_endpoint: str | None = None,
+        name: str = "openid",
+        base_scopes: list[str] | None = BASE_SCOPES,
+    ) -> None:
+        """
+        Registers an issuer. No request is made.
+
+        Args:
+            issuer: The issuer identifier.
+            client_id: The client ID provided by the issuer.
+            client_secret: The client secret provided by the issuer.
+            openid_configuration_endpoint: OpenID Connect discovery endpoint URL.
+                Defaults to the `.well-known/openid-configuration` path of the issuer.
+            name: A unique name for the OAuth2 client.
+            base_scopes: The base scopes to be used in the authorization URL.
+        """
+        if openid_configuration_endpoint is None:
+            openid_configuration_endpoint = (
+                f"{issuer.rstrip('/')}/.well-known/openid-configuration"
+            )
+        self._registrations[issuer] = _IssuerRegistration(
+            client_id, client_secret, openid_configuration_endpoint, name, base_scopes
+        )
+        self._clients.pop(issuer)
+
+    def unregister(self, issuer: str) -> None:
+        """
+        Removes an issuer from the registry.
+
+        Args:
+            issuer: The issuer identifier.
+
+        Raises:
+            KeyError: The issuer is not registered.
+        """
+        del self._registrations[issuer]
+        self._clients.pop(issuer)
+
+    def rotate_client_secret(
+        self, issuer: str, client_secret: str, *, overlap: float = 0
+    ) -> None:
+        """
+        Replaces the client secret of an issuer, without rebuilding its client
+        or fetching its OpenID configuration again.
+
+        See [rotate_client_secret][httpx_oauth.oauth2.BaseOAuth2.rotate_client_secret].
+
+        Args:
+            issuer: The issuer identifier.
+            client_secret: The new client secret.
+            overlap: How long the previous secret can still be tried, in seconds.
+
+        Raises:
+            KeyError: The issuer is not registered.
+        """
+        registration = self._registrations[issuer]
+        self._registrations[issuer] = registration._replace(client_secret=client_secret)
+        client = self._clients.get(issuer)
+        if client is not None:
+            client.rotate_client_secret(client_secret, overlap=overlap)
+
+    async def get(self, issuer: str) -> OpenID:
+        """
+        Returns the client of an issuer, creating it if needed.
+
+        If the OpenID configuration of the issuer was refreshed since the client
+        was created, the client is updated with the new endpoints.
+
+        Args:
+            issuer: The issuer identifier.
+
+        Returns:
+            The client of the issuer.
+
+        Raises:
+            KeyError: The issuer is not registered.
+            OpenIDConfigurationError:
+                An error occurred while fetching the OpenID configuration.
+        """
+        registration = self._registrations[issuer]
+        openid_configuration = await self.discovery_cache.get(
+            registration.openid_configuration_endpoint, self.get_httpx_client
+        )
+
+        client = self._clients.get(issuer)
+        if client is None:
+            client = OpenID(
+                registration.client_id,
+                registration.client_secret,
+                registration.openid_configuration_endpoint,
+                name=registration.name,
+                base_scopes=registration.base_scopes,
+                openid_configuration=openid_configuration,
+            )
+            client.pool = self.pool
+            self._clients.set(issuer, client)
+        elif client.openid_configuration is not openid_configuration:
+            client.set_openid_configuration(openid_configuration)
+        return client
+
+    async def get_jwk(self, issuer: str, kid: str | None) -> dict[str, Any]:
+        """
+        Returns a signing key of an issuer, from its discovered JSON Web Key Set.
+
+        Args:
+            issuer: The issuer identifier.
+            kid: The key ID. If `None`, the key set should contain a single key.
+
+        Returns:
+            The JSON Web Key, as a dictionary.
+
+        Raises:
+            KeyError: The issuer is not registered.
+            OpenIDConfigurationError:
+                An error occurred while fetching the OpenID configuration.
+            JWKSError: An error occurred while fetching the key set.
+            JWKNotFoundError: No key matches the key ID.
+        """
+        client = await self.get(issuer)
+        return await self.jwks_cache.get_key(
+            client.openid_configuration["jwks_uri"], kid, self.get_httpx_client
+        )
+
+    def create_httpx_client(self) -> httpx.AsyncClient:
+        """
+        Creates the pooled HTTPX client shared by every client of the registry.
+
+        Override it to customize the HTTPX client.
+        """
+        return httpx.AsyncClient(verify=default_ssl_context.get())
+
+    async def open(self) -> None:
+        """Opens the pooled HTTPX client shared by every client of the registry."""
+        self.pool.open(self.create_httpx_client)
+
+    async def aclose(self) -> None:
+        """Closes the pooled HTTPX client shared by every client of the registry."""
+        await self.pool.aclose()
+
+    def get_httpx_client(
+        self,
+    ) -> contextlib.AbstractAsyncContextManager[httpx.AsyncClient]:
+        """
+        Returns the pooled HTTPX client if the registry is open,
+        or a new HTTPX client closed on exit otherwise.
+        """
+        return self.pool.get_httpx_client(self.create_httpx_client)
+
+    async def __aenter__(self) -> "OpenIDRegistry":  # noqa: PYI034
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
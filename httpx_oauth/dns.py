@@ -0,0 +1,369 @@
+import asyncio
+import contextlib
+import ipaddress
+import socket
+import ssl
+import time
+import typing
+from collections.abc import Callable
+from typing import NamedTuple, Protocol
+
+import httpcore
+import httpx
+
+from httpx_oauth._cache import LRUCache, SingleFlight
+from httpx_oauth.tls import default_ssl_context
+
+DNS_CACHE_TTL = 60
+DNS_CACHE_MAXSIZE = 256
+DNS_CACHE_REFRESH_RATIO = 0.8
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+
+class DNSRecord(NamedTuple):
+    """Result of a host name resolution."""
+
+    addresses: list[str]
+    """IP addresses of the host, by order of preference."""
+    ttl: float | None
+    """How long the addresses can be cached, in seconds. `None` if unknown."""
+
+
+class Resolver(Protocol):
+    """Protocol of host name resolvers used by [DNSCache][httpx_oauth.dns.DNSCache]."""
+
+    async def resolve(self, host: str) -> DNSRecord:
+        """
+        Resolves a host name.
+
+        Args:
+            host: The host name.
+
+        Returns:
+            The IP addresses of the host, and their time-to-live if known.
+
+        Raises:
+            OSError: The host name can't be resolved.
+        """
+        ...  # pragma: no cover
+
+
+class SystemResolver:
+    """
+    Resolves host names with the system resolver, through
+    [getaddrinfo][asyncio.loop.getaddrinfo].
+
+    The system resolver doesn't tell the time-to-live of the records,
+    so the default TTL of the cache applies.
+    """
+
+    async def resolve(self, host: str) -> DNSRecord:
+        loop = asyncio.get_running_loop()
+        infos = await loop.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+        addresses = list(dict.fromkeys(str(info[4][0]) for info in infos))
+        return DNSRecord(addresses, None)
+
+
+class DNSCache:
+    """
+    Cache of host name resolutions.
+
+    Addresses are kept for the time-to-live given by the resolver,
+    or `ttl` if the resolver doesn't tell it.
+    Once `refresh_ratio` of the time-to-live has elapsed, the host is resolved again
+    in the background while the cached addresses are still served,
+    so requests don't wait for DNS as long as the host is used regularly.
+    Concurrent resolutions of the same host are coalesced.
+
+    Examples:
+        ```py
+        from httpx_oauth.dns import DNSCache
+
+        client.dns_cache = DNSCache()
+        ```
+    """
+
+    def __init__(
+        self,
+        resolver: Resolver | None = None,
+        *,
+        ttl: float = DNS_CACHE_TTL,
+        maxsize: int = DNS_CACHE_MAXSIZE,
+        refresh_ratio: float = DNS_CACHE_REFRESH_RATIO,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            resolver: The resolver. Defaults to the system resolver.
+            ttl: How long addresses are cached, in seconds,
+                when the resolver doesn't tell it.
+            maxsize: Maximum number of cached host names.
+            refresh_ratio: Fraction of the time-to-live after which
+                the host is resolved again in the background.
+            clock: Monotonic clock, in seconds.
+        """
+        self.resolver: Resolver = resolver if resolver is not None else SystemResolver()
+        self.ttl = ttl
+        self.refresh_ratio = refresh_ratio
+        self._clock = clock
+        self._entries: LRUCache[str, tuple[float, float, list[str]]] = LRUCache(maxsize)
+        self._lookups: SingleFlight[str, list[str]] = SingleFlight()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def resolve(self, host: str) -> list[str]:
+        """
+        Returns the IP addresses of a host, from the cache if possible.
+
+        Args:
+            host: The host name. IP addresses are returned as is.
+
+        Returns:
+            The IP addresses of the host.
+
+        Raises:
+            OSError: The host name can't be resolved.
+        """
+        if _is_ip_address(host):
+            return [host]
+
+        entry = self._entries.get(host)
+        if entry is not None:
+            refresh_at, expires_at, addresses = entry
+            now = self._clock()
+            if now < expires_at:
+                if now >= refresh_at:
+                    self._lookups.start(host, lambda: self._lookup(host))
+                return addresses
+            self._entries.pop(host)
+
+        return await self._lookups.do(host, lambda: self._lookup(host))
+
+    def invalidate(self, host: str | None = None) -> None:
+        """
+        Removes a host, or every host, from the cache.
+
+        Args:
+            host: The host name. If `None`, the whole cache is cleared.
+        """
+        if host is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(host)
+
+    async def _lookup(self, host: str) -> list[str]:
+        addresses, ttl = await self.resolver.resolve(host)
+        if not addresses:
+            message = f"No address found for {host}"
+            raise OSError(message)
+        if ttl is None:
+            ttl = self.ttl
+        if ttl > 0:
+            now = self._clock()
+            self._entries.set(
+                host, (now + ttl * self.refresh_ratio, now + ttl, addresses)
+            )
+        return addresses
+
+
+class DNSCacheNetworkBackend(httpcore.AsyncNetworkBackend):
+    """
+    HTTPCore network backend resolving host names through a [DNSCache][httpx_oauth.dns.DNSCache].
+
+    The connection is opened to each address in turn, until one succeeds.
+    TLS still verifies the certificate against the host name of the request.
+    """
+
+    def __init__(
+        self,
+        dns_cache: DNSCache,
+        backend: httpcore.AsyncNetworkBackend | None = None,
+    ) -> None:
+        """
+        Args:
+            dns_cache: The DNS cache.
+            backend: The network backend opening the connections.
+                Defaults to the AnyIO backend.
+        """
+        self.dns_cache = dns_cache
+        self._backend = backend if backend is not None else httpcore.AnyIOBackend()
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: typing.Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        try:
+            addresses = await self.dns_cache.resolve(host)
+        except OSError as e:
+            raise httpcore.ConnectError(str(e)) from e
+
+        for address in addresses[:-1]:
+            try:
+                return await self._backend.connect_tcp(
+                    address, port, timeout, local_address, socket_options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout):
+                continue
+        return await self._backend.connect_tcp(
+            addresses[-1], port, timeout, local_address, socket_options
+        )
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: typing.Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(path, timeout, socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class DNSCacheTransport(httpx.AsyncBaseTransport):
+    """
+    HTTPX transport resolving host names through a [DNSCache][httpx_oauth.dns.DNSCache].
+
+    It owns an HTTPCore connection pool built with a
+    [DNSCacheNetworkBackend][httpx_oauth.dns.DNSCacheNetworkBackend],
+    which requires HTTPCore 1.x, as pinned by the `dns` extra.
+
+    Proxies are not supported: behind a proxy, host names are resolved by the proxy.
+
+    Examples:
+        ```py
+        import httpx
+
+        from httpx_oauth.dns import DNSCache, DNSCacheTransport
+
+        dns_cache = DNSCache()
+        httpx_client = httpx.AsyncClient(transport=DNSCacheTransport(dns_cache))
+        ```
+    """
+
+    def __init__(
+        self,
+        dns_cache: DNSCache,
+        *,
+        verify: ssl.SSLContext | None = None,
+        http1: bool = True,
+        http2: bool = False,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        uds: str | None = None,
+        local_address: str | None = None,
+        retries: int = 0,
+        socket_options: typing.Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> None:
+        """
+        Args:
+            dns_cache: The DNS cache.
+            verify: The SSL context.
+                Defaults to the [process-wide one][httpx_oauth.tls.default_ssl_context].
+            http1: Whether to support HTTP/1.1.
+            http2: Whether to support HTTP/2.
+            limits: The connection limits.
+            uds: Path of a Unix domain socket to connect through, instead of TCP.
+            local_address: Local address to bind the connections to.
+            retries: How many times to retry failed connections.
+            socket_options: Socket options set on the connections.
+        """
+        self.dns_cache = dns_cache
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=verify if verify is not None else default_ssl_context.get(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=http1,
+            http2=http2,
+            uds=uds,
+            local_address=local_address,
+            retries=retries,
+            socket_options=socket_options,
+            network_backend=DNSCacheNetworkBackend(dns_cache),
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        assert isinstance(request.stream, httpx.AsyncByteStream)
+        httpcore_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        with _map_httpcore_exceptions():
+            response = await self._pool.handle_async_request(httpcore_request)
+
+        assert isinstance(response.stream, typing.AsyncIterable)
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_ResponseStream(response.stream),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+
+class _ResponseStream(httpx.AsyncByteStream):
+    def __init__(self, stream: typing.AsyncIterable[bytes]) -> None:
+        self._stream = stream
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        with _map_httpcore_exceptions():
+            async for part in self._stream:
+                yield part
+
+    async def aclose(self) -> None:
+        aclose = getattr(self._stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+# Most specific exceptions first
+_HTTPCORE_EXCEPTIONS: list[tuple[type[Exception], type[httpx.TransportError]]] = [
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.ProxyError, httpx.ProxyError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+]
+
+
+@contextlib.contextmanager
+def _map_httpcore_exceptions() -> typing.Iterator[None]:
+    try:
+        yield
+    except Exception as e:
+        for httpcore_exception, httpx_exception in _HTTPCORE_EXCEPTIONS:
+            if isinstance(e, httpcore_exception):
+                raise httpx_exception(str(e)) from e
+        raise
+
+
+def _is_ip_address(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
@@ -1,11 +1,33 @@
-from typing import Any
+import asyncio
+import contextlib
+import copy
+import functools
+import re
+import secrets
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, cast
 
 import httpx
-from fastapi import HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from starlette import status
+from starlette.applications import Starlette
+from starlette.datastructures import URL
 from starlette.requests import Request
+from starlette.responses import RedirectResponse, Response
+from starlette.routing import Router
 
-from httpx_oauth.oauth2 import BaseOAuth2, GetAccessTokenError, OAuth2Error, OAuth2Token
+from httpx_oauth._cache import LRUCache, SingleFlight, TTLCache, hash_token
+from httpx_oauth.exceptions import GetIdEmailError
+from httpx_oauth.jwks import JWKNotFoundError, JWKSCache, JWKSError, default_jwks_cache
+from httpx_oauth.oauth2 import (
+    BaseOAuth2,
+    GetAccessTokenError,
+    OAuth2Error,
+    OAuth2RequestError,
+    OAuth2Token,
+)
 
 
 class OAuth2AuthorizeCallbackError(HTTPException, OAuth2Error):
@@ -28,6 +50,16 @@ class OAuth2AuthorizeCallbackError(HTTPException, OAuth2Error):
         super().__init__(status_code, detail, headers)
 
 
+REDIRECT_URL_CACHE_MAXSIZE = 128
+CODE_EXCHANGE_CACHE_TTL = 0
+CODE_EXCHANGE_CACHE_MAXSIZE = 1024
+
+
+def _redirect_url_cache_key(base_url: str | URL) -> str:
+    url = URL(str(base_url))
+    return str(url.replace(path=url.path.rstrip("/") + "/"))
+
+
 class OAuth2AuthorizeCallback:
     """
     Dependency callable to handle the authorization callback. It reads the query parameters and returns the access token and the state.
@@ -47,6 +79,17 @@ class OAuth2AuthorizeCallback:
             token, state = access_token_state
             # Do something useful
         ```
+
+    When using `route_name`, the resolved redirect URL is cached for each
+    base URL (scheme, host and root path) the callback is reached through,
+    so the router is only walked once per base URL.
+
+    Browsers and proxies sometimes replay the callback. Concurrent duplicate
+    callbacks with the same code share a single exchange with the provider,
+    and each one gets its own copy of the token.
+    If `code_exchange_cache_ttl` is set, the token is also returned to late replays
+    for this duration, instead of failing with `invalid_grant`.
+    Codes are only kept hashed, together with the redirect URL and the code verifier.
     """
 
     client: BaseOAuth2[Any]
@@ -58,12 +101,20 @@ class OAuth2AuthorizeCallback:
         client: BaseOAuth2[Any],
         route_name: str | None = None,
         redirect_url: str | None = None,
+        *,
+        cache_redirect_url: bool = True,
+        code_exchange_cache_ttl: float = CODE_EXCHANGE_CACHE_TTL,
     ):
         """
         Args:
             client: An [OAuth2][httpx_oauth.oauth2.BaseOAuth2] client.
             route_name: Name of the callback route, as defined in the `name` parameter of the route decorator.
             redirect_url: Full URL to the callback route.
+            cache_redirect_url: Whether to cache the redirect URL resolved from `route_name`.
+            code_exchange_cache_ttl: How long the token obtained for a code is returned
+                to late duplicate callbacks, in seconds. Disabled by default:
+                anyone replaying the callback with the same code during this delay
+                gets the token, so only enable it if the code can't be intercepted.
         """
         assert (route_name is not None and redirect_url is None) or (
             route_name is None and redirect_url is not None
@@ -71,6 +122,74 @@ class OAuth2AuthorizeCallback:
         self.client = client
         self.route_name = route_name
         self.redirect_url = redirect_url
+        self._redirect_url_cache: LRUCache[str, str] | None = (
+            LRUCache(REDIRECT_URL_CACHE_MAXSIZE) if cache_redirect_url else None
+        )
+        self.code_exchange_cache_ttl = code_exchange_cache_ttl
+        self._code_exchanges: TTLCache[bytes, OAuth2Token] = TTLCache(
+            CODE_EXCHANGE_CACHE_MAXSIZE
+        )
+        self._code_exchange_calls: SingleFlight[bytes, OAuth2Token] = SingleFlight()
+
+    def precompute_redirect_url(self, app: Starlette | Router, base_url: str) -> str:
+        """
+        Resolves the redirect URL for a given base URL ahead of time,
+        typically at application startup, so the first callbacks
+        don't have to walk the router.
+
+        Args:
+            app: The application or router declaring the callback route.
+            base_url: The public base URL of the application,
+                including the root path if any.
+
+        Returns:
+            The resolved redirect URL.
+
+        Examples:
+            ```py
+            @asynccontextmanager
+            async def lifespan(app: FastAPI):
+                oauth2_authorize_callback.precompute_redirect_url(app, "https://www.tintagel.bt")
+                yield
+            ```
+        """
+        assert self.route_name is not None, (
+            "Redirect URL is only resolved with route_name"
+        )
+        redirect_url = str(
+            app.url_path_for(self.route_name).make_absolute_url(base_url)
+        )
+        if self._redirect_url_cache is not None:
+            self._redirect_url_cache.set(
+                _redirect_url_cache_key(base_url), redirect_url
+            )
+        return redirect_url
+
+    def get_redirect_url(self, request: Request) -> str:
+        """
+        Returns the redirect URL to use for a given request.
+
+        Args:
+            request: The incoming request.
+
+        Returns:
+            The redirect URL, either resolved from `route_name` or set explicitly.
+        """
+        if self.redirect_url is not None:
+            return self.redirect_url
+        return self._resolve_redirect_url(request)
+
+    def _resolve_redirect_url(self, request: Request) -> str:
+        assert self.route_name is not None
+        if self._redirect_url_cache is None:
+            return str(request.url_for(self.route_name))
+
+        key = str(request.base_url)
+        redirect_url = self._redirect_url_cache.get(key)
+        if redirect_url is None:
+            redirect_url = str(request.url_for(self.route_name))
+            self._redirect_url_cache.set(key, redirect_url)
+        return redirect_url
 
     async def __call__(
         self,
@@ -86,15 +205,10 @@ class OAuth2AuthorizeCallback:
                 detail=error if error is not None else None,
             )
 
-        if self.route_name:
-            redirect_url = str(request.url_for(self.route_name))
-        elif self.redirect_url:
-            redirect_url = self.redirect_url
+        redirect_url = self.get_redirect_url(request)
 
         try:
-            access_token = await self.client.get_access_token(
-                code, redirect_url, code_verifier
-            )
+            access_token = await self._exchange_code(code, redirect_url, code_verifier)
         except GetAccessTokenError as e:
             raise OAuth2AuthorizeCallbackError(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -103,3 +217,487 @@ class OAuth2AuthorizeCallback:
             ) from e
 
         return access_token, state
+
+    async def _exchange_code(
+        self, code: str, redirect_url: str, code_verifier: str | None
+    ) -> OAuth2Token:
+        key = hash_token(f"{code}\0{redirect_url}\0{code_verifier or ''}")
+        access_token = self._code_exchanges.get(key)
+        if access_token is None:
+
+            async def _exchange() -> OAuth2Token:
+                access_token = await self.client.get_access_token(
+                    code, redirect_url, code_verifier
+                )
+                self._code_exchanges.set(
+                    key, access_token, self.code_exchange_cache_ttl
+                )
+                return access_token
+
+            access_token = await self._code_exchange_calls.do(key, _exchange)
+
+        return copy.copy(access_token)
+
+
+OAuth2TokenStore = Callable[[OAuth2Token], Awaitable[Any]]
+"""Async callable persisting the access token obtained after a successful login."""
+
+OAuth2LoginHandler = Callable[
+    [Request, OAuth2Token, tuple[str, str | None] | None], Awaitable[Any]
+]
+"""
+Async callable called after a successful login with the request,
+the access token and, if requested, the id and email of the user.
+
+Its return value is used as the response of the callback route.
+"""
+
+
+def get_oauth2_lifespan(
+    *clients: BaseOAuth2[Any],
+    warmup_connections: int | None = None,
+    keepalive_interval: float | None = None,
+) -> Callable[[Any], contextlib.AbstractAsyncContextManager[None]]:
+    """
+    Returns a lifespan handler opening the pooled HTTPX client of each
+    OAuth2 client on startup and closing them on shutdown.
+
+    Args:
+        *clients: The [OAuth2][httpx_oauth.oauth2.BaseOAuth2] clients to manage.
+        warmup_connections: If set, this number of connections is opened
+            to the endpoints of each client on startup.
+            See [warmup][httpx_oauth.oauth2.BaseOAuth2.warmup].
+        keepalive_interval: If set with `warmup_connections`, the connections
+            are kept alive by using them again every `keepalive_interval` seconds.
+
+    Returns:
+        A lifespan handler.
+
+    Examples:
+        ```py
+        app = FastAPI(
+            lifespan=get_oauth2_lifespan(
+                google_client, github_client, warmup_connections=4, keepalive_interval=4
+            )
+        )
+        ```
+    """
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app: Any) -> AsyncIterator[None]:
+        async with contextlib.AsyncExitStack() as stack:
+            for client in clients:
+                await stack.enter_async_context(client)
+            if warmup_connections is not None:
+                await asyncio.gather(
+                    *(
+                        client.warmup(
+                            warmup_connections, keepalive_interval=keepalive_interval
+                        )
+                        for client in clients
+                    )
+                )
+            yield
+
+    return lifespan
+
+
+# Characters not allowed in cookie names, per RFC 6265
+_STATE_COOKIE_NAME_INVALID_CHARACTERS = re.compile(r"[^A-Za-z0-9!#$%&'*+\-.^_`|~]")
+
+
+def get_oauth2_router(
+    client: BaseOAuth2[Any],
+    on_login: OAuth2LoginHandler,
+    *,
+    redirect_url: str | None = None,
+    scopes: list[str] | None = None,
+    store_token: OAuth2TokenStore | None = None,
+    fetch_id_email: bool = False,
+    concurrent: bool = True,
+    state_cookie_name: str | None = None,
+    state_cookie_max_age: int = 600,
+    state_cookie_secure: bool = True,
+) -> APIRouter:
+    """
+    Generates a router handling the whole OAuth2 login flow for a client.
+
+    It provides two routes:
+
+    * `GET /authorize`: redirects the user to the authorization URL, with a random `state` stored in a cookie.
+    * `GET /callback`: checks the `state`, exchanges the authorization code for an access token and calls `on_login`.
+
+    The pooled HTTPX client of the OAuth2 client is opened on application startup
+    and closed on shutdown, through the router lifespan.
+
+    Args:
+        client: An [OAuth2][httpx_oauth.oauth2.BaseOAuth2] client.
+        on_login: Async callable called after a successful login.
+            Its return value is used as the response of the callback route.
+        redirect_url: Full URL to the callback route.
+            If not provided, it's resolved from the callback route.
+        scopes: The scopes to be requested.
+            If not provided, `base_scopes` of the client will be used.
+        store_token: Optional async callable persisting the access token.
+        fetch_id_email: Whether to fetch the id and email of the user
+            and pass them to `on_login`.
+        concurrent: Whether to fetch the id and email concurrently with `store_token`.
+        state_cookie_name: Name of the cookie storing the `state`.
+            Defaults to `oauth2_state_` followed by the name of the client,
+            so routers of several clients don't overwrite each other's cookie.
+        state_cookie_max_age: Lifetime of the `state` cookie, in seconds.
+        state_cookie_secure: Whether the `state` cookie should only be sent over HTTPS.
+
+    Returns:
+        The router, to be included in your application.
+
+    Examples:
+        ```py
+        from fastapi import FastAPI
+        from httpx_oauth.clients.google import GoogleOAuth2
+        from httpx_oauth.integrations.fastapi import get_oauth2_router
+
+        client = GoogleOAuth2("CLIENT_ID", "CLIENT_SECRET")
+
+        async def on_login(request, token, id_email):
+            user_id, user_email = id_email
+            return {"user_id": user_id}
+
+        app = FastAPI()
+        app.include_router(
+            get_oauth2_router(client, on_login, fetch_id_email=True),
+            prefix="/auth/google",
+        )
+        ```
+    """
+    if state_cookie_name is None:
+        state_cookie_name = _STATE_COOKIE_NAME_INVALID_CHARACTERS.sub(
+            "_", f"oauth2_state_{client.name}"
+        )
+    callback_route_name = f"oauth2:{client.name}.callback"
+    oauth2_authorize_callback = OAuth2AuthorizeCallback(
+        client,
+        route_name=callback_route_name if redirect_url is None else None,
+        redirect_url=redirect_url,
+    )
+    router = APIRouter(lifespan=get_oauth2_lifespan(client))
+
+    @router.get("/authorize", name=f"oauth2:{client.name}.authorize")
+    async def authorize(request: Request) -> RedirectResponse:
+        state = secrets.token_urlsafe()
+        authorization_url = await client.get_authorization_url(
+            oauth2_authorize_callback.get_redirect_url(request), state, scopes
+        )
+        response = RedirectResponse(authorization_url)
+        response.set_cookie(
+            state_cookie_name,
+            state,
+            max_age=state_cookie_max_age,
+            secure=state_cookie_secure,
+            httponly=True,
+            samesite="lax",
+        )
+        return response
+
+    @router.get("/callback", name=callback_route_name)
+    async def callback(
+        request: Request,
+        response: Response,
+        code: str | None = None,
+        state: str | None = None,
+        error: str | None = None,
+    ) -> Any:
+        if code is not None and error is None:
+            expected_state = request.cookies.get(state_cookie_name)
+            if (
+                state is None
+                or expected_state is None
+                or not secrets.compare_digest(state, expected_state)
+            ):
+                raise OAuth2AuthorizeCallbackError(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid state"
+                )
+
+        token, _ = await oauth2_authorize_callback(request, code, None, state, error)
+
+        calls: list[Callable[[], Awaitable[Any]]] = []
+        if store_token is not None:
+            calls.append(functools.partial(store_token, token))
+        if fetch_id_email:
+            calls.append(functools.partial(client.get_id_email, token["access_token"]))
+
+        try:
+            if concurrent:
+                results = await asyncio.gather(
+                    *(call() for call in calls), return_exceptions=True
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+            else:
+                results = []
+                for call in calls:
+                    results.append(await call())
+        except GetIdEmailError as e:
+            raise OAuth2AuthorizeCallbackError(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=e.message,
+                response=e.response,
+            ) from e
+
+        id_email = cast(tuple[str, str | None], results[-1]) if fetch_id_email else None
+        login_response = await on_login(request, token, id_email)
+
+        if isinstance(login_response, Response):
+            login_response.delete_cookie(state_cookie_name)
+        else:
+            response.delete_cookie(state_cookie_name)
+        return login_response
+
+    return router
+
+
+class OAuth2BearerTokenError(HTTPException, OAuth2Error):
+    """
+    Error raised when the bearer token of a request is missing or invalid.
+
+    It inherits from [HTTPException][fastapi.HTTPException], so you can either keep
+    the default FastAPI error handling or implement a
+    [dedicated exception handler](https://fastapi.tiangolo.com/tutorial/handling-errors/#install-custom-exception-handlers).
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        detail: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        super().__init__(status_code, detail, headers)
+
+
+class InvalidBearerTokenError(OAuth2Error):
+    """Error raised by a bearer token validator when the token is not valid."""
+
+
+BearerTokenValidator = Callable[[str], Awaitable[dict[str, Any]]]
+"""
+Async callable validating a bearer token and returning its claims.
+
+It should raise [InvalidBearerTokenError][httpx_oauth.integrations.fastapi.InvalidBearerTokenError]
+if the token is not valid.
+"""
+
+
+class JWTBearerTokenValidator:
+    """
+    Validates JWT bearer tokens locally, using the keys published
+    by the provider in its [JSON Web Key Set](https://datatracker.ietf.org/doc/html/rfc7517).
+
+    !!! info "Requires PyJWT"
+        This validator requires [PyJWT](https://pyjwt.readthedocs.io/) with its cryptographic dependencies.
+        You can install it with `pip install "httpx-oauth[jwt]"`.
+
+    Examples:
+        ```py
+        validator = JWTBearerTokenValidator(
+            client,
+            "https://example.fief.dev/.well-known/jwks.json",
+            issuer="https://example.fief.dev",
+            audience="CLIENT_ID",
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        client: BaseOAuth2[Any],
+        jwks_uri: str,
+        *,
+        audience: str | list[str],
+        issuer: str | None = None,
+        algorithms: list[str] | None = None,
+        leeway: float = 0,
+        jwks_cache: JWKSCache | None = None,
+    ) -> None:
+        """
+        Args:
+            client: An [OAuth2][httpx_oauth.oauth2.BaseOAuth2] client, whose HTTPX client is used to fetch the key set.
+            jwks_uri: The URI of the key set.
+            audience: The expected audience of the tokens, typically your client ID.
+                It's required: otherwise, tokens issued by the provider
+                to any other client would be accepted.
+            issuer: The expected issuer of the tokens. If not set, it's not checked.
+            algorithms: The allowed signing algorithms. Defaults to `RS256`.
+            leeway: Leeway when checking the expiration time, in seconds.
+            jwks_cache: The key set cache. Defaults to the process-wide cache.
+        """
+        try:
+            import jwt
+        except ImportError as e:  # pragma: no cover
+            message = (
+                "JWTBearerTokenValidator requires PyJWT. "
+                'Install it with `pip install "httpx-oauth[jwt]"`.'
+            )
+            raise ImportError(message) from e
+
+        self._jwt = jwt
+        self.client = client
+        self.jwks_uri = jwks_uri
+        self.issuer = issuer
+        self.audience = audience
+        self.algorithms = algorithms if algorithms is not None else ["RS256"]
+        self.leeway = leeway
+        self.jwks_cache = jwks_cache if jwks_cache is not None else default_jwks_cache
+
+    async def __call__(self, token: str) -> dict[str, Any]:
+        jwt = self._jwt
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.InvalidTokenError as e:
+            raise InvalidBearerTokenError(str(e)) from e
+
+        try:
+            jwk = await self.jwks_cache.get_key(
+                self.jwks_uri, header.get("kid"), self.client.get_httpx_client
+            )
+        except JWKNotFoundError as e:
+            raise InvalidBearerTokenError(e.message) from e
+
+        try:
+            return cast(
+                dict[str, Any],
+                jwt.decode(
+                    token,
+                    jwt.PyJWK(jwk).key,
+                    algorithms=self.algorithms,
+                    audience=self.audience,
+                    issuer=self.issuer,
+                    leeway=self.leeway,
+                ),
+            )
+        except (jwt.InvalidTokenError, jwt.PyJWKError) as e:
+            raise InvalidBearerTokenError(str(e)) from e
+
+
+class IntrospectionBearerTokenValidator:
+    """
+    Validates bearer tokens with the [token introspection](https://datatracker.ietf.org/doc/html/rfc7662)
+    endpoint of the provider.
+
+    Examples:
+        ```py
+        validator = IntrospectionBearerTokenValidator(client)
+        ```
+    """
+
+    def __init__(self, client: BaseOAuth2[Any]) -> None:
+        """
+        Args:
+            client: An [OAuth2][httpx_oauth.oauth2.BaseOAuth2] client, with an introspection endpoint.
+        """
+        self.client = client
+
+    async def __call__(self, token: str) -> dict[str, Any]:
+        introspection = await self.client.introspect_token(token, "access_token")
+        if not introspection.get("active", False):
+            message = "Inactive token"
+            raise InvalidBearerTokenError(message)
+        return introspection
+
+
+BEARER_TOKEN_CACHE_MAXSIZE = 10_000
+
+_http_bearer = HTTPBearer(auto_error=False)
+_http_bearer_dependency = Depends(_http_bearer)
+
+
+class OAuth2BearerToken:
+    """
+    Dependency callable validating the bearer token of the request.
+    It returns the claims of the token.
+
+    Validation results are cached: valid tokens until they expire,
+    within the limit of `max_cache_ttl`, and invalid ones for `negative_cache_ttl`.
+    In steady state, a request is thus authorized without any network call
+    or signature check.
+
+    Examples:
+        ```py
+        from fastapi import FastAPI, Depends
+        from httpx_oauth.integrations.fastapi import IntrospectionBearerTokenValidator, OAuth2BearerToken
+
+        oauth2_bearer_token = OAuth2BearerToken(IntrospectionBearerTokenValidator(client))
+        app = FastAPI()
+
+        @app.get("/protected")
+        async def protected(claims=Depends(oauth2_bearer_token)):
+            return {"sub": claims["sub"]}
+        ```
+    """
+
+    def __init__(
+        self,
+        validator: BearerTokenValidator,
+        *,
+        max_cache_ttl: float = 300,
+        negative_cache_ttl: float = 30,
+        cache_maxsize: int = BEARER_TOKEN_CACHE_MAXSIZE,
+    ) -> None:
+        """
+        Args:
+            validator: The bearer token validator, like
+                [JWTBearerTokenValidator][httpx_oauth.integrations.fastapi.JWTBearerTokenValidator] or
+                [IntrospectionBearerTokenValidator][httpx_oauth.integrations.fastapi.IntrospectionBearerTokenValidator].
+            max_cache_ttl: Maximum time a valid token is cached, in seconds.
+                Set it to `0` to disable caching.
+            negative_cache_ttl: Time an invalid token is cached, in seconds.
+                Set it to `0` to disable caching.
+            cache_maxsize: Maximum number of tokens kept in each cache.
+        """
+        self.validator = validator
+        self.max_cache_ttl = max_cache_ttl
+        self.negative_cache_ttl = negative_cache_ttl
+        self._valid_tokens: TTLCache[bytes, dict[str, Any]] = TTLCache(cache_maxsize)
+        self._invalid_tokens: TTLCache[bytes, bool] = TTLCache(cache_maxsize)
+
+    async def __call__(
+        self,
+        credentials: HTTPAuthorizationCredentials | None = _http_bearer_dependency,
+    ) -> dict[str, Any]:
+        if credentials is None:
+            raise OAuth2BearerTokenError(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Not authenticated",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        token = credentials.credentials
+        key = hash_token(token)
+
+        claims = self._valid_tokens.get(key)
+        if claims is not None:
+            return dict(claims)
+
+        if self._invalid_tokens.get(key) is None:
+            try:
+                claims = await self.validator(token)
+            except InvalidBearerTokenError:
+                self._invalid_tokens.set(key, True, self.negative_cache_ttl)
+            except (OAuth2RequestError, JWKSError) as e:
+                raise OAuth2BearerTokenError(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail=e.message,
+                ) from e
+            else:
+                ttl = self.max_cache_ttl
+                expires_at = claims.get("exp")
+                if expires_at is not None:
+                    ttl = min(ttl, expires_at - time.time())
+                self._valid_tokens.set(key, claims, ttl)
+                return dict(claims)
+
+        raise OAuth2BearerTokenError(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token",
+            headers={"WWW-Authenticate": 'Bearer error="invalid_token"'},
+        )
@@ -0,0 +1,172 @@
+import time
+from typing import Any
+
+import httpx
+
+from httpx_oauth._cache import LRUCache, SingleFlight
+from httpx_oauth.exceptions import HTTPXOAuthError
+from httpx_oauth.oauth2 import HTTPXClientFactory, JSONCodec, default_json_codec
+
+JWKS_CACHE_TTL = 3600
+JWKS_CACHE_MAX_STALE = 86400
+JWKS_CACHE_MAXSIZE = 128
+JWKS_MIN_REFRESH_INTERVAL = 60
+
+
+class JWKSError(HTTPXOAuthError):
+    """Error raised when a JSON Web Key Set can't be retrieved."""
+
+    def __init__(self, message: str, response: httpx.Response | None = None) -> None:
+        self.response = response
+        super().__init__(message)
+
+
+class JWKNotFoundError(HTTPXOAuthError):
+    """Error raised when no key matches the requested key ID in the key set."""
+
+    def __init__(self, kid: str | None) -> None:
+        super().__init__(f"No key found for kid {kid}.")
+
+
+class JWKSCache:
+    """
+    Cache of [JSON Web Key Sets](https://datatracker.ietf.org/doc/html/rfc7517#section-5),
+    keyed by their URI.
+
+    A key set is fresh for `ttl` seconds. After that, the cached key set
+    is still used, while a new one is fetched in the background.
+    If it's older than `ttl + max_stale` seconds, the caller waits for the new one.
+    When a key ID is not found in the cached key set,
+    it's fetched again to pick up rotated keys, at most once every `min_refresh_interval` seconds.
+
+    Concurrent fetches of the same key set are coalesced into a single request.
+    The same cache can be shared by several clients and issuers.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = JWKS_CACHE_TTL,
+        max_stale: float = JWKS_CACHE_MAX_STALE,
+        maxsize: int = JWKS_CACHE_MAXSIZE,
+        min_refresh_interval: float = JWKS_MIN_REFRESH_INTERVAL,
+        json_codec: JSONCodec = default_json_codec,
+    ) -> None:
+        """
+        Args:
+            ttl: How long a key set is considered fresh, in seconds.
+            max_stale: How long a key set can be used
+                while it's refreshed in the background once stale, in seconds.
+            maxsize: Maximum number of key sets kept in the cache.
+            min_refresh_interval: Minimum delay between two fetches of the same key set
+                when looking for an unknown key ID, in seconds.
+            json_codec: The JSON codec decoding the key sets.
+                Defaults to the [process-wide one][httpx_oauth.oauth2.default_json_codec].
+        """
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.min_refresh_interval = min_refresh_interval
+        self.json_codec = json_codec
+        self._key_sets: LRUCache[str, tuple[float, list[dict[str, Any]]]] = LRUCache(
+            maxsize
+        )
+        self._fetches: SingleFlight[str, list[dict[str, Any]]] = SingleFlight()
+
+    async def get_key(
+        self, jwks_uri: str, kid: str | None, get_httpx_client: HTTPXClientFactory
+    ) -> dict[str, Any]:
+        """
+        Returns the JSON Web Key matching a key ID.
+
+        Args:
+            jwks_uri: The URI of the key set.
+            kid: The key ID. If `None`, the key set should contain a single key.
+            get_httpx_client: Returns an async context manager yielding the HTTPX client
+                used to fetch the key set. It's also used by background refreshes,
+                so it should still be usable after the call.
+
+        Returns:
+            The JSON Web Key, as a dictionary.
+
+        Raises:
+            JWKSError: An error occurred while fetching the key set.
+            JWKNotFoundError: No key matches the key ID.
+        """
+        entry = self._key_sets.get(jwks_uri)
+        if entry is not None:
+            fetched_at, keys = entry
+            age = time.monotonic() - fetched_at
+            if age < self.ttl + self.max_stale:
+                if age >= self.ttl:
+                    self._fetches.start(
+                        jwks_uri, lambda: self._fetch(jwks_uri, get_httpx_client)
+                    )
+                key = self._find_key(keys, kid)
+                if key is not None:
+                    return key
+                if age < self.min_refresh_interval:
+                    raise JWKNotFoundError(kid)
+
+        keys = await self.fetch(jwks_uri, get_httpx_client)
+        key = self._find_key(keys, kid)
+        if key is None:
+            raise JWKNotFoundError(kid)
+        return key
+
+    async def fetch(
+        self, jwks_uri: str, get_httpx_client: HTTPXClientFactory
+    ) -> list[dict[str, Any]]:
+        """
+        Fetches a key set and stores it in the cache.
+
+        If a fetch of the same key set is already in flight, its result is shared.
+
+        Args:
+            jwks_uri: The URI of the key set.
+            get_httpx_client: Returns an async context manager yielding the HTTPX client
+                used to fetch the key set.
+
+        Returns:
+            The list of JSON Web Keys.
+
+        Raises:
+            JWKSError: An error occurred while fetching the key set.
+        """
+        return await self._fetches.do(
+            jwks_uri, lambda: self._fetch(jwks_uri, get_httpx_client)
+        )
+
+    def clear(self) -> None:
+        """Empties the cache."""
+        self._key_sets.clear()
+
+    async def _fetch(
+        self, jwks_uri: str, get_httpx_client: HTTPXClientFactory
+    ) -> list[dict[str, Any]]:
+        async with get_httpx_client() as client:
+            try:
+                response = await client.get(jwks_uri)
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                raise JWKSError(str(e), e.response) from e
+            except httpx.HTTPError as e:
+                raise JWKSError(str(e)) from e
+
+        try:
+            keys: list[dict[str, Any]] = self.json_codec.loads(response.content)["keys"]
+        except (ValueError, KeyError, TypeError) as e:
+            message = "Invalid JSON Web Key Set"
+            raise JWKSError(message, response) from e
+
+        self._key_sets.set(jwks_uri, (time.monotonic(), keys))
+        return keys
+
+    @staticmethod
+    def _find_key(keys: list[dict[str, Any]], kid: str | None) -> dict[str, Any] | None:
+        if kid is None:
+            return keys[0] if len(keys) == 1 else None
+        return next((key for key in keys if key.get("kid") == kid), None)
+
+
+default_jwks_cache = JWKSCache()
+"""Process-wide JSON Web Key Set cache, used when no cache is explicitly provided."""
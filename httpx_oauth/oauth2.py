@@ -1,11 +1,19 @@
+import base64
+import collections
 import contextlib
+import copy
+import itertools
 import json
+import math
 import time
-from collections.abc import Mapping
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping
+from types import TracebackType
 from typing import (
+    TYPE_CHECKING,
     Any,
     Generic,
     Literal,
+    NamedTuple,
     TypeVar,
     cast,
     get_args,
@@ -14,7 +22,79 @@ from urllib.parse import urlencode
 
 import httpx
 
-from httpx_oauth.exceptions import HTTPXOAuthError
+from httpx_oauth._cache import LRUCache, SingleFlight, TTLCache, hash_token
+from httpx_oauth.exceptions import GetIdEmailError, GetProfileError, HTTPXOAuthError
+from httpx_oauth.tls import SharedSSLContext, default_ssl_context
+
+if TYPE_CHECKING:  # pragma: no cover
+    import asyncio
+
+    from httpx_oauth.dns import DNSCache
+
+INTROSPECTION_CACHE_TTL = 60
+INTROSPECTION_CACHE_MAXSIZE = 10_000
+CLIENT_CREDENTIALS_RENEW_MARGIN = 60
+CLIENT_CREDENTIALS_CACHE_MAXSIZE = 128
+CONDITIONAL_REQUESTS_CACHE_MAXSIZE = 1024
+REJECTED_TOKENS_CACHE_MAXSIZE = 10_000
+WARMUP_CONNECTIONS = 1
+HEDGING_PERCENTILE = 95
+HEDGING_MIN_DELAY = 0.01
+HEDGING_MAX_DELAY = 1.0
+HEDGING_WINDOW = 100
+HEDGING_MIN_SAMPLES = 10
+
+JSONLoads = Callable[[bytes], Any]
+"""
+Callable decoding a JSON document, like `json.loads` or `orjson.loads`.
+It should raise a `ValueError` when the document is invalid.
+"""
+
+JSONDumps = Callable[[Any], str | bytes]
+"""Callable encoding an object to a JSON document, like `json.dumps` or `orjson.dumps`."""
+
+
+class JSONCodec:
+    """
+    JSON implementation used by the clients to decode response bodies
+    and to encode JSON request parameters.
+
+    Examples:
+        ```py
+        import orjson
+
+        from httpx_oauth.oauth2 import JSONCodec
+
+        client.json_codec = JSONCodec(orjson.loads, orjson.dumps)
+        ```
+    """
+
+    def __init__(
+        self, loads: JSONLoads = json.loads, dumps: JSONDumps = json.dumps
+    ) -> None:
+        """
+        Args:
+            loads: Callable decoding a JSON document.
+            dumps: Callable encoding an object to a JSON document.
+        """
+        self.loads = loads
+        self.dumps = dumps
+
+    def encode(self, obj: Any) -> str:
+        """
+        Encodes an object to a JSON string, whether `dumps` returns `str` or `bytes`.
+        """
+        encoded = self.dumps(obj)
+        if isinstance(encoded, bytes):
+            return encoded.decode("utf-8")
+        return encoded
+
+
+default_json_codec = JSONCodec()
+"""
+Process-wide JSON codec, used by clients when no codec is explicitly set.
+Changing its `loads` and `dumps` affects every client using it.
+"""
 
 
 class OAuth2Error(HTTPXOAuthError):
@@ -57,15 +137,153 @@ class RevokeTokenNotSupportedError(OAuth2Error):
         super().__init__("Revoke token is not supported by this provider.")
 
 
+class IntrospectTokenNotSupportedError(OAuth2Error):
+    """
+    Error raised when trying to introspect a token
+    on a provider that does not support it.
+    """
+
+    def __init__(self) -> None:
+        super().__init__("Token introspection is not supported by this provider.")
+
+
+OAuth2ErrorCode = Literal[
+    "invalid_request",
+    "invalid_client",
+    "invalid_grant",
+    "unauthorized_client",
+    "unsupported_grant_type",
+    "unsupported_response_type",
+    "invalid_scope",
+    "access_denied",
+    "server_error",
+    "temporarily_unavailable",
+    "invalid_token",
+    "insufficient_scope",
+    "unsupported_token_type",
+    "authorization_pending",
+    "slow_down",
+    "expired_token",
+]
+"""
+Standard OAuth2 error codes, from [RFC 6749](https://datatracker.ietf.org/doc/html/rfc6749#section-5.2),
+[RFC 6750](https://datatracker.ietf.org/doc/html/rfc6750#section-3.1),
+[RFC 7009](https://datatracker.ietf.org/doc/html/rfc7009#section-2.2.1)
+and [RFC 8628](https://datatracker.ietf.org/doc/html/rfc8628#section-3.5).
+"""
+
+RETRYABLE_ERROR_CODES: frozenset[str] = frozenset(
+    {"server_error", "temporarily_unavailable", "slow_down"}
+)
+"""Error codes of requests that may succeed if retried later."""
+
+
+class OAuth2ErrorResponse(NamedTuple):
+    """
+    Error returned by the provider, as described in
+    [RFC 6749](https://datatracker.ietf.org/doc/html/rfc6749#section-5.2).
+    """
+
+    error: OAuth2ErrorCode | str
+    error_description: str | None = None
+    error_uri: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "OAuth2ErrorResponse | None":
+        """
+        Parses an error from a decoded response body.
+
+        Returns:
+            The error, or `None` if the body doesn't contain a valid `error` code.
+        """
+        error = data.get("error")
+        if not isinstance(error, str):
+            return None
+        error_description = data.get("error_description")
+        error_uri = data.get("error_uri")
+        return cls(
+            error,
+            error_description if isinstance(error_description, str) else None,
+            error_uri if isinstance(error_uri, str) else None,
+        )
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> "OAuth2ErrorResponse | None":
+        """
+        Parses an error from a response.
+
+        Returns:
+            The error, or `None` if the response doesn't contain a valid error body.
+        """
+        try:
+            data = default_json_codec.loads(response.content)
+        except ValueError:
+            return None
+        if not isinstance(data, dict):
+            return None
+        return cls.from_dict(data)
+
+
 class OAuth2RequestError(OAuth2Error):
     """
     Base exception class for OAuth2 request errors.
+
+    The error returned by the provider, if any, is available in
+    [error_response][httpx_oauth.oauth2.OAuth2RequestError.error_response].
+    It's parsed from the response body on first access only.
     """
 
-    def __init__(self, message: str, response: httpx.Response | None = None) -> None:
+    def __init__(
+        self,
+        message: str,
+        response: httpx.Response | None = None,
+        *,
+        error_response: OAuth2ErrorResponse | None = None,
+    ) -> None:
         self.response = response
+        self._error_response = error_response
+        self._error_response_parsed = error_response is not None
         super().__init__(message)
 
+    @property
+    def error_response(self) -> OAuth2ErrorResponse | None:
+        """The error returned by the provider, if any."""
+        if not self._error_response_parsed:
+            self._error_response_parsed = True
+            if self.response is not None:
+                self._error_response = OAuth2ErrorResponse.from_response(self.response)
+        return self._error_response
+
+    @property
+    def error(self) -> OAuth2ErrorCode | str | None:
+        """The error code returned by the provider, if any."""
+        error_response = self.error_response
+        return error_response.error if error_response is not None else None
+
+    @property
+    def is_retryable(self) -> bool:
+        """
+        Whether the request may succeed if retried later:
+        the provider couldn't be reached, had a server error or is rate limiting.
+        """
+        error = self.error
+        if error is not None:
+            return error in RETRYABLE_ERROR_CODES
+        if self.response is None:
+            return True
+        return (
+            self.response.status_code >= 500
+            or self.response.status_code == httpx.codes.TOO_MANY_REQUESTS
+        )
+
+    @property
+    def requires_reauthorization(self) -> bool:
+        """
+        Whether the authorization code or the refresh token is invalid,
+        expired or revoked, so the user needs to authorize the application again.
+        """
+        return self.error == "invalid_grant"
+
 
 class GetAccessTokenError(OAuth2RequestError):
     """Error raised when an error occurs while getting an access token."""
@@ -79,6 +297,10 @@ class RevokeTokenError(OAuth2RequestError):
     """Error raised when an error occurs while revoking a token."""
 
 
+class IntrospectTokenError(OAuth2RequestError):
+    """Error raised when an error occurs while introspecting a token."""
+
+
 OAuth2ClientAuthMethod = Literal["client_secret_basic", "client_secret_post"]
 """Supported OAuth2 client authentication methods."""
 
@@ -88,6 +310,12 @@ def _check_valid_auth_method(auth_method: str) -> None:
         raise NotSupportedAuthMethodError(auth_method)
 
 
+def _is_invalid_client(error: OAuth2RequestError) -> bool:
+    if error.response is not None and error.response.status_code == 401:
+        return True
+    return error.error == "invalid_client"
+
+
 class OAuth2Token(dict[str, Any]):
     """
     Wrapper around a standard `Dict[str, Any]` that bears the response
@@ -121,7 +349,209 @@ class OAuth2Token(dict[str, Any]):
         return time.time() > self["expires_at"]
 
 
+class ClientCredentials:
+    """
+    Client ID and secret, with the authentication material derived from them,
+    computed once instead of on every request.
+
+    Its attributes should not be modified: assign new credentials
+    to the client instead.
+    """
+
+    __slots__ = ("basic_authorization", "client_id", "client_secret", "form")
+
+    def __init__(self, client_id: str, client_secret: str) -> None:
+        self.client_id = client_id
+        self.client_secret = client_secret
+        userpass = f"{client_id}:{client_secret}".encode()
+        self.basic_authorization = f"Basic {base64.b64encode(userpass).decode()}"
+        self.form = {"client_id": client_id, "client_secret": client_secret}
+
+
+class IdEmailResult(NamedTuple):
+    """
+    Result of [get_id_emails][httpx_oauth.oauth2.BaseOAuth2.get_id_emails]
+    for a single token.
+    """
+
+    token: str
+    """The access token."""
+    id_email: tuple[str, str | None] | None
+    """The id and the email of the user, or `None` if an error occurred."""
+    error: Exception | None = None
+    """The error raised while getting the id and email, if any."""
+
+
+class HedgingPolicy:
+    """
+    Policy for hedged profile requests.
+
+    When a request takes longer than the `percentile` of the latencies
+    of the last `window` successful requests, a second identical request is sent,
+    and the first successful response wins.
+    Until `min_samples` latencies are known, the delay is `max_delay`.
+
+    Examples:
+        ```py
+        from httpx_oauth.oauth2 import HedgingPolicy
+
+        client.hedging_policy = HedgingPolicy(percentile=90, max_delay=0.5)
+        ```
+    """
+
+    def __init__(
+        self,
+        percentile: float = HEDGING_PERCENTILE,
+        *,
+        min_delay: float = HEDGING_MIN_DELAY,
+        max_delay: float = HEDGING_MAX_DELAY,
+        window: int = HEDGING_WINDOW,
+        min_samples: int = HEDGING_MIN_SAMPLES,
+    ) -> None:
+        """
+        Args:
+            percentile: Percentile of the recent latencies
+                after which the second request is sent, between 0 and 100.
+            min_delay: Minimum delay before the second request, in seconds.
+            max_delay: Maximum delay before the second request, in seconds.
+            window: Number of recent latencies taken into account.
+            min_samples: Number of latencies needed before using the percentile.
+        """
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self._latencies: collections.deque[float] = collections.deque(maxlen=window)
+
+    @property
+    def delay(self) -> float:
+        """Current delay before the second request, in seconds."""
+        if len(self._latencies) < self.min_samples:
+            return self.max_delay
+        latencies = sorted(self._latencies)
+        rank = math.ceil(self.percentile / 100 * len(latencies))
+        delay = latencies[max(rank, 1) - 1]
+        return min(max(delay, self.min_delay), self.max_delay)
+
+    def record(self, latency: float) -> None:
+        """
+        Records the latency of a successful request.
+
+        Args:
+            latency: The latency, in seconds.
+        """
+        self._latencies.append(latency)
+
+
+class _RateLimiter:
+    """Spaces out calls so they don't start more often than `rate` times per second."""
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1 / rate
+        self._next_at = 0.0
+
+    async def wait(self) -> None:
+        import asyncio
+
+        now = time.monotonic()
+        start_at = max(now, self._next_at)
+        self._next_at = start_at + self.interval
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+
+
+class _ClientCredentialsHolder:
+    """
+    Holds the current client credentials, and the previous ones
+    during a rotation overlap, so they can be shared between clients.
+    """
+
+    def __init__(self, credentials: ClientCredentials) -> None:
+        self.current = credentials
+        self.previous: tuple[ClientCredentials, float] | None = None
+
+    def get_previous(self) -> ClientCredentials | None:
+        if self.previous is None:
+            return None
+        credentials, expires_at = self.previous
+        if expires_at <= time.monotonic():
+            self.previous = None
+            return None
+        return credentials
+
+
+HTTPXClientFactory = Callable[
+    [], contextlib.AbstractAsyncContextManager[httpx.AsyncClient]
+]
+"""
+Callable returning an async context manager yielding an HTTPX client,
+like [get_httpx_client][httpx_oauth.oauth2.BaseOAuth2.get_httpx_client].
+"""
+
+
+class HTTPXClientPool:
+    """
+    Holds a pooled HTTPX client, which can be shared between clients
+    so they reuse the same connections.
+
+    Every client has its own pool by default. Registries share theirs
+    with the clients they create.
+
+    Examples:
+        ```py
+        from httpx_oauth.oauth2 import HTTPXClientPool
+
+        pool = HTTPXClientPool()
+        google_client.pool = pool
+        github_client.pool = pool
+
+        async with google_client:
+            # github_client uses the same pooled HTTPX client
+            ...
+        ```
+    """
+
+    def __init__(self) -> None:
+        self.client: httpx.AsyncClient | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the pooled HTTPX client is currently open."""
+        return self.client is not None
+
+    def open(self, create_httpx_client: Callable[[], httpx.AsyncClient]) -> None:
+        """
+        Opens the pooled HTTPX client, if it's not open yet.
+
+        Args:
+            create_httpx_client: Creates the HTTPX client.
+        """
+        if self.client is None:
+            self.client = create_httpx_client()
+
+    async def aclose(self) -> None:
+        """Closes the pooled HTTPX client, if it's open."""
+        if self.client is not None:
+            httpx_client, self.client = self.client, None
+            await httpx_client.aclose()
+
+    def get_httpx_client(
+        self, create_httpx_client: Callable[[], httpx.AsyncClient]
+    ) -> contextlib.AbstractAsyncContextManager[httpx.AsyncClient]:
+        """
+        Returns the pooled HTTPX client if it's open,
+        or a new HTTPX client closed on exit otherwise.
+
+        Args:
+            create_httpx_client: Creates the HTTPX client, if the pool is not open.
+        """
+        if self.client is not None:
+            return contextlib.nullcontext(self.client)
+        return create_httpx_client()
+
+
 T = TypeVar("T")
+OAuth2ClientT = TypeVar("OAuth2ClientT", bound="BaseOAuth2[Any]")
 
 
 class BaseOAuth2(Generic[T]):
@@ -132,16 +562,25 @@ class BaseOAuth2(Generic[T]):
     """
 
     name: str
-    client_id: str
-    client_secret: str
     authorize_endpoint: str
     access_token_endpoint: str
     refresh_token_endpoint: str | None
     revoke_token_endpoint: str | None
+    introspection_endpoint: str | None
     base_scopes: list[str] | None
     token_endpoint_auth_method: OAuth2ClientAuthMethod
     revocation_endpoint_auth_method: OAuth2ClientAuthMethod | None
+    introspection_endpoint_auth_method: OAuth2ClientAuthMethod | None
+    introspection_cache_ttl: float
+    client_credentials_renew_margin: float
+    conditional_profile_requests: bool
+    rejected_tokens_cache_ttl: float
+    coalesce_profile_requests: bool
+    hedging_policy: HedgingPolicy | None
     request_headers: dict[str, str]
+    json_codec: JSONCodec
+    ssl_context: SharedSSLContext
+    dns_cache: "DNSCache | None"
 
     def __init__(
         self,
@@ -156,6 +595,8 @@ class BaseOAuth2(Generic[T]):
         base_scopes: list[str] | None = None,
         token_endpoint_auth_method: OAuth2ClientAuthMethod = "client_secret_post",
         revocation_endpoint_auth_method: OAuth2ClientAuthMethod | None = None,
+        introspection_endpoint: str | None = None,
+        introspection_endpoint_auth_method: OAuth2ClientAuthMethod | None = None,
     ):
         """
         Args:
@@ -172,6 +613,10 @@ class BaseOAuth2(Generic[T]):
             token_endpoint_auth_method: The authentication method to be used in the token endpoint.
             revocation_endpoint_auth_method: The authentication method to be used in the revocation endpoint.
                 If the revocation endpoint is not supported, set it to `None`.
+            introspection_endpoint: The [token introspection](https://datatracker.ietf.org/doc/html/rfc7662) endpoint URL.
+                If not supported, set it to `None`.
+            introspection_endpoint_auth_method: The authentication method to be used in the introspection endpoint.
+                If not set, `token_endpoint_auth_method` is used.
 
         Raises:
             NotSupportedAuthMethodError:
@@ -182,14 +627,17 @@ class BaseOAuth2(Generic[T]):
         _check_valid_auth_method(token_endpoint_auth_method)
         if revocation_endpoint_auth_method is not None:
             _check_valid_auth_method(revocation_endpoint_auth_method)
+        if introspection_endpoint_auth_method is not None:
+            _check_valid_auth_method(introspection_endpoint_auth_method)
         if (
             revoke_token_endpoint is not None
             and revocation_endpoint_auth_method is None
         ):
             raise MissingRevokeTokenAuthMethodError()
 
-        self.client_id = client_id
-        self.client_secret = client_secret
+        self._credentials = _ClientCredentialsHolder(
+            ClientCredentials(client_id, client_secret)
+        )
         self.authorize_endpoint = authorize_endpoint
         self.access_token_endpoint = access_token_endpoint
         self.refresh_token_endpoint = refresh_token_endpoint
@@ -198,10 +646,258 @@ class BaseOAuth2(Generic[T]):
         self.base_scopes = base_scopes
         self.token_endpoint_auth_method = token_endpoint_auth_method
         self.revocation_endpoint_auth_method = revocation_endpoint_auth_method
+        self.introspection_endpoint = introspection_endpoint
+        self.introspection_endpoint_auth_method = introspection_endpoint_auth_method
 
         self.request_headers = {
             "Accept": "application/json",
         }
+        self.json_codec = default_json_codec
+        self.ssl_context = default_ssl_context
+        self.dns_cache = None
+
+        self.introspection_cache_ttl = INTROSPECTION_CACHE_TTL
+        self._introspection_cache: TTLCache[
+            tuple[bytes, str | None], dict[str, Any]
+        ] = TTLCache(INTROSPECTION_CACHE_MAXSIZE)
+        self._introspection_calls: SingleFlight[
+            tuple[bytes, str | None], dict[str, Any]
+        ] = SingleFlight()
+
+        self.client_credentials_renew_margin = CLIENT_CREDENTIALS_RENEW_MARGIN
+        self._client_credentials_tokens: LRUCache[
+            tuple[tuple[str, ...] | None, str | None], OAuth2Token
+        ] = LRUCache(CLIENT_CREDENTIALS_CACHE_MAXSIZE)
+        self._client_credentials_calls: SingleFlight[
+            tuple[tuple[str, ...] | None, str | None], OAuth2Token
+        ] = SingleFlight()
+
+        self.conditional_profile_requests = False
+        self._conditional_requests_cache: LRUCache[
+            bytes, tuple[str | None, str | None, bytes]
+        ] = LRUCache(CONDITIONAL_REQUESTS_CACHE_MAXSIZE)
+
+        self.rejected_tokens_cache_ttl = 0.0
+        self._rejected_tokens: TTLCache[bytes, int] = TTLCache(
+            REJECTED_TOKENS_CACHE_MAXSIZE
+        )
+
+        self.coalesce_profile_requests = True
+        self._profile_calls: SingleFlight[bytes, tuple[httpx.Response, bytes]] = (
+            SingleFlight()
+        )
+
+        self.hedging_policy = None
+
+        self._pool = HTTPXClientPool()
+        self._keepalive_task: asyncio.Task[None] | None = None
+
+    @property
+    def credentials(self) -> ClientCredentials:
+        """
+        The client credentials.
+
+        Assigning new credentials swaps them at once for every request,
+        without closing the pooled HTTPX client or clearing the caches.
+        """
+        return self._credentials.current
+
+    @credentials.setter
+    def credentials(self, credentials: ClientCredentials) -> None:
+        self._credentials.current = credentials
+        self._credentials.previous = None
+
+    @property
+    def client_id(self) -> str:
+        """The client ID provided by the OAuth2 provider."""
+        return self.credentials.client_id
+
+    @client_id.setter
+    def client_id(self, client_id: str) -> None:
+        self.credentials = ClientCredentials(client_id, self.client_secret)
+
+    @property
+    def client_secret(self) -> str:
+        """
+        The client secret provided by the OAuth2 provider.
+
+        Setting it recomputes the client authentication material
+        sent on each token request.
+        """
+        return self.credentials.client_secret
+
+    @client_secret.setter
+    def client_secret(self, client_secret: str) -> None:
+        self.credentials = ClientCredentials(self.client_id, client_secret)
+
+    def rotate_client_secret(self, client_secret: str, *, overlap: float = 0) -> None:
+        """
+        Replaces the client secret, without rebuilding the client.
+
+        During the `overlap`, requests rejected by the provider because of
+        invalid client credentials are retried with the previous secret.
+        It covers the time the new secret takes to be accepted by the provider.
+
+        The rotation applies to every copy of the client,
+        like the ones of a [TenantRegistry][httpx_oauth.tenants.TenantRegistry].
+
+        Args:
+            client_secret: The new client secret.
+            overlap: How long the previous secret can still be tried, in seconds.
+
+        Examples:
+            ```py
+            client.rotate_client_secret("NEW_CLIENT_SECRET", overlap=300)
+            ```
+        """
+        previous = self.credentials
+        self.credentials = ClientCredentials(self.client_id, client_secret)
+        if overlap > 0:
+            self._credentials.previous = (previous, time.monotonic() + overlap)
+
+    async def __aenter__(self: OAuth2ClientT) -> OAuth2ClientT:  # noqa: PYI019
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def open(self) -> None:
+        """
+        Opens a pooled HTTPX client, reused by every request
+        until [aclose][httpx_oauth.oauth2.BaseOAuth2.aclose] is called.
+
+        Without it, each request opens and closes its own HTTPX client,
+        so connections are never reused.
+
+        You can also use the OAuth2 client as an async context manager.
+
+        Examples:
+            ```py
+            async with client:
+                access_token = await client.get_access_token("CODE", "https://www.tintagel.bt/oauth-callback")
+            ```
+        """
+        self._pool.open(self.create_httpx_client)
+
+    async def aclose(self) -> None:
+        """
+        Closes the pooled HTTPX client, if any.
+        """
+        import asyncio
+
+        if self._keepalive_task is not None:
+            task, self._keepalive_task = self._keepalive_task, None
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self._pool.aclose()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether a pooled HTTPX client is currently open."""
+        return self._pool.is_open
+
+    @property
+    def pool(self) -> HTTPXClientPool:
+        """
+        The [pool][httpx_oauth.oauth2.HTTPXClientPool] holding the pooled HTTPX client.
+
+        Assign a pool shared with other clients so they reuse the same connections.
+        """
+        return self._pool
+
+    @pool.setter
+    def pool(self, pool: HTTPXClientPool) -> None:
+        self._pool = pool
+
+    def get_warmup_endpoints(self) -> list[str]:
+        """
+        Returns the endpoints called by the client from the server side,
+        to which [warmup][httpx_oauth.oauth2.BaseOAuth2.warmup] opens connections.
+
+        Provided clients add their profile endpoints to the token endpoints.
+        """
+        endpoints = [
+            self.access_token_endpoint,
+            self.refresh_token_endpoint,
+            self.revoke_token_endpoint,
+            self.introspection_endpoint,
+        ]
+        return [endpoint for endpoint in endpoints if endpoint is not None]
+
+    async def warmup(
+        self,
+        connections: int = WARMUP_CONNECTIONS,
+        *,
+        keepalive_interval: float | None = None,
+    ) -> None:
+        """
+        Opens the pooled HTTPX client, and `connections` connections to each host
+        of the [warmup endpoints][httpx_oauth.oauth2.BaseOAuth2.get_warmup_endpoints],
+        so the first requests don't pay the DNS, TCP and TLS setup.
+
+        Connections are opened with `HEAD` requests, whose responses are ignored.
+        Errors are ignored too: the connections will be opened on first use instead.
+
+        Args:
+            connections: Number of connections to open to each host.
+                It shouldn't exceed the keep-alive limits of the HTTPX client.
+            keepalive_interval: If set, the connections are used again every
+                `keepalive_interval` seconds, until the client is closed,
+                so they're not dropped during idle periods. It should be lower
+                than the `keepalive_expiry` of the HTTPX client, which is 5 seconds by default.
+
+        Examples:
+            ```py
+            await client.warmup(connections=4, keepalive_interval=4)
+            ```
+        """
+        import asyncio
+
+        await self.open()
+        await self._warmup(connections)
+        if keepalive_interval is not None and self._keepalive_task is None:
+            self._keepalive_task = asyncio.create_task(
+                self._keepalive_loop(connections, keepalive_interval)
+            )
+
+    async def _warmup(self, connections: int) -> None:
+        import asyncio
+
+        httpx_client = self._pool.client
+        if httpx_client is None:
+            return
+
+        # Connections are pooled by origin: open them once per origin
+        origins: dict[tuple[bytes, bytes, int | None], str] = {}
+        for endpoint in self.get_warmup_endpoints():
+            url = httpx.URL(endpoint)
+            origins.setdefault((url.raw_scheme, url.raw_host, url.port), endpoint)
+
+        async def _head(url: str) -> None:
+            try:
+                await httpx_client.head(url)
+            except httpx.HTTPError:
+                pass
+
+        await asyncio.gather(
+            *(_head(url) for url in origins.values() for _ in range(connections))
+        )
+
+    async def _keepalive_loop(self, connections: int, interval: float) -> None:
+        import asyncio
+
+        while True:
+            await asyncio.sleep(interval)
+            await self._warmup(connections)
 
     async def get_authorization_url(
         self,
@@ -298,17 +994,18 @@ class BaseOAuth2(Generic[T]):
             if code_verifier:
                 data["code_verifier"] = code_verifier
 
-            request, auth = self.build_request(
+            response = await self.send_authenticated_request(
                 client,
                 "POST",
                 self.access_token_endpoint,
                 auth_method=self.token_endpoint_auth_method,
                 data=data,
-            )
-            response = await self.send_request(
-                client, request, auth, exc_class=GetAccessTokenError
+                exc_class=GetAccessTokenError,
             )
             data = self.get_json(response, exc_class=GetAccessTokenError)
+            data = self.process_token_response(
+                data, response, exc_class=GetAccessTokenError
+            )
             return OAuth2Token(data)
 
     async def refresh_token(self, refresh_token: str) -> OAuth2Token:
@@ -334,7 +1031,7 @@ class BaseOAuth2(Generic[T]):
             raise RefreshTokenNotSupportedError()
 
         async with self.get_httpx_client() as client:
-            request, auth = self.build_request(
+            response = await self.send_authenticated_request(
                 client,
                 "POST",
                 self.refresh_token_endpoint,
@@ -343,13 +1040,105 @@ class BaseOAuth2(Generic[T]):
                     "grant_type": "refresh_token",
                     "refresh_token": refresh_token,
                 },
-            )
-            response = await self.send_request(
-                client, request, auth, exc_class=RefreshTokenError
+                exc_class=RefreshTokenError,
             )
             data = self.get_json(response, exc_class=RefreshTokenError)
+            data = self.process_token_response(
+                data, response, exc_class=RefreshTokenError
+            )
             return OAuth2Token(data)
 
+    async def get_client_credentials_token(
+        self,
+        scope: list[str] | None = None,
+        audience: str | None = None,
+        *,
+        force_refresh: bool = False,
+    ) -> OAuth2Token:
+        """
+        Requests an access token for the application itself, using the
+        [client credentials grant](https://datatracker.ietf.org/doc/html/rfc6749#section-4.4).
+
+        Tokens are cached for each scope and audience, so you can call this method
+        before each API call: a new token is only requested when needed.
+        When a token is about to expire, within `client_credentials_renew_margin` seconds,
+        it's renewed in the background while the current one is still returned.
+        Concurrent requests for the same scope and audience share a single request.
+        Each call returns its own copy of the token.
+
+        Args:
+            scope: The scopes to be requested.
+                If not provided, `base_scopes` will be used.
+            audience: Optional audience of the token, for providers supporting it.
+            force_refresh: Whether to ignore the cached token and request a new one.
+
+        Returns:
+            An access token response dictionary.
+
+        Raises:
+            GetAccessTokenError: An error occurred while getting the access token.
+
+        Examples:
+            ```py
+            access_token = await client.get_client_credentials_token(["SCOPE1", "SCOPE2"])
+            ```
+        """
+        _scope = scope or self.base_scopes
+        key = (tuple(_scope) if _scope is not None else None, audience)
+
+        token = None if force_refresh else self._client_credentials_tokens.get(key)
+        if token is not None:
+            expires_at = token.get("expires_at")
+            if expires_at is None:
+                return OAuth2Token(dict(token))
+            remaining = expires_at - time.time()
+            if remaining > 0:
+                if remaining <= self.client_credentials_renew_margin:
+                    self._client_credentials_calls.start(
+                        key,
+                        lambda: self._request_client_credentials_token(
+                            key, _scope, audience
+                        ),
+                    )
+                return OAuth2Token(dict(token))
+
+        token = await self._client_credentials_calls.do(
+            key, lambda: self._request_client_credentials_token(key, _scope, audience)
+        )
+        return OAuth2Token(dict(token))
+
+    async def _request_client_credentials_token(
+        self,
+        key: tuple[tuple[str, ...] | None, str | None],
+        scope: list[str] | None,
+        audience: str | None,
+    ) -> OAuth2Token:
+        async with self.get_httpx_client() as client:
+            data = {"grant_type": "client_credentials"}
+
+            if scope is not None:
+                data["scope"] = " ".join(scope)
+
+            if audience is not None:
+                data["audience"] = audience
+
+            response = await self.send_authenticated_request(
+                client,
+                "POST",
+                self.access_token_endpoint,
+                auth_method=self.token_endpoint_auth_method,
+                data=data,
+                exc_class=GetAccessTokenError,
+            )
+            data = self.get_json(response, exc_class=GetAccessTokenError)
+            data = self.process_token_response(
+                data, response, exc_class=GetAccessTokenError
+            )
+            token = OAuth2Token(data)
+
+        self._client_credentials_tokens.set(key, token)
+        return token
+
     async def revoke_token(
         self, token: str, token_type_hint: str | None = None
     ) -> None:
@@ -378,17 +1167,132 @@ class BaseOAuth2(Generic[T]):
             if token_type_hint is not None:
                 data["token_type_hint"] = token_type_hint
 
-            request, auth = self.build_request(
+            await self.send_authenticated_request(
                 client,
                 "POST",
                 self.revoke_token_endpoint,
                 auth_method=self.token_endpoint_auth_method,
                 data=data,
+                exc_class=RevokeTokenError,
             )
-            await self.send_request(client, request, auth, exc_class=RevokeTokenError)
 
         return None
 
+    async def introspect_token(
+        self, token: str, token_type_hint: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Requests information about a token,
+        following [RFC 7662](https://datatracker.ietf.org/doc/html/rfc7662).
+
+        Args:
+            token: A token or refresh token to introspect.
+            token_type_hint: Optional hint for the service to help it determine
+                if it's a token or refresh token.
+                Usually either `access_token` or `refresh_token`.
+
+        Returns:
+            The introspection response dictionary.
+            The token is valid only if its `active` property is `True`.
+
+        Raises:
+            IntrospectTokenError: An error occurred while introspecting the token.
+            IntrospectTokenNotSupportedError: The provider does not support token introspection.
+
+        Results are cached for `introspection_cache_ttl` seconds,
+        without exceeding the expiration time of the token, if any.
+        Set `introspection_cache_ttl` to `0` to disable caching.
+        Concurrent introspections of the same token share a single request.
+
+        Examples:
+            ```py
+            introspection = await client.introspect_token("TOKEN")
+            if introspection["active"]:
+                print(introspection.get("scope"))
+            ```
+        """
+        if self.introspection_endpoint is None:
+            raise IntrospectTokenNotSupportedError()
+
+        key = (hash_token(token), token_type_hint)
+        introspection = self._introspection_cache.get(key)
+        if introspection is None:
+            introspection = await self._introspection_calls.do(
+                key, lambda: self._introspect_token(token, token_type_hint)
+            )
+            ttl: float = self.introspection_cache_ttl
+            expires_at = introspection.get("exp")
+            if expires_at is not None:
+                ttl = min(ttl, expires_at - time.time())
+            self._introspection_cache.set(key, introspection, ttl)
+
+        return dict(introspection)
+
+    async def introspect_tokens(
+        self,
+        tokens: Iterable[str],
+        token_type_hint: str | None = None,
+        *,
+        concurrency: int = 10,
+    ) -> list[dict[str, Any]]:
+        """
+        Requests information about several tokens,
+        with at most `concurrency` requests in flight.
+
+        Args:
+            tokens: The tokens to introspect.
+            token_type_hint: Optional hint for the service to help it determine
+                if they're tokens or refresh tokens.
+            concurrency: Maximum number of concurrent requests.
+
+        Returns:
+            The introspection response dictionaries, in the same order as `tokens`.
+
+        Raises:
+            ValueError: `concurrency` is lower than 1.
+            IntrospectTokenError: An error occurred while introspecting a token.
+            IntrospectTokenNotSupportedError: The provider does not support token introspection.
+
+        Examples:
+            ```py
+            introspections = await client.introspect_tokens(["TOKEN_1", "TOKEN_2"])
+            ```
+        """
+        import asyncio
+
+        if concurrency < 1:
+            message = "concurrency must be at least 1"
+            raise ValueError(message)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _introspect(token: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.introspect_token(token, token_type_hint)
+
+        return list(await asyncio.gather(*(_introspect(token) for token in tokens)))
+
+    async def _introspect_token(
+        self, token: str, token_type_hint: str | None
+    ) -> dict[str, Any]:
+        assert self.introspection_endpoint is not None
+        async with self.get_httpx_client() as client:
+            data = {"token": token}
+
+            if token_type_hint is not None:
+                data["token_type_hint"] = token_type_hint
+
+            response = await self.send_authenticated_request(
+                client,
+                "POST",
+                self.introspection_endpoint,
+                auth_method=self.introspection_endpoint_auth_method
+                or self.token_endpoint_auth_method,
+                data=data,
+                exc_class=IntrospectTokenError,
+            )
+            return self.get_json(response, exc_class=IntrospectTokenError)
+
     async def get_profile(self, token: str) -> dict[str, Any]:
         """
         Returns the profile of the authenticated user
@@ -438,10 +1342,133 @@ class BaseOAuth2(Generic[T]):
         """
         raise NotImplementedError()
 
+    async def get_id_emails(
+        self,
+        tokens: Iterable[str],
+        *,
+        concurrency: int = 10,
+        rate_limit: float | None = None,
+    ) -> AsyncIterator[IdEmailResult]:
+        """
+        Returns the id and the email of the users of several tokens,
+        with at most `concurrency` requests in flight.
+
+        Results are yielded as soon as they're available, so not in the order of `tokens`,
+        which are consumed lazily. An error on a token doesn't stop the others:
+        it's reported in its result instead.
+
+        If the client is not open, a private pooled HTTPX client is opened
+        for the duration of the iteration. The pool of the client,
+        which may be shared with other clients, is left untouched.
+
+        Args:
+            tokens: The access tokens.
+            concurrency: Maximum number of concurrent requests.
+            rate_limit: Maximum number of requests started per second,
+                to respect the rate limits of the provider.
+
+        Returns:
+            An async iterator of [IdEmailResult][httpx_oauth.oauth2.IdEmailResult].
+
+        Raises:
+            ValueError: `concurrency` is lower than 1.
+
+        Examples:
+            ```py
+            async for result in client.get_id_emails(tokens, concurrency=20, rate_limit=50):
+                if result.error is not None:
+                    print(f"Error: {result.error}")
+                else:
+                    user_id, user_email = result.id_email
+            ```
+        """
+        import asyncio
+
+        if concurrency < 1:
+            message = "concurrency must be at least 1"
+            raise ValueError(message)
+
+        rate_limiter = _RateLimiter(rate_limit) if rate_limit is not None else None
+
+        client = self
+        private_pool: HTTPXClientPool | None = None
+        if not self.is_open:
+            private_pool = HTTPXClientPool()
+            private_pool.open(self.create_httpx_client)
+            client = copy.copy(self)
+            client.pool = private_pool
+
+        async def _get_id_email(token: str) -> IdEmailResult:
+            if rate_limiter is not None:
+                await rate_limiter.wait()
+            try:
+                return IdEmailResult(token, await client.get_id_email(token))
+            except (GetIdEmailError, httpx.HTTPError) as e:
+                return IdEmailResult(token, None, e)
+
+        tokens_iterator = iter(tokens)
+        pending: set[asyncio.Future[IdEmailResult]] = set()
+        try:
+            while True:
+                for token in itertools.islice(
+                    tokens_iterator, concurrency - len(pending)
+                ):
+                    pending.add(asyncio.ensure_future(_get_id_email(token)))
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if private_pool is not None:
+                await private_pool.aclose()
+
+    def _copy_with(self: OAuth2ClientT, **attributes: Any) -> OAuth2ClientT:  # noqa: PYI019
+        """
+        Returns a lightweight copy of the client with some attributes replaced.
+
+        The copy shares the pooled HTTPX client and the configuration of the original,
+        but gets its own token caches, since tokens are specific to the endpoints.
+        """
+        client = copy.copy(self)
+        client.__dict__.update(attributes)
+        client._introspection_cache = TTLCache(INTROSPECTION_CACHE_MAXSIZE)
+        client._introspection_calls = SingleFlight()
+        client._client_credentials_tokens = LRUCache(CLIENT_CREDENTIALS_CACHE_MAXSIZE)
+        client._client_credentials_calls = SingleFlight()
+        client._conditional_requests_cache = LRUCache(
+            CONDITIONAL_REQUESTS_CACHE_MAXSIZE
+        )
+        client._rejected_tokens = TTLCache(REJECTED_TOKENS_CACHE_MAXSIZE)
+        client._profile_calls = SingleFlight()
+        client._keepalive_task = None
+        return client
+
+    def create_httpx_client(self) -> httpx.AsyncClient:
+        """
+        Creates a new HTTPX client.
+
+        Override it to customize the HTTPX client settings,
+        like timeouts or proxies.
+        """
+        if self.dns_cache is not None:
+            from httpx_oauth.dns import DNSCacheTransport
+
+            return httpx.AsyncClient(
+                transport=DNSCacheTransport(
+                    self.dns_cache, verify=self.ssl_context.get()
+                )
+            )
+        return httpx.AsyncClient(verify=self.ssl_context.get())
+
     def get_httpx_client(
         self,
     ) -> contextlib.AbstractAsyncContextManager[httpx.AsyncClient]:
-        return httpx.AsyncClient()
+        return self._pool.get_httpx_client(self.create_httpx_client)
 
     def build_request(
         self,
@@ -451,19 +1478,12 @@ class BaseOAuth2(Generic[T]):
         *,
         auth_method: OAuth2ClientAuthMethod | None = None,
         data: Mapping[str, Any] | None = None,
+        credentials: ClientCredentials | None = None,
     ) -> tuple[httpx.Request, httpx.Auth | None]:
-        if data is not None:
-            data = {
-                **data,
-                **(
-                    {
-                        "client_id": self.client_id,
-                        "client_secret": self.client_secret,
-                    }
-                    if auth_method == "client_secret_post"
-                    else {}
-                ),
-            }
+        if credentials is None:
+            credentials = self.credentials
+        if data is not None and auth_method == "client_secret_post":
+            data = {**data, **credentials.form}
 
         request = client.build_request(
             method,
@@ -472,11 +1492,55 @@ class BaseOAuth2(Generic[T]):
             headers=self.request_headers,
         )
 
-        auth = None
         if auth_method == "client_secret_basic":
-            auth = httpx.BasicAuth(self.client_id, self.client_secret)
+            request.headers["Authorization"] = credentials.basic_authorization
+
+        return request, None
+
+    async def send_authenticated_request(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        *,
+        auth_method: OAuth2ClientAuthMethod,
+        data: Mapping[str, Any],
+        exc_class: type[OAuth2RequestError],
+    ) -> httpx.Response:
+        """
+        Sends a request authenticated with the client credentials.
 
-        return request, auth
+        If the provider rejects them while a secret rotation overlap is running,
+        the request is retried once with the previous credentials.
+
+        Raises:
+            exc_class: An error occurred while sending the request.
+        """
+        credentials = self.credentials
+        request, auth = self.build_request(
+            client,
+            method,
+            url,
+            auth_method=auth_method,
+            data=data,
+            credentials=credentials,
+        )
+        try:
+            return await self.send_request(client, request, auth, exc_class=exc_class)
+        except OAuth2RequestError as e:
+            previous = self._credentials.get_previous()
+            if previous is None or previous is credentials or not _is_invalid_client(e):
+                raise
+
+        request, auth = self.build_request(
+            client,
+            method,
+            url,
+            auth_method=auth_method,
+            data=data,
+            credentials=previous,
+        )
+        return await self.send_request(client, request, auth, exc_class=exc_class)
 
     async def send_request(
         self,
@@ -499,12 +1563,227 @@ class BaseOAuth2(Generic[T]):
     def get_json(
         self, response: httpx.Response, *, exc_class: type[OAuth2RequestError]
     ) -> dict[str, Any]:
+        """
+        Decodes the JSON body of a response with the `json_codec`.
+
+        Raises:
+            exc_class: The body is not valid JSON.
+        """
         try:
-            return cast(dict[str, Any], response.json())
-        except json.decoder.JSONDecodeError as e:
+            return cast(dict[str, Any], self.json_codec.loads(response.content))
+        except ValueError as e:
             message = "Invalid JSON content"
             raise exc_class(message, response) from e
 
+    async def request_profile(
+        self,
+        method: str,
+        url: str,
+        token: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        scheme: str = "Bearer",
+    ) -> Any:
+        """
+        Sends an authenticated request to the provider API
+        and decodes the JSON body of the response with the `json_codec`.
+
+        It's the common implementation behind
+        [get_profile][httpx_oauth.oauth2.BaseOAuth2.get_profile]
+        and similar methods of the provided clients.
+
+        If `conditional_profile_requests` is enabled, the `ETag` and `Last-Modified`
+        headers of GET responses are kept for each token and URL,
+        and sent back in the next requests. When the provider answers
+        `304 Not Modified`, the previous body is returned.
+
+        If `rejected_tokens_cache_ttl` is set, tokens rejected with a `401 Unauthorized`
+        response are remembered for this duration, in seconds: requests with them
+        fail immediately, without reaching the provider. Only a hash of the token
+        and the status code are kept, so the error has no `response` then.
+
+        If `coalesce_profile_requests` is enabled, which is the default,
+        concurrent identical requests with the same token share a single HTTP call,
+        and its result or exception. Each caller gets its own decoded body.
+
+        If a `hedging_policy` is set, GET requests still pending after
+        the delay of the policy are sent a second time,
+        and the first successful response is kept.
+
+        Args:
+            method: The HTTP method.
+            url: The endpoint URL.
+            token: The access token.
+            params: Optional query parameters.
+            headers: The request headers. Defaults to `request_headers`,
+                with the token in the `Authorization` header.
+            scheme: The authorization scheme of the token,
+                when `headers` is not set.
+
+        Returns:
+            The decoded response body.
+
+        Raises:
+            httpx_oauth.exceptions.GetProfileError:
+                The request failed or the body is not valid JSON.
+        """
+        if self.rejected_tokens_cache_ttl > 0:
+            rejected_status_code = self._rejected_tokens.get(hash_token(token))
+            if rejected_status_code is not None:
+                message = f"Token recently rejected with status {rejected_status_code}"
+                raise GetProfileError(message)
+
+        def send() -> Awaitable[tuple[httpx.Response, bytes]]:
+            return self._send_profile_request(
+                method, url, token, params=params, headers=headers, scheme=scheme
+            )
+
+        if self.coalesce_profile_requests:
+            key = hash_token(
+                f"{method}\0{httpx.URL(url, params=params)}\0{scheme}\0{token}"
+            )
+            response, content = await self._profile_calls.do(key, send)
+        else:
+            response, content = await send()
+
+        try:
+            return self.json_codec.loads(content)
+        except ValueError as e:
+            message = "Invalid JSON content"
+            raise GetProfileError(message, response) from e
+
+    async def _send_profile_request(
+        self,
+        method: str,
+        url: str,
+        token: str,
+        *,
+        params: Mapping[str, Any] | None,
+        headers: Mapping[str, str] | None,
+        scheme: str,
+    ) -> tuple[httpx.Response, bytes]:
+        async with self.get_httpx_client() as client:
+            request = client.build_request(
+                method,
+                url,
+                params=params,
+                headers=self.request_headers if headers is None else headers,
+            )
+            if headers is None:
+                request.headers["Authorization"] = f"{scheme} {token}"
+
+            cache_key: bytes | None = None
+            cached = None
+            if self.conditional_profile_requests and request.method == "GET":
+                cache_key = hash_token(f"{token}\0{request.url}")
+                cached = self._conditional_requests_cache.get(cache_key)
+                if cached is not None:
+                    etag, last_modified, _ = cached
+                    if etag is not None:
+                        request.headers["If-None-Match"] = etag
+                    if last_modified is not None:
+                        request.headers["If-Modified-Since"] = last_modified
+
+            if self.hedging_policy is not None and request.method == "GET":
+                response = await self._send_hedged_request(
+                    client, request, self.hedging_policy
+                )
+            else:
+                response = await client.send(request)
+
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            content = cached[2]
+        elif response.status_code >= 400:
+            if response.status_code == httpx.codes.UNAUTHORIZED:
+                self._rejected_tokens.set(
+                    hash_token(token),
+                    response.status_code,
+                    self.rejected_tokens_cache_ttl,
+                )
+            raise GetProfileError(response=response)
+        else:
+            content = response.content
+            if cache_key is not None:
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if etag is not None or last_modified is not None:
+                    self._conditional_requests_cache.set(
+                        cache_key, (etag, last_modified, content)
+                    )
+                else:
+                    self._conditional_requests_cache.pop(cache_key)
+
+        return response, content
+
+    async def _send_hedged_request(
+        self,
+        client: httpx.AsyncClient,
+        request: httpx.Request,
+        policy: HedgingPolicy,
+    ) -> httpx.Response:
+        import asyncio
+
+        async def attempt(request: httpx.Request) -> httpx.Response:
+            start = time.monotonic()
+            response = await client.send(request)
+            if response.status_code < 500:
+                policy.record(time.monotonic() - start)
+            return response
+
+        pending = {asyncio.ensure_future(attempt(request))}
+        tasks = set(pending)
+        try:
+            done, pending = await asyncio.wait(pending, timeout=policy.delay)
+            if not done:
+                hedge = httpx.Request(
+                    request.method,
+                    request.url,
+                    headers=request.headers,
+                    extensions=request.extensions,
+                )
+                pending.add(asyncio.ensure_future(attempt(hedge)))
+                tasks |= pending
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None and task.result().status_code < 500:
+                        return task.result()
+            # Every attempt failed: report the last failure
+            return done.pop().result()
+        finally:
+            for task in tasks:
+                task.cancel()
+                if task.done() and not task.cancelled():
+                    task.exception()  # Mark it as retrieved
+
+    def process_token_response(
+        self,
+        data: dict[str, Any],
+        response: httpx.Response,
+        *,
+        exc_class: type[OAuth2RequestError],
+    ) -> dict[str, Any]:
+        """
+        Hook called on the decoded body of every token response,
+        before it's wrapped into an [OAuth2Token][httpx_oauth.oauth2.OAuth2Token].
+
+        Override it to handle provider-specific responses,
+        without decoding the body again.
+
+        Args:
+            data: The decoded response body.
+            response: The response.
+            exc_class: The exception class to raise if the response is an error.
+
+        Returns:
+            The token data.
+        """
+        return data
+
 
 OAuth2 = BaseOAuth2[dict[str, Any]]
 """
@@ -0,0 +1,279 @@
+import contextlib
+from collections.abc import Iterator, Mapping
+from types import TracebackType
+from typing import Any
+
+import httpx
+
+from httpx_oauth import clients
+from httpx_oauth.clients.openid import OpenID
+from httpx_oauth.discovery import OpenIDDiscoveryCache, default_discovery_cache
+from httpx_oauth.oauth2 import BaseOAuth2, HTTPXClientPool
+from httpx_oauth.tls import default_ssl_context
+
+
+class ClientRegistry:
+    """
+    Registry of OAuth2 clients, keyed by name.
+
+    Registering a client is cheap: its provider module is imported
+    and the client is constructed on first use only.
+    Every client shares the pooled HTTPX client of the registry,
+    so there is a single place to open and close connections.
+
+    In async code, prefer [aget][httpx_oauth.registry.ClientRegistry.aget]:
+    [OpenID][httpx_oauth.clients.openid.OpenID] providers, like Okta,
+    fetch their OpenID configuration synchronously when constructed by
+    [get][httpx_oauth.registry.ClientRegistry.get], blocking the event loop.
+
+    Examples:
+        ```py
+        from httpx_oauth.registry import ClientRegistry
+
+        registry = ClientRegistry.from_config(
+            {
+                "google": {"client_id": "CLIENT_ID", "client_secret": "CLIENT_SECRET"},
+                "okta-eu": {
+                    "provider": "okta",
+                    "client_id": "CLIENT_ID",
+                    "client_secret": "CLIENT_SECRET",
+                    "okta_domain": "eu.okta.com",
+                },
+            }
+        )
+
+        async with registry:
+            okta = await registry.aget("okta-eu")
+            user_id, user_email = await okta.get_id_email("TOKEN")
+        ```
+    """
+
+    def __init__(
+        self, *, discovery_cache: OpenIDDiscoveryCache = default_discovery_cache
+    ) -> None:
+        """
+        Args:
+            discovery_cache: The cache of OpenID configurations used by
+                [aget][httpx_oauth.registry.ClientRegistry.aget].
+                Defaults to the process-wide one.
+        """
+        self._registrations: dict[
+            str, tuple[str | type[BaseOAuth2[Any]], dict[str, Any]]
+        ] = {}
+        self._clients: dict[str, BaseOAuth2[Any]] = {}
+        self.discovery_cache = discovery_cache
+        self.pool = HTTPXClientPool()
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Mapping[str, Mapping[str, Any]],
+        *,
+        discovery_cache: OpenIDDiscoveryCache = default_discovery_cache,
+    ) -> "ClientRegistry":
+        """
+        Creates a registry from a declarative configuration.
+
+        Args:
+            config: Client parameters, by client name.
+                The `provider` key selects the provider, among
+                [the provided ones][httpx_oauth.clients.PROVIDERS].
+                It defaults to the client name.
+                Other keys are passed to the client constructor.
+            discovery_cache: The cache of OpenID configurations used by
+                [aget][httpx_oauth.registry.ClientRegistry.aget].
+                Defaults to the process-wide one.
+
+        Returns:
+            The registry.
+
+        Raises:
+            ValueError: A provider is unknown.
+        """
+        registry = cls(discovery_cache=discovery_cache)
+        for name, parameters in config.items():
+            parameters = dict(parameters)
+            provider = parameters.pop("provider", name)
+            registry.register(name, provider, **parameters)
+        return registry
+
+    def register(
+        self, name: str, provider: str | type[BaseOAuth2[Any]], /, **kwargs: Any
+    ) -> None:
+        """
+        Registers a client. The client is not constructed until it's needed.
+
+        Args:
+            name: The client name. It's also passed as the `name` of the client,
+                unless set in `kwargs`.
+            provider: The provider name, among
+                [the provided ones][httpx_oauth.clients.PROVIDERS], or a client class.
+            **kwargs: Parameters passed to the client constructor.
+
+        Raises:
+            ValueError: The provider is unknown.
+        """
+        if isinstance(provider, str) and provider not in clients.PROVIDERS:
+            message = f"Unknown provider {provider}."
+            raise ValueError(message)
+        kwargs.setdefault("name", name)
+        self._registrations[name] = (provider, kwargs)
+        self._clients.pop(name, None)
+
+    def rotate_client_secret(
+        self, name: str, client_secret: str, *, overlap: float = 0
+    ) -> None:
+        """
+        Replaces the client secret of a client, without rebuilding it.
+
+        See [rotate_client_secret][httpx_oauth.oauth2.BaseOAuth2.rotate_client_secret].
+
+        Args:
+            name: The client name.
+            client_secret: The new client secret.
+            overlap: How long the previous secret can still be tried, in seconds.
+
+        Raises:
+            KeyError: The client is not registered.
+        """
+        _, kwargs = self._registrations[name]
+        kwargs["client_secret"] = client_secret
+        client = self._clients.get(name)
+        if client is not None:
+            client.rotate_client_secret(client_secret, overlap=overlap)
+
+    def __len__(self) -> int:
+        return len(self._registrations)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._registrations)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._registrations
+
+    def __getitem__(self, name: str) -> BaseOAuth2[Any]:
+        return self.get(name)
+
+    def get(self, name: str) -> BaseOAuth2[Any]:
+        """
+        Returns a client, constructing it if needed.
+
+        [OpenID][httpx_oauth.clients.openid.OpenID] providers without
+        an `openid_configuration` fetch it synchronously when constructed,
+        which blocks the event loop. In async code,
+        use [aget][httpx_oauth.registry.ClientRegistry.aget] instead.
+
+        Args:
+            name: The client name.
+
+        Returns:
+            The client.
+
+        Raises:
+            KeyError: The client is not registered.
+            OpenIDConfigurationError:
+                An error occurred while fetching the OpenID configuration.
+        """
+        client = self._clients.get(name)
+        if client is None:
+            client = self._create_client(name)
+        return client
+
+    async def aget(self, name: str) -> BaseOAuth2[Any]:
+        """
+        Returns a client, constructing it if needed, without blocking the event loop.
+
+        The OpenID configuration of [OpenID][httpx_oauth.clients.openid.OpenID] providers
+        is fetched asynchronously through the discovery cache of the registry,
+        and passed to the client constructor.
+
+        Args:
+            name: The client name.
+
+        Returns:
+            The client.
+
+        Raises:
+            KeyError: The client is not registered.
+            OpenIDConfigurationError:
+                An error occurred while fetching the OpenID configuration.
+        """
+        client = self._clients.get(name)
+        if client is not None:
+            return client
+
+        provider, kwargs = self._registrations[name]
+        client_class = self._get_client_class(provider)
+        openid_configuration: dict[str, Any] | None = None
+        if (
+            issubclass(client_class, OpenID)
+            and kwargs.get("openid_configuration") is None
+        ):
+            openid_configuration = await self.discovery_cache.get(
+                client_class.get_openid_configuration_endpoint(**kwargs),
+                self.get_httpx_client,
+            )
+
+        # Another task may have constructed it while fetching the configuration
+        client = self._clients.get(name)
+        if client is None:
+            client = self._create_client(name, openid_configuration)
+        return client
+
+    def _get_client_class(
+        self, provider: str | type[BaseOAuth2[Any]]
+    ) -> type[BaseOAuth2[Any]]:
+        return clients.get(provider) if isinstance(provider, str) else provider
+
+    def _create_client(
+        self, name: str, openid_configuration: dict[str, Any] | None = None
+    ) -> BaseOAuth2[Any]:
+        provider, kwargs = self._registrations[name]
+        if openid_configuration is not None:
+            kwargs = {**kwargs, "openid_configuration": openid_configuration}
+        client = self._get_client_class(provider)(**kwargs)
+        client.pool = self.pool
+        self._clients[name] = client
+        return client
+
+    def create_httpx_client(self) -> httpx.AsyncClient:
+        """
+        Creates the pooled HTTPX client shared by every client of the registry.
+
+        Override it to customize the HTTPX client.
+        """
+        return httpx.AsyncClient(verify=default_ssl_context.get())
+
+    def get_httpx_client(
+        self,
+    ) -> contextlib.AbstractAsyncContextManager[httpx.AsyncClient]:
+        """
+        Returns the pooled HTTPX client if the registry is open,
+        or a new HTTPX client closed on exit otherwise.
+        """
+        return self.pool.get_httpx_client(self.create_httpx_client)
+
+    async def open(self) -> None:
+        """Opens the pooled HTTPX client shared by every client of the registry."""
+        self.pool.open(self.create_httpx_client)
+
+    async def aclose(self) -> None:
+        """Closes the pooled HTTPX client shared by every client of the registry."""
+        await self.pool.aclose()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the pooled HTTPX client is currently open."""
+        return self.pool.is_open
+
+    async def __aenter__(self) -> "ClientRegistry":  # noqa: PYI034
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
@@ -0,0 +1,98 @@
+"""
+Export and load snapshots of OpenID configurations,
+to create [OpenID][httpx_oauth.clients.openid.OpenID] clients without any request at startup.
+
+A snapshot is the JSON document served by the discovery endpoint.
+Export it from a live issuer with:
+
+```bash
+python -m httpx_oauth.snapshot https://example.fief.dev/.well-known/openid-configuration -o openid-configuration.json
+```
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections.abc import Sequence
+from typing import Any
+
+from httpx_oauth.clients.openid import (
+    OpenIDConfigurationError,
+    fetch_openid_configuration,
+)
+
+
+def load_snapshot(path: str | os.PathLike[str]) -> dict[str, Any]:
+    """
+    Loads an OpenID configuration snapshot.
+
+    Args:
+        path: Path to the snapshot file.
+
+    Returns:
+        The OpenID configuration, to be passed as `openid_configuration`.
+
+    Examples:
+        ```py
+        from httpx_oauth.clients.openid import OpenID
+        from httpx_oauth.snapshot import load_snapshot
+
+        client = OpenID(
+            "CLIENT_ID",
+            "CLIENT_SECRET",
+            "https://example.fief.dev/.well-known/openid-configuration",
+            openid_configuration=load_snapshot("openid-configuration.json"),
+        )
+        ```
+    """
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_snapshot(
+    path: str | os.PathLike[str], openid_configuration: dict[str, Any]
+) -> None:
+    """
+    Saves an OpenID configuration snapshot.
+
+    Args:
+        path: Path to the snapshot file.
+        openid_configuration: The OpenID configuration.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(openid_configuration, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m httpx_oauth.snapshot",
+        description="Export a snapshot of an OpenID configuration from a live issuer.",
+    )
+    parser.add_argument(
+        "openid_configuration_endpoint", help="OpenID Connect discovery endpoint URL."
+    )
+    parser.add_argument(
+        "-o", "--output", help="Path to the snapshot file. Defaults to stdout."
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        openid_configuration = fetch_openid_configuration(
+            args.openid_configuration_endpoint
+        )
+    except OpenIDConfigurationError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.output is None:
+        json.dump(openid_configuration, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write("\n")
+    else:
+        save_snapshot(args.output, openid_configuration)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
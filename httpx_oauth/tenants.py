@@ -0,0 +1,95 @@
+from types import TracebackType
+from typing import Generic, Protocol, TypeVar
+
+from httpx_oauth._cache import LRUCache
+
+TENANT_REGISTRY_MAXSIZE = 1024
+
+
+class MultiTenantOAuth2Protocol(Protocol):
+    def for_tenant(self: "TenantClientT", tenant: str) -> "TenantClientT": ...  # noqa: PYI019
+
+    async def open(self) -> None: ...
+
+    async def aclose(self) -> None: ...
+
+
+TenantClientT = TypeVar("TenantClientT", bound=MultiTenantOAuth2Protocol)
+
+
+class TenantRegistry(Generic[TenantClientT]):
+    """
+    Registry of per-tenant clients, for multi-tenant providers like
+    [Microsoft][httpx_oauth.clients.microsoft.MicrosoftGraphOAuth2] or
+    [Shopify][httpx_oauth.clients.shopify.ShopifyOAuth2].
+
+    Tenant clients are lightweight copies of a base client, created on first use.
+    They share its pooled HTTPX client and its configuration.
+    Only the `maxsize` most recently used tenant clients are kept,
+    so memory grows with the number of active tenants, not the total number of tenants.
+
+    Examples:
+        ```py
+        from httpx_oauth.clients.shopify import ShopifyOAuth2
+        from httpx_oauth.tenants import TenantRegistry
+
+        registry = TenantRegistry(ShopifyOAuth2("CLIENT_ID", "CLIENT_SECRET", "my-shop"))
+
+        async with registry:
+            client = registry.get("other-shop")
+            profile = await client.get_profile("TOKEN")
+        ```
+    """
+
+    def __init__(
+        self, client: TenantClientT, *, maxsize: int = TENANT_REGISTRY_MAXSIZE
+    ) -> None:
+        """
+        Args:
+            client: The base client, whose pooled HTTPX client and configuration are shared.
+            maxsize: Maximum number of tenant clients kept in memory.
+        """
+        self.client = client
+        self._clients: LRUCache[str, TenantClientT] = LRUCache(maxsize)
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __getitem__(self, tenant: str) -> TenantClientT:
+        return self.get(tenant)
+
+    def get(self, tenant: str) -> TenantClientT:
+        """
+        Returns the client for a tenant, creating it if needed.
+
+        Args:
+            tenant: The tenant.
+
+        Returns:
+            The client for the tenant.
+        """
+        client = self._clients.get(tenant)
+        if client is None:
+            client = self.client.for_tenant(tenant)
+            self._clients.set(tenant, client)
+        return client
+
+    async def open(self) -> None:
+        """Opens the pooled HTTPX client shared by every tenant client."""
+        await self.client.open()
+
+    async def aclose(self) -> None:
+        """Closes the pooled HTTPX client shared by every tenant client."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "TenantRegistry[TenantClientT]":
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
@@ -0,0 +1,87 @@
+import os
+import ssl
+import threading
+
+
+class SharedSSLContext:
+    """
+    SSL context shared by every HTTPX client created by the library.
+
+    Building an SSL context loads the CA bundle from disk, which costs
+    a few milliseconds of CPU. The context is built once, on first use,
+    and reused by every client until [configure][httpx_oauth.tls.SharedSSLContext.configure]
+    is called.
+
+    By default, CA certificates are loaded from the file or directory
+    set in the `SSL_CERT_FILE` or `SSL_CERT_DIR` environment variables if any,
+    or from the [certifi](https://github.com/certifi/python-certifi) bundle otherwise,
+    like HTTPX does.
+    """
+
+    def __init__(
+        self,
+        *,
+        cafile: str | os.PathLike[str] | None = None,
+        capath: str | os.PathLike[str] | None = None,
+        cadata: str | bytes | None = None,
+    ) -> None:
+        """
+        Args:
+            cafile: Path to a file of concatenated CA certificates in PEM format.
+            capath: Path to a directory of CA certificates in PEM format.
+            cadata: CA certificates, as PEM string or DER bytes.
+        """
+        self._lock = threading.Lock()
+        self._context: ssl.SSLContext | None = None
+        self.configure(cafile=cafile, capath=capath, cadata=cadata)
+
+    def configure(
+        self,
+        *,
+        cafile: str | os.PathLike[str] | None = None,
+        capath: str | os.PathLike[str] | None = None,
+        cadata: str | bytes | None = None,
+    ) -> None:
+        """
+        Changes the CA source. The context is built again on next use;
+        HTTPX clients already open keep the previous one.
+
+        Args:
+            cafile: Path to a file of concatenated CA certificates in PEM format.
+            capath: Path to a directory of CA certificates in PEM format.
+            cadata: CA certificates, as PEM string or DER bytes.
+        """
+        with self._lock:
+            self.cafile = cafile
+            self.capath = capath
+            self.cadata = cadata
+            self._context = None
+
+    def get(self) -> ssl.SSLContext:
+        """
+        Returns the SSL context, building it if needed.
+        """
+        context = self._context
+        if context is None:
+            with self._lock:
+                if self._context is None:
+                    self._context = self._create()
+                context = self._context
+        return context
+
+    def _create(self) -> ssl.SSLContext:
+        cafile, capath = self.cafile, self.capath
+        if cafile is None and capath is None and self.cadata is None:
+            cafile = os.environ.get("SSL_CERT_FILE")
+            capath = os.environ.get("SSL_CERT_DIR")
+            if not cafile and not capath:
+                import certifi
+
+                cafile = certifi.where()
+        return ssl.create_default_context(
+            cafile=cafile or None, capath=capath or None, cadata=self.cadata
+        )
+
+
+default_ssl_context = SharedSSLContext()
+"""Process-wide SSL context, used when no context is explicitly provided."""
@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+
+from httpx_oauth._cache import LRUCache, SingleFlight, TTLCache, hash_token
+
+
+class TestLRUCache:
+    def test_get_set(self):
+        cache: LRUCache[str, int] = LRUCache(2)
+        assert cache.get("a") is None
+
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert "a" in cache
+        assert len(cache) == 1
+
+    def test_eviction(self):
+        cache: LRUCache[str, int] = LRUCache(2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_pop_clear(self):
+        cache: LRUCache[str, int] = LRUCache(2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestTTLCache:
+    def test_get_set(self):
+        now = 0.0
+        cache: TTLCache[str, int] = TTLCache(2, clock=lambda: now)
+        assert cache.get("a") is None
+
+        cache.set("a", 1, 10)
+        assert cache.get("a") == 1
+        assert len(cache) == 1
+
+        now = 10.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_set_non_positive_ttl(self):
+        cache: TTLCache[str, int] = TTLCache(2)
+        cache.set("a", 1, 10)
+        cache.set("a", 2, 0)
+
+        assert cache.get("a") is None
+
+    def test_pop_clear(self):
+        cache: TTLCache[str, int] = TTLCache(2)
+        cache.set("a", 1, 10)
+        cache.set("b", 2, 10)
+
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+
+        cache.clear()
+        assert len(cache) == 0
+
+
+def test_hash_token():
+    assert hash_token("TOKEN") == hash_token("TOKEN")
+    assert hash_token("TOKEN") != hash_token("OTHER_TOKEN")
+
+
+@pytest.mark.asyncio
+class TestSingleFlight:
+    async def test_coalesced(self):
+        single_flight: SingleFlight[str, int] = SingleFlight()
+        calls = 0
+
+        async def fn() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return calls
+
+        results = await asyncio.gather(*(single_flight.do("a", fn) for _ in range(3)))
+        assert results == [1, 1, 1]
+        assert len(single_flight) == 0
+
+        assert await single_flight.do("a", fn) == 2
+
+    async def test_exception(self):
+        single_flight: SingleFlight[str, int] = SingleFlight()
+
+        async def fn() -> int:
+            await asyncio.sleep(0)
+            raise ValueError()
+
+        results = await asyncio.gather(
+            *(single_flight.do("a", fn) for _ in range(2)), return_exceptions=True
+        )
+        assert all(isinstance(result, ValueError) for result in results)
+
+    async def test_caller_cancelled(self):
+        single_flight: SingleFlight[str, int] = SingleFlight()
+        event = asyncio.Event()
+
+        async def fn() -> int:
+            await event.wait()
+            return 42
+
+        leader = asyncio.ensure_future(single_flight.do("a", fn))
+        follower = asyncio.ensure_future(single_flight.do("a", fn))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        event.set()
+
+        assert await follower == 42
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    async def test_cancelled(self):
+        single_flight: SingleFlight[str, int] = SingleFlight()
+
+        async def fn() -> int:
+            await asyncio.sleep(10)
+            return 42
+
+        caller = asyncio.ensure_future(single_flight.do("a", fn))
+        await asyncio.sleep(0)
+        task = single_flight._tasks["a"]
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        assert len(single_flight) == 0
@@ -0,0 +1,45 @@
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+from httpx_oauth import clients
+from httpx_oauth.oauth2 import BaseOAuth2
+
+
+@pytest.mark.parametrize("name", clients.PROVIDERS.keys())
+def test_get(name: str):
+    client_class = clients.get(name)
+    assert issubclass(client_class, BaseOAuth2)
+    assert client_class.__name__ == clients.PROVIDERS[name][1]
+
+
+def test_get_unknown():
+    with pytest.raises(KeyError):
+        clients.get("unknown")
+
+
+def test_lazy_import():
+    code = (
+        "import sys\n"
+        "from httpx_oauth import clients\n"
+        "assert not any(m.startswith('httpx_oauth.clients.') for m in sys.modules)\n"
+        "clients.get('google')\n"
+        "assert 'httpx_oauth.clients.google' in sys.modules\n"
+        "assert 'httpx_oauth.clients.github' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.parametrize(
+    "name", [name for name in clients.PROVIDERS if name not in {"okta", "openid"}]
+)
+def test_logo_svg(name: str):
+    module = importlib.import_module(clients.PROVIDERS[name][0])
+    client_class = clients.get(name)
+
+    assert client_class.logo_svg.strip().startswith("<svg")
+    assert module.LOGO_SVG is client_class.logo_svg
+    with pytest.raises(AttributeError):
+        module.UNKNOWN  # noqa: B018
@@ -17,6 +17,7 @@ def test_discord_oauth2():
     assert client.revoke_token_endpoint == "https://discord.com/api/oauth2/token/revoke"
     assert client.base_scopes == ["identify", "email"]
     assert client.name == "discord"
+    assert client.get_warmup_endpoints()[-1] == "https://discord.com/api/users/@me"
 
 
 profile_verified_email_response = {
@@ -29,6 +29,7 @@ def test_facebook_oauth2():
     assert client.revoke_token_endpoint is None
     assert client.base_scopes == ["email", "public_profile"]
     assert client.name == "facebook"
+    assert client.get_warmup_endpoints()[-1] == "https://graph.facebook.com/v5.0/me"
 
 
 @pytest.mark.asyncio
@@ -34,6 +34,7 @@ def test_franceconnect(
     assert client.profile_endpoint == profile
     assert client.base_scopes == ["openid", "email"]
     assert client.name == "franceconnect"
+    assert client.get_warmup_endpoints() == [access_token, profile]
 
 
 profile_response = {"sub": 42, "email": "arthur@camelot.bt"}
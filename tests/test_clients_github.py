@@ -7,7 +7,12 @@ from httpx import HTTPError, Response
 
 from httpx_oauth.clients.github import EMAILS_ENDPOINT, PROFILE_ENDPOINT, GitHubOAuth2
 from httpx_oauth.exceptions import GetIdEmailError
-from httpx_oauth.oauth2 import OAuth2Token, RefreshTokenError
+from httpx_oauth.oauth2 import (
+    GetAccessTokenError,
+    OAuth2ErrorResponse,
+    OAuth2Token,
+    RefreshTokenError,
+)
 
 client = GitHubOAuth2("CLIENT_ID", "CLIENT_SECRET")
 
@@ -21,6 +26,10 @@ def test_github_oauth2():
     assert client.revoke_token_endpoint is None
     assert client.base_scopes == ["user", "user:email"]
     assert client.name == "github"
+    assert client.get_warmup_endpoints()[-2:] == [
+        "https://api.github.com/user",
+        "https://api.github.com/user/emails",
+    ]
 
 
 profile_response = {"id": 42, "email": "arthur@camelot.bt"}
@@ -87,6 +96,18 @@ class TestGitHubRefreshToken:
         with pytest.raises(RefreshTokenError) as excinfo:
             await client.refresh_token("REFRESH_TOKEN")
         assert isinstance(excinfo.value.response, Response)
+        assert excinfo.value.error == "bad_refresh_token"
+        assert excinfo.value.error_response == OAuth2ErrorResponse(**error_response)
+
+    @respx.mock
+    async def test_get_access_token_200_error(self):
+        respx.post(client.access_token_endpoint).mock(
+            return_value=Response(200, json={"error": "bad_verification_code"})
+        )
+
+        with pytest.raises(GetAccessTokenError) as excinfo:
+            await client.get_access_token("CODE", "https://www.tintagel.bt/callback")
+        assert excinfo.value.error == "bad_verification_code"
 
     @respx.mock
     async def test_refresh_token_json_error(self):
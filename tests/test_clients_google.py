@@ -20,6 +20,10 @@ def test_google_oauth2():
         "https://www.googleapis.com/auth/userinfo.email",
     ]
     assert client.name == "google"
+    assert (
+        client.get_warmup_endpoints()[-1]
+        == "https://people.googleapis.com/v1/people/me"
+    )
 
 
 profile_response = {
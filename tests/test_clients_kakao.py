@@ -1,11 +1,13 @@
+import json
 import re
 
 import pytest
 import respx
 from httpx import Response
 
-from httpx_oauth.clients.kakao import PROFILE_ENDPOINT, KakaoOAuth2
+from httpx_oauth.clients.kakao import PROFILE_ENDPOINT, PROFILE_PROPERTIES, KakaoOAuth2
 from httpx_oauth.exceptions import GetIdEmailError
+from httpx_oauth.oauth2 import JSONCodec
 
 client = KakaoOAuth2("CLIENT_ID", "CLIENT_SECRET")
 
@@ -17,6 +19,7 @@ def test_kakao_oauth2():
     assert client.revoke_token_endpoint == "https://kapi.kakao.com/v1/user/unlink"
     assert client.base_scopes == ["profile_nickname", "account_email"]
     assert client.name == "kakao"
+    assert client.get_warmup_endpoints()[-1] == "https://kapi.kakao.com/v2/user/me"
 
 
 profile_response = {"id": 4242424242, "kakao_account": {"email": "arthur@camelot.bt"}}
@@ -39,6 +42,7 @@ class TestKakaoGetIdEmail:
         assert headers["Accept"] == "application/json"
         assert user_id == "4242424242"
         assert user_email == "arthur@camelot.bt"
+        assert json.loads(url.params["property_keys"]) == PROFILE_PROPERTIES
 
     @pytest.mark.asyncio
     @respx.mock
@@ -63,3 +67,17 @@ class TestKakaoGetIdEmail:
 
         assert user_id == "4242424242"
         assert user_email is None
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_json_codec(self, get_respx_call_args):
+        request = respx.post(re.compile(f"^{PROFILE_ENDPOINT}")).mock(
+            return_value=Response(200, json=profile_response)
+        )
+        kakao_client = KakaoOAuth2("CLIENT_ID", "CLIENT_SECRET")
+        kakao_client.json_codec = JSONCodec(dumps=lambda obj: b'["CUSTOM"]')
+
+        await kakao_client.get_id_email("TOKEN")
+        url, _, _ = await get_respx_call_args(request)
+
+        assert url.params["property_keys"] == '["CUSTOM"]'
@@ -27,6 +27,10 @@ def test_linkedin_oauth2():
     assert client.base_scopes == ["r_emailaddress", "r_liteprofile", "r_basicprofile"]
     assert client.revoke_token_endpoint is None
     assert client.name == "linkedin"
+    assert client.get_warmup_endpoints()[-2:] == [
+        "https://api.linkedin.com/v2/me",
+        "https://api.linkedin.com/v2/emailAddress",
+    ]
 
 
 profile_response = {"id": "424242"}
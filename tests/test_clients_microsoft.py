@@ -26,6 +26,7 @@ def test_microsoft_graph_oauth2_default_tenant():
     assert client.revoke_token_endpoint is None
     assert client.base_scopes == ["User.Read"]
     assert client.name == "microsoft"
+    assert client.get_warmup_endpoints()[-1] == "https://graph.microsoft.com/v1.0/me"
 
 
 def test_microsoft_graph_oauth2_custom_tenant():
@@ -46,6 +47,32 @@ def test_microsoft_graph_oauth2_custom_tenant():
     assert client.revoke_token_endpoint is None
 
 
+def test_microsoft_graph_oauth2_for_tenant():
+    base_client = MicrosoftGraphOAuth2("CLIENT_ID", "CLIENT_SECRET")
+    tenant_client = base_client.for_tenant("my_tenant")
+
+    assert tenant_client is not base_client
+    assert tenant_client.tenant == "my_tenant"
+    assert (
+        tenant_client.authorize_endpoint
+        == "https://login.microsoftonline.com/my_tenant/oauth2/v2.0/authorize"
+    )
+    assert (
+        tenant_client.access_token_endpoint
+        == "https://login.microsoftonline.com/my_tenant/oauth2/v2.0/token"
+    )
+    assert (
+        tenant_client.refresh_token_endpoint
+        == "https://login.microsoftonline.com/my_tenant/oauth2/v2.0/token"
+    )
+    assert tenant_client.client_id == base_client.client_id
+    assert base_client.tenant == "common"
+    assert (
+        base_client.authorize_endpoint
+        == "https://login.microsoftonline.com/common/oauth2/v2.0/authorize"
+    )
+
+
 @pytest.mark.asyncio
 async def test_microsoft_graph_oauth2_authorization_url():
     client = MicrosoftGraphOAuth2("CLIENT_ID", "CLIENT_SECRET")
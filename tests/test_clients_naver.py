@@ -1,5 +1,7 @@
 import re
+from urllib.parse import parse_qs
 
+import httpx
 import pytest
 import respx
 from httpx import HTTPError, Response
@@ -18,6 +20,7 @@ def test_naver_oauth2():
     assert client.revoke_token_endpoint == "https://nid.naver.com/oauth2.0/token"
     assert client.base_scopes == []
     assert client.name == "naver"
+    assert client.get_warmup_endpoints()[-1] == "https://openapi.naver.com/v1/nid/me"
 
 
 profile_response = {
@@ -113,3 +116,19 @@ class TestRevokeToken:
         with pytest.raises(RevokeTokenError) as excinfo:
             await client.revoke_token("TOKEN", "TOKEN_TYPE_HINT")
         assert excinfo.value.response is None
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_revoke_token_secret_rotation_overlap(self):
+        def handler(request: httpx.Request) -> Response:
+            data = parse_qs(request.content.decode())
+            if data["client_secret"] == ["CLIENT_SECRET"]:
+                return Response(200)
+            return Response(401, json={"error": "invalid_client"})
+
+        route = respx.post(client.revoke_token_endpoint).mock(side_effect=handler)
+        rotated_client = NaverOAuth2("CLIENT_ID", "CLIENT_SECRET")
+        rotated_client.rotate_client_secret("NEW_SECRET", overlap=60)
+
+        await rotated_client.revoke_token("TOKEN")
+        assert route.call_count == 2
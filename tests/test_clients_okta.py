@@ -126,3 +126,16 @@ def test_okta_oauth2():
     assert client.revoke_token_endpoint == f"https://{OKTA_DOMAIN}/oauth2/v1/revoke"
     assert client.base_scopes == ["openid", "email"]
     assert client.name == "okta"
+
+
+def test_okta_oauth2_preloaded_configuration():
+    client = OktaOAuth2(
+        "CLIENT_ID",
+        "CLIENT_SECRET",
+        OKTA_DOMAIN,
+        openid_configuration=openid_configuration_response,
+        validate_openid_configuration=True,
+    )
+    assert client.openid_configuration is openid_configuration_response
+    assert client.authorize_endpoint == f"https://{OKTA_DOMAIN}/oauth2/v1/authorize"
+    assert client.validate_openid_configuration is True
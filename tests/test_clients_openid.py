@@ -1,3 +1,4 @@
+import asyncio
 import re
 
 import pytest
@@ -65,6 +66,20 @@ def test_openid_configuration_error():
         )
 
 
+@respx.mock
+def test_openid_configuration_not_object():
+    respx.get(
+        re.compile("https://example.fief.dev/.well-known/openid-configuration")
+    ).mock(return_value=Response(200, json=["NOT", "AN", "OBJECT"]))
+    with pytest.raises(OpenIDConfigurationError) as excinfo:
+        OpenID(
+            "CLIENT_ID",
+            "CLIENT_SECRET",
+            "https://example.fief.dev/.well-known/openid-configuration",
+        )
+    assert isinstance(excinfo.value.response, Response)
+
+
 @respx.mock
 def test_openid_configuration_http_error():
     respx.get(
@@ -84,8 +99,116 @@ def test_openid(client: OpenID):
     assert client.access_token_endpoint == "https://example.fief.dev/api/token"
     assert client.refresh_token_endpoint == "https://example.fief.dev/api/token"
     assert client.revoke_token_endpoint is None
+    assert client.introspection_endpoint is None
+    assert client.introspection_endpoint_auth_method is None
     assert client.base_scopes == ["openid", "email"]
     assert client.name == "openid"
+    assert client.get_warmup_endpoints() == [
+        "https://example.fief.dev/api/token",
+        "https://example.fief.dev/api/token",
+        "https://example.fief.dev/api/userinfo",
+    ]
+
+
+@respx.mock
+def test_openid_introspection_endpoint():
+    respx.get(
+        re.compile("https://example.fief.dev/.well-known/openid-configuration")
+    ).mock(
+        return_value=Response(
+            200,
+            json={
+                **openid_configuration_response,
+                "introspection_endpoint": "https://example.fief.dev/api/introspect",
+                "introspection_endpoint_auth_methods_supported": [
+                    "private_key_jwt",
+                    "client_secret_post",
+                ],
+            },
+        )
+    )
+    client = OpenID(
+        "CLIENT_ID",
+        "CLIENT_SECRET",
+        "https://example.fief.dev/.well-known/openid-configuration",
+    )
+
+    assert client.introspection_endpoint == "https://example.fief.dev/api/introspect"
+    assert client.introspection_endpoint_auth_method == "client_secret_post"
+
+
+def test_openid_introspection_endpoint_unsupported_auth_methods():
+    client = OpenID(
+        "CLIENT_ID",
+        "CLIENT_SECRET",
+        "https://example.fief.dev/.well-known/openid-configuration",
+        openid_configuration={
+            **openid_configuration_response,
+            "introspection_endpoint": "https://example.fief.dev/api/introspect",
+            "introspection_endpoint_auth_methods_supported": [
+                "private_key_jwt",
+                "tls_client_auth",
+            ],
+        },
+    )
+
+    assert client.introspection_endpoint is None
+    assert client.introspection_endpoint_auth_method is None
+
+
+def test_openid_preloaded_configuration():
+    client = OpenID(
+        "CLIENT_ID",
+        "CLIENT_SECRET",
+        "https://example.fief.dev/.well-known/openid-configuration",
+        openid_configuration=openid_configuration_response,
+    )
+
+    assert client.openid_configuration is openid_configuration_response
+    assert (
+        client.openid_configuration_endpoint
+        == "https://example.fief.dev/.well-known/openid-configuration"
+    )
+    assert client.authorize_endpoint == "https://example.fief.dev/authorize"
+
+
+def test_openid_warmup_endpoints_without_userinfo():
+    openid_configuration = {**openid_configuration_response}
+    del openid_configuration["userinfo_endpoint"]
+    client = OpenID(
+        "CLIENT_ID",
+        "CLIENT_SECRET",
+        "https://example.fief.dev/.well-known/openid-configuration",
+        openid_configuration=openid_configuration,
+    )
+
+    assert "https://example.fief.dev/api/userinfo" not in client.get_warmup_endpoints()
+
+
+def test_get_openid_configuration_endpoint():
+    assert (
+        OpenID.get_openid_configuration_endpoint(
+            client_id="CLIENT_ID",
+            openid_configuration_endpoint="https://example.fief.dev/.well-known/openid-configuration",
+        )
+        == "https://example.fief.dev/.well-known/openid-configuration"
+    )
+
+
+def test_openid_set_openid_configuration(client: OpenID):
+    new_configuration = {
+        **openid_configuration_response,
+        "token_endpoint": "https://example.fief.dev/api/v2/token",
+        "grant_types_supported": ["authorization_code"],
+        "revocation_endpoint": "https://example.fief.dev/api/revoke",
+    }
+    client.set_openid_configuration(new_configuration)
+
+    assert client.openid_configuration is new_configuration
+    assert client.access_token_endpoint == "https://example.fief.dev/api/v2/token"
+    assert client.refresh_token_endpoint is None
+    assert client.revoke_token_endpoint == "https://example.fief.dev/api/revoke"
+    assert client.revocation_endpoint_auth_method == "client_secret_basic"
 
 
 userinfo_response = {"sub": 42, "email": "arthur@camelot.bt"}
@@ -118,3 +241,133 @@ class TestOpenIdGetIdEmail:
             await client.get_id_email("TOKEN")
 
         assert isinstance(excinfo.value.response, Response)
+
+
+@pytest.mark.asyncio
+class TestOpenIDConfigurationRefresh:
+    @respx.mock
+    async def test_refresh_openid_configuration(self, client: OpenID):
+        respx.get("https://example.fief.dev/.well-known/openid-configuration").mock(
+            return_value=Response(
+                200,
+                json={
+                    **openid_configuration_response,
+                    "token_endpoint": "https://example.fief.dev/api/v2/token",
+                },
+            )
+        )
+
+        openid_configuration = await client.refresh_openid_configuration()
+        assert client.openid_configuration is openid_configuration
+        assert client.access_token_endpoint == "https://example.fief.dev/api/v2/token"
+
+    @respx.mock
+    async def test_refresh_openid_configuration_invalid_json(self, client: OpenID):
+        respx.get("https://example.fief.dev/.well-known/openid-configuration").mock(
+            return_value=Response(200, content=b"NOT JSON")
+        )
+
+        with pytest.raises(OpenIDConfigurationError) as excinfo:
+            await client.refresh_openid_configuration()
+        assert isinstance(excinfo.value.response, Response)
+        assert client.access_token_endpoint == "https://example.fief.dev/api/token"
+
+    @pytest.mark.parametrize("content", [b"[]", b'"NOT AN OBJECT"', b"null"])
+    @respx.mock
+    async def test_refresh_openid_configuration_not_object(
+        self, client: OpenID, content: bytes
+    ):
+        respx.get("https://example.fief.dev/.well-known/openid-configuration").mock(
+            return_value=Response(200, content=content)
+        )
+
+        with pytest.raises(OpenIDConfigurationError) as excinfo:
+            await client.refresh_openid_configuration()
+        assert isinstance(excinfo.value.response, Response)
+        assert client.access_token_endpoint == "https://example.fief.dev/api/token"
+
+    @respx.mock
+    async def test_refresh_openid_configuration_invalid(self, client: OpenID):
+        respx.get("https://example.fief.dev/.well-known/openid-configuration").mock(
+            return_value=Response(200, json={"issuer": "https://example.fief.dev"})
+        )
+
+        with pytest.raises(OpenIDConfigurationError):
+            await client.refresh_openid_configuration()
+        assert client.access_token_endpoint == "https://example.fief.dev/api/token"
+
+    @respx.mock
+    async def test_background_refresh(self):
+        route = respx.get(
+            "https://example.fief.dev/.well-known/openid-configuration"
+        ).mock(
+            side_effect=lambda request: (
+                Response(500)
+                if route.call_count == 0
+                else Response(200, json=["NOT", "AN", "OBJECT"])
+                if route.call_count == 1
+                else Response(
+                    200,
+                    json={
+                        **openid_configuration_response,
+                        "token_endpoint": "https://example.fief.dev/api/v2/token",
+                    },
+                )
+            )
+        )
+        client = OpenID(
+            "CLIENT_ID",
+            "CLIENT_SECRET",
+            "https://example.fief.dev/.well-known/openid-configuration",
+            openid_configuration=openid_configuration_response,
+            discovery_refresh_interval=0.01,
+        )
+
+        async with client:
+            task = client._discovery_refresh_task
+            assert task is not None
+            await client.open()
+            assert client._discovery_refresh_task is task
+            while route.call_count < 4:
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.01)
+            assert (
+                client.access_token_endpoint == "https://example.fief.dev/api/v2/token"
+            )
+
+        assert client._discovery_refresh_task is None
+        assert task.cancelled()
+
+    async def test_no_background_refresh(self, client: OpenID):
+        async with client:
+            assert client._discovery_refresh_task is None
+
+    @respx.mock
+    async def test_validate_openid_configuration(self):
+        route = respx.get(
+            "https://example.fief.dev/.well-known/openid-configuration"
+        ).mock(
+            return_value=Response(
+                200,
+                json={
+                    **openid_configuration_response,
+                    "token_endpoint": "https://example.fief.dev/api/v2/token",
+                },
+            )
+        )
+        client = OpenID(
+            "CLIENT_ID",
+            "CLIENT_SECRET",
+            "https://example.fief.dev/.well-known/openid-configuration",
+            openid_configuration=openid_configuration_response,
+            validate_openid_configuration=True,
+        )
+
+        async with client:
+            task = client._discovery_refresh_task
+            assert task is not None
+            await task
+            assert route.call_count == 1
+            assert (
+                client.access_token_endpoint == "https://example.fief.dev/api/v2/token"
+            )
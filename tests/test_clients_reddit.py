@@ -55,6 +55,7 @@ def test_reddit_defaults():
     assert client.revoke_token_endpoint == "https://www.reddit.com/api/v1/revoke_token"
     assert client.base_scopes == ["identity"]
     assert client.name == "reddit"
+    assert client.get_warmup_endpoints()[-1] == "https://oauth.reddit.com/api/v1/me"
 
 
 @pytest.mark.asyncio
@@ -124,6 +125,8 @@ class TestRedditGetAccessToken:
             )
 
         assert isinstance(excinfo.value.message, str)
+        assert excinfo.value.error == "invalid_grant"
+        assert excinfo.value.requires_reauthorization is True
 
 
 @pytest.mark.asyncio
@@ -21,6 +21,31 @@ def test_shopify_oauth2():
     assert client.revoke_token_endpoint is None
     assert client.base_scopes == ["read_orders"]
     assert client.name == "shopify"
+    assert client.get_warmup_endpoints()[-1] == client.profile_endpoint
+
+
+def test_shopify_oauth2_for_tenant():
+    shop_client = client.for_tenant("other-shop")
+
+    assert shop_client is not client
+    assert shop_client.shop == "other-shop"
+    assert (
+        shop_client.authorize_endpoint
+        == "https://other-shop.myshopify.com/admin/oauth/authorize"
+    )
+    assert (
+        shop_client.access_token_endpoint
+        == "https://other-shop.myshopify.com/admin/oauth/access_token"
+    )
+    assert (
+        shop_client.profile_endpoint
+        == f"https://other-shop.myshopify.com/admin/api/{client.api_version}/shop.json"
+    )
+    assert client.shop == "my-shop"
+    assert (
+        client.authorize_endpoint
+        == "https://my-shop.myshopify.com/admin/oauth/authorize"
+    )
 
 
 profile_response = {
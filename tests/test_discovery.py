@@ -0,0 +1,229 @@
+import asyncio
+
+import pytest
+import respx
+from httpx import AsyncClient, HTTPError, Response
+
+from httpx_oauth.clients.openid import OpenIDConfigurationError
+from httpx_oauth.discovery import OpenIDDiscoveryCache, OpenIDRegistry
+from httpx_oauth.jwks import JWKSCache
+
+ISSUER = "https://example.fief.dev"
+OPENID_CONFIGURATION_ENDPOINT = f"{ISSUER}/.well-known/openid-configuration"
+JWKS_URI = f"{ISSUER}/.well-known/jwks.json"
+KEY = {"kty": "RSA", "kid": "KEY", "n": "N", "e": "AQAB"}
+
+
+def get_openid_configuration(token_endpoint: str = f"{ISSUER}/api/token"):
+    return {
+        "issuer": ISSUER,
+        "authorization_endpoint": f"{ISSUER}/authorize",
+        "token_endpoint": token_endpoint,
+        "userinfo_endpoint": f"{ISSUER}/api/userinfo",
+        "jwks_uri": JWKS_URI,
+    }
+
+
+@pytest.mark.asyncio
+class TestOpenIDDiscoveryCache:
+    @respx.mock
+    async def test_get(self):
+        route = respx.get(OPENID_CONFIGURATION_ENDPOINT).mock(
+            return_value=Response(200, json=get_openid_configuration())
+        )
+        cache = OpenIDDiscoveryCache()
+
+        configurations = await asyncio.gather(
+            *(cache.get(OPENID_CONFIGURATION_ENDPOINT, AsyncClient) for _ in range(5))
+        )
+        assert all(c is configurations[0] for c in configurations)
+        assert (
+            await cache.get(OPENID_CONFIGURATION_ENDPOINT, AsyncClient)
+            is configurations[0]
+        )
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_get_stale(self):
+        route = respx.get(OPENID_CONFIGURATION_ENDPOINT).mock(
+            side_effect=[
+                Response(200, json=get_openid_configuration()),
+                Response(200, json=get_openid_configuration(f"{ISSUER}/api/v2/token")),
+            ]
+        )
+        cache = OpenIDDiscoveryCache(ttl=0)
+
+        first = await cache.get(OPENID_CONFIGURATION_ENDPOINT, AsyncClient)
+        stale = await cache.get(OPENID_CONFIGURATION_ENDPOINT, AsyncClient)
+        assert stale is first
+
+        while route.call_count < 2:
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+        cache.ttl = 3600
+        refreshed = await cache.get(OPENID_CONFIGURATION_ENDPOINT, AsyncClient)
+        assert refreshed["token_endpoint"] == f"{ISSUER}/api/v2/token"
+
+    @respx.mock
+    async def test_get_expired(self):
+        route = respx.get(OPENID_CONFIGURATION_ENDPOINT).mock(
+            return_value=Response(200, json=get_openid_configuration())
+        )
+        cache = OpenIDDiscoveryCache(ttl=0, max_stale=0)
+
+        first = await cache.get(OPENID_CONFIGURATION_ENDPOINT, AsyncClient)
+        second = await cache.get(OPENID_CONFIGURATION_ENDPOINT, AsyncClient)
+        assert first is not second
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_get_error(self):
+        respx.get(OPENID_CONFIGURATION_ENDPOINT).mock(
+            return_value=Response(400, json={"error": "message"})
+        )
+        cache = OpenIDDiscoveryCache()
+
+        with pytest.raises(OpenIDConfigurationError) as excinfo:
+            await cache.get(OPENID_CONFIGURATION_ENDPOINT, AsyncClient)
+        assert isinstance(excinfo.value.response, Response)
+
+    @respx.mock
+    async def test_get_http_error(self):
+        respx.get(OPENID_CONFIGURATION_ENDPOINT).mock(side_effect=HTTPError("ERROR"))
+        cache = OpenIDDiscoveryCache()
+
+        with pytest.raises(OpenIDConfigurationError):
+            await cache.get(OPENID_CONFIGURATION_ENDPOINT, AsyncClient)
+
+    async def test_set_clear(self):
+        cache = OpenIDDiscoveryCache()
+        openid_configuration = get_openid_configuration()
+
+        cache.set(OPENID_CONFIGURATION_ENDPOINT, openid_configuration)
+        assert (
+            await cache.get(OPENID_CONFIGURATION_ENDPOINT, AsyncClient)
+            is openid_configuration
+        )
+
+        cache.clear()
+        with respx.mock:
+            respx.get(OPENID_CONFIGURATION_ENDPOINT).mock(
+                return_value=Response(200, json=get_openid_configuration())
+            )
+            assert (
+                await cache.get(OPENID_CONFIGURATION_ENDPOINT, AsyncClient)
+                is not openid_configuration
+            )
+
+
+@pytest.fixture
+def registry() -> OpenIDRegistry:
+    registry = OpenIDRegistry(discovery_cache=OpenIDDiscoveryCache())
+    registry.register(ISSUER, "CLIENT_ID", "CLIENT_SECRET")
+    return registry
+
+
+def test_registry_register(registry: OpenIDRegistry):
+    assert ISSUER in registry
+    assert len(registry) == 1
+
+    registry.unregister(ISSUER)
+    assert ISSUER not in registry
+    assert len(registry) == 0
+
+
+@pytest.mark.asyncio
+class TestOpenIDRegistry:
+    @respx.mock
+    async def test_get(self, registry: OpenIDRegistry):
+        route = respx.get(OPENID_CONFIGURATION_ENDPOINT).mock(
+            return_value=Response(200, json=get_openid_configuration())
+        )
+
+        clients = await asyncio.gather(*(registry.get(ISSUER) for _ in range(5)))
+        client = clients[0]
+        assert all(c is client for c in clients)
+        assert client.client_id == "CLIENT_ID"
+        assert client.access_token_endpoint == f"{ISSUER}/api/token"
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_get_custom_endpoint(self, registry: OpenIDRegistry):
+        endpoint = f"{ISSUER}/tenant/.well-known/openid-configuration"
+        route = respx.get(endpoint).mock(
+            return_value=Response(200, json=get_openid_configuration())
+        )
+        registry.register(
+            ISSUER, "CLIENT_ID", "CLIENT_SECRET", openid_configuration_endpoint=endpoint
+        )
+
+        client = await registry.get(ISSUER)
+        assert client.openid_configuration_endpoint == endpoint
+        assert route.call_count == 1
+
+    async def test_get_not_registered(self, registry: OpenIDRegistry):
+        with pytest.raises(KeyError):
+            await registry.get("https://unknown.fief.dev")
+
+    async def test_get_refreshed_configuration(self, registry: OpenIDRegistry):
+        registry.discovery_cache.set(
+            OPENID_CONFIGURATION_ENDPOINT, get_openid_configuration()
+        )
+        client = await registry.get(ISSUER)
+
+        registry.discovery_cache.set(
+            OPENID_CONFIGURATION_ENDPOINT,
+            get_openid_configuration(f"{ISSUER}/api/v2/token"),
+        )
+        assert await registry.get(ISSUER) is client
+        assert client.access_token_endpoint == f"{ISSUER}/api/v2/token"
+
+    @respx.mock
+    async def test_get_jwk(self, registry: OpenIDRegistry):
+        registry.jwks_cache = JWKSCache()
+        registry.discovery_cache.set(
+            OPENID_CONFIGURATION_ENDPOINT, get_openid_configuration()
+        )
+        respx.get(JWKS_URI).mock(return_value=Response(200, json={"keys": [KEY]}))
+
+        assert await registry.get_jwk(ISSUER, "KEY") == KEY
+
+    async def test_rotate_client_secret(self, registry: OpenIDRegistry):
+        registry.discovery_cache.set(
+            OPENID_CONFIGURATION_ENDPOINT, get_openid_configuration()
+        )
+        registry.rotate_client_secret(ISSUER, "NOT_BUILT_SECRET")
+        client = await registry.get(ISSUER)
+        assert client.client_secret == "NOT_BUILT_SECRET"
+
+        registry.rotate_client_secret(ISSUER, "NEW_SECRET", overlap=60)
+        assert await registry.get(ISSUER) is client
+        assert client.client_secret == "NEW_SECRET"
+
+        registry.unregister(ISSUER)
+        registry.register(ISSUER, "CLIENT_ID", "CLIENT_SECRET")
+        registry.rotate_client_secret(ISSUER, "NEW_SECRET")
+        assert (await registry.get(ISSUER)).client_secret == "NEW_SECRET"
+
+        with pytest.raises(KeyError):
+            registry.rotate_client_secret("https://unknown.fief.dev", "NEW_SECRET")
+
+    async def test_shared_pool(self, registry: OpenIDRegistry):
+        registry.discovery_cache.set(
+            OPENID_CONFIGURATION_ENDPOINT, get_openid_configuration()
+        )
+
+        async with registry as opened_registry:
+            assert opened_registry is registry
+            await registry.open()
+            client = await registry.get(ISSUER)
+            assert client.is_open is True
+            async with registry.get_httpx_client() as httpx_client_1:
+                pass
+            async with client.get_httpx_client() as httpx_client_2:
+                pass
+            assert httpx_client_1 is httpx_client_2
+
+        assert client.is_open is False
+        assert httpx_client_1.is_closed
+        await registry.aclose()
@@ -0,0 +1,347 @@
+import asyncio
+import socket
+import ssl
+import typing
+
+import httpcore
+import httpx
+import pytest
+
+from httpx_oauth.dns import (
+    DNSCache,
+    DNSCacheNetworkBackend,
+    DNSCacheTransport,
+    DNSRecord,
+    SystemResolver,
+)
+from httpx_oauth.oauth2 import OAuth2
+from httpx_oauth.tls import default_ssl_context
+
+
+class FakeResolver:
+    def __init__(self, records: dict[str, DNSRecord]) -> None:
+        self.records = records
+        self.calls: list[str] = []
+
+    async def resolve(self, host: str) -> DNSRecord:
+        self.calls.append(host)
+        await asyncio.sleep(0)
+        try:
+            return self.records[host]
+        except KeyError as e:
+            message = f"Unknown host {host}"
+            raise OSError(message) from e
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeNetworkBackend(httpcore.AsyncNetworkBackend):
+    def __init__(self, unreachable: set[str] | None = None) -> None:
+        self.unreachable = unreachable or set()
+        self.connections: list[tuple[str, int]] = []
+        self.slept: list[float] = []
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: typing.Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        self.connections.append((host, port))
+        if host in self.unreachable:
+            message = f"{host} is unreachable"
+            raise httpcore.ConnectError(message)
+        return httpcore.AsyncMockStream([])
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: typing.Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        self.connections.append((path, 0))
+        return httpcore.AsyncMockStream([])
+
+    async def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+
+
+@pytest.fixture
+def resolver() -> FakeResolver:
+    return FakeResolver(
+        {
+            "provider.test": DNSRecord(["10.0.0.1", "10.0.0.2"], None),
+            "short.test": DNSRecord(["10.0.0.3"], 10),
+            "volatile.test": DNSRecord(["10.0.0.4"], 0),
+            "empty.test": DNSRecord([], None),
+        }
+    )
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def dns_cache(resolver: FakeResolver, clock: FakeClock) -> DNSCache:
+    return DNSCache(resolver, ttl=60, clock=clock)
+
+
+@pytest.mark.asyncio
+class TestDNSCache:
+    async def test_cached(self, dns_cache: DNSCache, resolver: FakeResolver):
+        assert await dns_cache.resolve("provider.test") == ["10.0.0.1", "10.0.0.2"]
+        assert await dns_cache.resolve("provider.test") == ["10.0.0.1", "10.0.0.2"]
+        assert resolver.calls == ["provider.test"]
+        assert len(dns_cache) == 1
+
+    async def test_ip_address(self, dns_cache: DNSCache, resolver: FakeResolver):
+        assert await dns_cache.resolve("127.0.0.1") == ["127.0.0.1"]
+        assert await dns_cache.resolve("::1") == ["::1"]
+        assert resolver.calls == []
+
+    async def test_default_ttl(
+        self, dns_cache: DNSCache, resolver: FakeResolver, clock: FakeClock
+    ):
+        await dns_cache.resolve("provider.test")
+
+        clock.now = 60
+        resolver.records["provider.test"] = DNSRecord(["10.0.0.5"], None)
+        assert await dns_cache.resolve("provider.test") == ["10.0.0.5"]
+        assert resolver.calls == ["provider.test", "provider.test"]
+
+    async def test_resolver_ttl(
+        self, dns_cache: DNSCache, resolver: FakeResolver, clock: FakeClock
+    ):
+        await dns_cache.resolve("short.test")
+
+        clock.now = 7
+        await dns_cache.resolve("short.test")
+        assert resolver.calls == ["short.test"]
+
+        clock.now = 10
+        await dns_cache.resolve("short.test")
+        assert resolver.calls == ["short.test", "short.test"]
+
+    async def test_zero_ttl(self, dns_cache: DNSCache, resolver: FakeResolver):
+        await dns_cache.resolve("volatile.test")
+        await dns_cache.resolve("volatile.test")
+        assert resolver.calls == ["volatile.test", "volatile.test"]
+        assert len(dns_cache) == 0
+
+    async def test_background_refresh(
+        self, dns_cache: DNSCache, resolver: FakeResolver, clock: FakeClock
+    ):
+        await dns_cache.resolve("provider.test")
+
+        clock.now = 50
+        resolver.records["provider.test"] = DNSRecord(["10.0.0.5"], None)
+        assert await dns_cache.resolve("provider.test") == ["10.0.0.1", "10.0.0.2"]
+        assert await dns_cache.resolve("provider.test") == ["10.0.0.1", "10.0.0.2"]
+
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert resolver.calls == ["provider.test", "provider.test"]
+
+        clock.now = 100
+        assert await dns_cache.resolve("provider.test") == ["10.0.0.5"]
+        assert len(resolver.calls) == 2
+
+    async def test_background_refresh_error(
+        self, dns_cache: DNSCache, resolver: FakeResolver, clock: FakeClock
+    ):
+        await dns_cache.resolve("provider.test")
+
+        clock.now = 50
+        del resolver.records["provider.test"]
+        assert await dns_cache.resolve("provider.test") == ["10.0.0.1", "10.0.0.2"]
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert await dns_cache.resolve("provider.test") == ["10.0.0.1", "10.0.0.2"]
+
+    async def test_coalesced(self, dns_cache: DNSCache, resolver: FakeResolver):
+        results = await asyncio.gather(
+            *(dns_cache.resolve("provider.test") for _ in range(5))
+        )
+        assert results == [["10.0.0.1", "10.0.0.2"]] * 5
+        assert resolver.calls == ["provider.test"]
+
+    async def test_unknown_host(self, dns_cache: DNSCache):
+        with pytest.raises(OSError, match="Unknown host unknown.test"):
+            await dns_cache.resolve("unknown.test")
+
+    async def test_no_address(self, dns_cache: DNSCache):
+        with pytest.raises(OSError, match="No address found for empty.test"):
+            await dns_cache.resolve("empty.test")
+        assert len(dns_cache) == 0
+
+    async def test_invalidate(self, dns_cache: DNSCache, resolver: FakeResolver):
+        await dns_cache.resolve("provider.test")
+        await dns_cache.resolve("short.test")
+
+        dns_cache.invalidate("provider.test")
+        assert len(dns_cache) == 1
+
+        dns_cache.invalidate()
+        assert len(dns_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_system_resolver():
+    dns_cache = DNSCache()
+    assert isinstance(dns_cache.resolver, SystemResolver)
+
+    record = await dns_cache.resolver.resolve("localhost")
+    assert record.addresses
+    assert record.ttl is None
+
+
+@pytest.mark.asyncio
+class TestDNSCacheNetworkBackend:
+    async def test_connect_tcp(self, dns_cache: DNSCache):
+        backend = FakeNetworkBackend()
+        network_backend = DNSCacheNetworkBackend(dns_cache, backend)
+
+        await network_backend.connect_tcp("provider.test", 443)
+        assert backend.connections == [("10.0.0.1", 443)]
+
+    async def test_fallback_address(self, dns_cache: DNSCache):
+        backend = FakeNetworkBackend({"10.0.0.1"})
+        network_backend = DNSCacheNetworkBackend(dns_cache, backend)
+
+        await network_backend.connect_tcp("provider.test", 443)
+        assert backend.connections == [("10.0.0.1", 443), ("10.0.0.2", 443)]
+
+    async def test_all_addresses_unreachable(self, dns_cache: DNSCache):
+        backend = FakeNetworkBackend({"10.0.0.1", "10.0.0.2"})
+        network_backend = DNSCacheNetworkBackend(dns_cache, backend)
+
+        with pytest.raises(httpcore.ConnectError, match="10.0.0.2 is unreachable"):
+            await network_backend.connect_tcp("provider.test", 443)
+
+    async def test_resolution_error(self, dns_cache: DNSCache):
+        backend = FakeNetworkBackend()
+        network_backend = DNSCacheNetworkBackend(dns_cache, backend)
+
+        with pytest.raises(httpcore.ConnectError, match="Unknown host unknown.test"):
+            await network_backend.connect_tcp("unknown.test", 443)
+        assert backend.connections == []
+
+    async def test_delegated_methods(self, dns_cache: DNSCache):
+        backend = FakeNetworkBackend()
+        network_backend = DNSCacheNetworkBackend(dns_cache, backend)
+
+        await network_backend.connect_unix_socket("/tmp/provider.sock")
+        await network_backend.sleep(1.0)
+        assert backend.connections == [("/tmp/provider.sock", 0)]
+        assert backend.slept == [1.0]
+
+    async def test_default_backend(self, dns_cache: DNSCache):
+        network_backend = DNSCacheNetworkBackend(dns_cache)
+        assert isinstance(network_backend._backend, httpcore.AnyIOBackend)
+
+
+@pytest.mark.asyncio
+async def test_transport(resolver: FakeResolver):
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: close\r\n\r\nOK"
+        )
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    resolver.records["provider.test"] = DNSRecord(["127.0.0.1"], None)
+    dns_cache = DNSCache(resolver)
+
+    async with server:
+        async with httpx.AsyncClient(transport=DNSCacheTransport(dns_cache)) as client:
+            response = await client.get(f"http://provider.test:{port}/")
+            await client.get(f"http://provider.test:{port}/")
+
+    assert response.text == "OK"
+    assert response.request.headers["Host"] == f"provider.test:{port}"
+    assert resolver.calls == ["provider.test"]
+
+
+def test_transport_pool(dns_cache: DNSCache):
+    ssl_context = ssl.create_default_context()
+    transport = DNSCacheTransport(
+        dns_cache,
+        verify=ssl_context,
+        http2=True,
+        limits=httpx.Limits(max_connections=10),
+    )
+
+    pool = transport._pool
+    assert isinstance(pool, httpcore.AsyncConnectionPool)
+    assert pool._ssl_context is ssl_context
+    assert pool._max_connections == 10
+    assert pool._http2 is True
+    assert isinstance(pool._network_backend, DNSCacheNetworkBackend)
+    assert pool._network_backend.dns_cache is dns_cache
+
+
+def test_transport_pool_options(dns_cache: DNSCache):
+    socket_options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    transport = DNSCacheTransport(
+        dns_cache,
+        uds="/tmp/provider.sock",
+        local_address="0.0.0.0",
+        socket_options=socket_options,
+    )
+
+    pool = transport._pool
+    assert pool._uds == "/tmp/provider.sock"
+    assert pool._local_address == "0.0.0.0"
+    assert pool._socket_options == socket_options
+
+
+@pytest.mark.asyncio
+class TestTransportErrors:
+    async def test_mapped(self, dns_cache: DNSCache):
+        async with httpx.AsyncClient(transport=DNSCacheTransport(dns_cache)) as client:
+            with pytest.raises(httpx.ConnectError, match="Unknown host unknown.test"):
+                await client.get("http://unknown.test/")
+
+    async def test_not_mapped(self, dns_cache: DNSCache, resolver: FakeResolver):
+        async def resolve(host: str) -> DNSRecord:
+            message = "Unexpected"
+            raise RuntimeError(message)
+
+        resolver.resolve = resolve  # type: ignore[method-assign]
+
+        async with httpx.AsyncClient(transport=DNSCacheTransport(dns_cache)) as client:
+            with pytest.raises(RuntimeError, match="Unexpected"):
+                await client.get("http://provider.test/")
+
+
+class TestCreateHTTPXClient:
+    def test_without_dns_cache(self):
+        client = OAuth2("CLIENT_ID", "CLIENT_SECRET", "AUTHORIZE", "ACCESS_TOKEN")
+        assert client.dns_cache is None
+
+        httpx_client = client.create_httpx_client()
+        assert not isinstance(httpx_client._transport, DNSCacheTransport)
+
+    def test_with_dns_cache(self, dns_cache: DNSCache):
+        client = OAuth2("CLIENT_ID", "CLIENT_SECRET", "AUTHORIZE", "ACCESS_TOKEN")
+        client.dns_cache = dns_cache
+
+        httpx_client = client.create_httpx_client()
+        transport = httpx_client._transport
+        assert isinstance(transport, DNSCacheTransport)
+        assert transport.dns_cache is dns_cache
+        assert transport._pool._ssl_context is default_ssl_context.get()  # type: ignore
+        assert isinstance(transport._pool._network_backend, DNSCacheNetworkBackend)  # type: ignore
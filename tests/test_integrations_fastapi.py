@@ -1,11 +1,38 @@
+import asyncio
+import json
+import time
+from unittest import mock
+
+import jwt
 import pytest
+import respx
+from cryptography.hazmat.primitives.asymmetric import rsa
 from fastapi import Depends, FastAPI
+from httpx import Response
 from pytest_mock import MockerFixture
 from starlette import status
+from starlette.requests import Request
+from starlette.responses import JSONResponse
 from starlette.testclient import TestClient
 
-from httpx_oauth.integrations.fastapi import OAuth2AuthorizeCallback
-from httpx_oauth.oauth2 import GetAccessTokenError, OAuth2
+from httpx_oauth.exceptions import GetIdEmailError
+from httpx_oauth.integrations.fastapi import (
+    IntrospectionBearerTokenValidator,
+    InvalidBearerTokenError,
+    JWTBearerTokenValidator,
+    OAuth2AuthorizeCallback,
+    OAuth2AuthorizeCallbackError,
+    OAuth2BearerToken,
+    get_oauth2_lifespan,
+    get_oauth2_router,
+)
+from httpx_oauth.jwks import JWKSCache, JWKSError
+from httpx_oauth.oauth2 import (
+    GetAccessTokenError,
+    IntrospectTokenError,
+    OAuth2,
+    OAuth2Token,
+)
 
 CLIENT_ID = "CLIENT_ID"
 CLIENT_SECRET = "CLIENT_SECRET"
@@ -13,6 +40,7 @@ AUTHORIZE_ENDPOINT = "https://www.camelot.bt/authorize"
 ACCESS_TOKEN_ENDPOINT = "https://www.camelot.bt/access-token"
 REDIRECT_URL = "https://www.tintagel.bt/callback"
 ROUTE_NAME = "callback"
+STATE_COOKIE_NAME = "oauth2_state_oauth2"
 
 client = OAuth2(CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT)
 oauth2_authorize_callback_route_name = OAuth2AuthorizeCallback(
@@ -138,3 +166,657 @@ class TestOAuth2AuthorizeCallback:
         )
         assert response.status_code == status.HTTP_200_OK
         assert response.json() == ["ACCESS_TOKEN", "STATE"]
+
+
+class TestOAuth2AuthorizeCallbackRedirectURLCache:
+    def test_cached_per_base_url(self, mocker: MockerFixture, patch_async_method):
+        callback = OAuth2AuthorizeCallback(client, route_name=ROUTE_NAME)
+        cached_app = FastAPI()
+
+        @cached_app.get("/authorize")
+        async def authorize(access_token_state=Depends(callback)):
+            return access_token_state
+
+        @cached_app.get("/callback", name="callback")
+        async def callback_route():
+            pass
+
+        patch_async_method(client, "get_access_token", return_value="ACCESS_TOKEN")
+        url_for_spy = mocker.spy(Request, "url_for")
+
+        cached_test_client = TestClient(cached_app)
+        cached_test_client.get("/authorize", params={"code": "CODE"})
+        cached_test_client.get("/authorize", params={"code": "CODE"})
+        assert url_for_spy.call_count == 1
+
+        cached_test_client.get(
+            "https://www.tintagel.bt/authorize", params={"code": "CODE"}
+        )
+        assert url_for_spy.call_count == 2
+        client.get_access_token.assert_called_with(
+            "CODE", "https://www.tintagel.bt/callback", None
+        )
+
+    def test_cache_disabled(self, mocker: MockerFixture, patch_async_method):
+        callback = OAuth2AuthorizeCallback(
+            client, route_name=ROUTE_NAME, cache_redirect_url=False
+        )
+        uncached_app = FastAPI()
+
+        @uncached_app.get("/authorize")
+        async def authorize(access_token_state=Depends(callback)):
+            return access_token_state
+
+        @uncached_app.get("/callback", name="callback")
+        async def callback_route():
+            pass
+
+        patch_async_method(client, "get_access_token", return_value="ACCESS_TOKEN")
+        url_for_spy = mocker.spy(Request, "url_for")
+
+        uncached_test_client = TestClient(uncached_app)
+        uncached_test_client.get("/authorize", params={"code": "CODE"})
+        uncached_test_client.get("/authorize", params={"code": "CODE"})
+        assert url_for_spy.call_count == 2
+
+    @pytest.mark.parametrize("cache_redirect_url", [True, False])
+    def test_precompute_redirect_url(
+        self, mocker: MockerFixture, patch_async_method, cache_redirect_url: bool
+    ):
+        callback = OAuth2AuthorizeCallback(
+            client, route_name=ROUTE_NAME, cache_redirect_url=cache_redirect_url
+        )
+        redirect_url = callback.precompute_redirect_url(app, "http://testserver")
+        assert redirect_url == "http://testserver/callback"
+
+        precomputed_app = FastAPI()
+
+        @precomputed_app.get("/authorize")
+        async def authorize(access_token_state=Depends(callback)):
+            return access_token_state
+
+        @precomputed_app.get("/callback", name="callback")
+        async def callback_route():
+            pass
+
+        patch_async_method(client, "get_access_token", return_value="ACCESS_TOKEN")
+        url_for_spy = mocker.spy(Request, "url_for")
+
+        TestClient(precomputed_app).get("/authorize", params={"code": "CODE"})
+        assert url_for_spy.call_count == (0 if cache_redirect_url else 1)
+        client.get_access_token.assert_called_once_with(
+            "CODE", "http://testserver/callback", None
+        )
+
+
+@pytest.mark.asyncio
+class TestOAuth2AuthorizeCallbackCodeExchange:
+    async def test_concurrent_duplicates(self, mocker: MockerFixture):
+        exchange_event = asyncio.Event()
+
+        async def get_access_token(*args):
+            await exchange_event.wait()
+            return OAuth2Token({"access_token": "ACCESS_TOKEN"})
+
+        get_access_token_mock = mocker.patch.object(
+            client, "get_access_token", side_effect=get_access_token
+        )
+        callback = OAuth2AuthorizeCallback(client, redirect_url=REDIRECT_URL)
+
+        tasks = [
+            asyncio.ensure_future(callback(mocker.Mock(), code="CODE"))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        exchange_event.set()
+        results = await asyncio.gather(*tasks)
+
+        get_access_token_mock.assert_called_once_with("CODE", REDIRECT_URL, None)
+        assert all(result[0] == results[0][0] for result in results)
+        assert results[0][0] is not results[1][0]
+
+    async def test_late_duplicate(self, mocker: MockerFixture):
+        get_access_token_mock = mocker.patch.object(
+            client,
+            "get_access_token",
+            return_value=OAuth2Token({"access_token": "ACCESS_TOKEN"}),
+        )
+        callback = OAuth2AuthorizeCallback(
+            client, redirect_url=REDIRECT_URL, code_exchange_cache_ttl=10
+        )
+
+        access_token_1, _ = await callback(mocker.Mock(), code="CODE")
+        access_token_1["access_token"] = "ALTERED"
+        access_token_2, _ = await callback(mocker.Mock(), code="CODE")
+        assert access_token_2["access_token"] == "ACCESS_TOKEN"
+        get_access_token_mock.assert_called_once()
+
+        await callback(mocker.Mock(), code="CODE", code_verifier="CODE_VERIFIER")
+        await callback(mocker.Mock(), code="OTHER_CODE")
+        assert get_access_token_mock.call_count == 3
+
+    async def test_late_duplicate_not_cached_by_default(self, mocker: MockerFixture):
+        get_access_token_mock = mocker.patch.object(
+            client,
+            "get_access_token",
+            return_value=OAuth2Token({"access_token": "ACCESS_TOKEN"}),
+        )
+        callback = OAuth2AuthorizeCallback(client, redirect_url=REDIRECT_URL)
+
+        await callback(mocker.Mock(), code="CODE")
+        await callback(mocker.Mock(), code="CODE")
+        assert get_access_token_mock.call_count == 2
+
+    async def test_error_not_cached(self, mocker: MockerFixture):
+        get_access_token_mock = mocker.patch.object(
+            client, "get_access_token", side_effect=GetAccessTokenError("ERROR")
+        )
+        callback = OAuth2AuthorizeCallback(client, redirect_url=REDIRECT_URL)
+
+        for _ in range(2):
+            with pytest.raises(OAuth2AuthorizeCallbackError):
+                await callback(mocker.Mock(), code="CODE")
+        assert get_access_token_mock.call_count == 2
+
+
+class TestGetOAuth2Lifespan:
+    def test_lifespan(self):
+        lifespan_client = OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+        lifespan_app = FastAPI(lifespan=get_oauth2_lifespan(lifespan_client))
+
+        with TestClient(lifespan_app):
+            assert lifespan_client.is_open is True
+        assert lifespan_client.is_open is False
+
+    @respx.mock
+    def test_lifespan_warmup(self):
+        lifespan_client = OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+        route = respx.head(ACCESS_TOKEN_ENDPOINT).mock(return_value=Response(405))
+        lifespan_app = FastAPI(
+            lifespan=get_oauth2_lifespan(
+                lifespan_client, warmup_connections=2, keepalive_interval=60
+            )
+        )
+
+        with TestClient(lifespan_app):
+            assert lifespan_client.is_open is True
+            assert route.call_count == 2
+            assert lifespan_client._keepalive_task is not None
+        assert lifespan_client.is_open is False
+        assert lifespan_client._keepalive_task is None
+
+
+def get_login_test_client(
+    router_client: OAuth2, **kwargs
+) -> tuple[TestClient, list[tuple]]:
+    logins: list[tuple] = []
+
+    async def on_login(request, token, id_email):
+        logins.append((token, id_email))
+        return {"token": token, "id_email": id_email}
+
+    login_app = FastAPI()
+    login_app.include_router(
+        get_oauth2_router(router_client, on_login, state_cookie_secure=False, **kwargs),
+        prefix="/auth",
+    )
+    return TestClient(login_app), logins
+
+
+def authorize(login_test_client: TestClient) -> str:
+    response = login_test_client.get("/auth/authorize", follow_redirects=False)
+    assert response.status_code == status.HTTP_307_TEMPORARY_REDIRECT
+    return response.cookies[STATE_COOKIE_NAME]
+
+
+class TestGetOAuth2Router:
+    @pytest.fixture
+    def router_client(self) -> OAuth2:
+        return OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+
+    def test_lifespan(self, router_client: OAuth2):
+        login_test_client, _ = get_login_test_client(router_client)
+        with login_test_client:
+            assert router_client.is_open is True
+        assert router_client.is_open is False
+
+    def test_authorize(self, router_client: OAuth2):
+        login_test_client, _ = get_login_test_client(router_client, scopes=["openid"])
+        response = login_test_client.get("/auth/authorize", follow_redirects=False)
+
+        assert response.status_code == status.HTTP_307_TEMPORARY_REDIRECT
+        location = response.headers["Location"]
+        assert location.startswith(AUTHORIZE_ENDPOINT)
+        assert "scope=openid" in location
+        assert "redirect_uri=http%3A%2F%2Ftestserver%2Fauth%2Fcallback" in location
+        state = response.cookies[STATE_COOKIE_NAME]
+        assert f"state={state}" in location
+
+    def test_state_cookie_per_client(self):
+        async def on_login(request, token, id_email):
+            return {}
+
+        login_app = FastAPI()
+        for name in ["google", "okta:eu"]:
+            client = OAuth2(
+                CLIENT_ID,
+                CLIENT_SECRET,
+                AUTHORIZE_ENDPOINT,
+                ACCESS_TOKEN_ENDPOINT,
+                name=name,
+            )
+            login_app.include_router(
+                get_oauth2_router(client, on_login, state_cookie_secure=False),
+                prefix=f"/auth/{name}",
+            )
+        login_test_client = TestClient(login_app)
+
+        login_test_client.get("/auth/google/authorize", follow_redirects=False)
+        login_test_client.get("/auth/okta:eu/authorize", follow_redirects=False)
+
+        assert "oauth2_state_google" in login_test_client.cookies
+        assert "oauth2_state_okta_eu" in login_test_client.cookies
+
+    def test_state_cookie_name(self, router_client: OAuth2):
+        login_test_client, _ = get_login_test_client(
+            router_client, state_cookie_name="custom_state"
+        )
+        response = login_test_client.get("/auth/authorize", follow_redirects=False)
+
+        assert "custom_state" in response.cookies
+        assert STATE_COOKIE_NAME not in response.cookies
+
+    def test_authorize_redirect_url(self, router_client: OAuth2):
+        login_test_client, _ = get_login_test_client(
+            router_client, redirect_url=REDIRECT_URL
+        )
+        response = login_test_client.get("/auth/authorize", follow_redirects=False)
+
+        assert (
+            "redirect_uri=https%3A%2F%2Fwww.tintagel.bt%2Fcallback"
+            in response.headers["Location"]
+        )
+
+    def test_callback_error(self, router_client: OAuth2):
+        login_test_client, _ = get_login_test_client(router_client)
+        response = login_test_client.get(
+            "/auth/callback", params={"error": "access_denied"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {"detail": "access_denied"}
+
+    @pytest.mark.parametrize(
+        "state,with_cookie",
+        [(None, True), ("INVALID_STATE", True), ("STATE", False)],
+    )
+    def test_callback_invalid_state(
+        self, router_client: OAuth2, state: str | None, with_cookie: bool
+    ):
+        login_test_client, logins = get_login_test_client(router_client)
+        if with_cookie:
+            authorize(login_test_client)
+
+        params = {"code": "CODE"}
+        if state is not None:
+            params["state"] = state
+        response = login_test_client.get("/auth/callback", params=params)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {"detail": "Invalid state"}
+        assert logins == []
+
+    def test_callback(self, router_client: OAuth2, patch_async_method):
+        patch_async_method(
+            router_client, "get_access_token", return_value={"access_token": "TOKEN"}
+        )
+        login_test_client, logins = get_login_test_client(router_client)
+        state = authorize(login_test_client)
+
+        response = login_test_client.get(
+            "/auth/callback", params={"code": "CODE", "state": state}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"token": {"access_token": "TOKEN"}, "id_email": None}
+        assert STATE_COOKIE_NAME not in login_test_client.cookies
+        router_client.get_access_token.assert_called_once_with(
+            "CODE", "http://testserver/auth/callback", None
+        )
+
+    def test_callback_response(self, router_client: OAuth2, patch_async_method):
+        patch_async_method(
+            router_client, "get_access_token", return_value={"access_token": "TOKEN"}
+        )
+
+        async def on_login(request, token, id_email):
+            return JSONResponse({"logged_in": True})
+
+        login_app = FastAPI()
+        login_app.include_router(
+            get_oauth2_router(router_client, on_login, state_cookie_secure=False)
+        )
+        login_test_client = TestClient(login_app)
+        response = login_test_client.get("/authorize", follow_redirects=False)
+        state = response.cookies[STATE_COOKIE_NAME]
+
+        response = login_test_client.get(
+            "/callback", params={"code": "CODE", "state": state}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"logged_in": True}
+        assert STATE_COOKIE_NAME not in login_test_client.cookies
+
+    @pytest.mark.parametrize("concurrent", [True, False])
+    def test_callback_store_token_fetch_id_email(
+        self, router_client: OAuth2, patch_async_method, concurrent: bool
+    ):
+        patch_async_method(
+            router_client, "get_access_token", return_value={"access_token": "TOKEN"}
+        )
+        patch_async_method(
+            router_client,
+            "get_id_email",
+            return_value=("USER_ID", "arthur@camelot.bt"),
+        )
+        stored_tokens = []
+
+        async def store_token(token):
+            stored_tokens.append(token)
+
+        login_test_client, logins = get_login_test_client(
+            router_client,
+            store_token=store_token,
+            fetch_id_email=True,
+            concurrent=concurrent,
+        )
+        state = authorize(login_test_client)
+
+        response = login_test_client.get(
+            "/auth/callback", params={"code": "CODE", "state": state}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert stored_tokens == [{"access_token": "TOKEN"}]
+        assert logins == [({"access_token": "TOKEN"}, ("USER_ID", "arthur@camelot.bt"))]
+        router_client.get_id_email.assert_called_once_with("TOKEN")
+
+    def test_callback_store_token_error_sequential(
+        self, router_client: OAuth2, patch_async_method, mocker: MockerFixture
+    ):
+        patch_async_method(
+            router_client, "get_access_token", return_value={"access_token": "TOKEN"}
+        )
+        get_id_email_mock = mocker.patch.object(router_client, "get_id_email")
+
+        async def store_token(token):
+            raise RuntimeError("STORE_ERROR")
+
+        login_test_client, logins = get_login_test_client(
+            router_client,
+            store_token=store_token,
+            fetch_id_email=True,
+            concurrent=False,
+        )
+        state = authorize(login_test_client)
+
+        with pytest.raises(RuntimeError, match="STORE_ERROR"):
+            login_test_client.get(
+                "/auth/callback", params={"code": "CODE", "state": state}
+            )
+        get_id_email_mock.assert_not_called()
+        assert logins == []
+
+    @pytest.mark.parametrize("concurrent", [True, False])
+    def test_callback_get_id_email_error(
+        self,
+        router_client: OAuth2,
+        patch_async_method,
+        mocker: MockerFixture,
+        concurrent: bool,
+    ):
+        patch_async_method(
+            router_client, "get_access_token", return_value={"access_token": "TOKEN"}
+        )
+        mocker.patch.object(
+            router_client, "get_id_email", side_effect=GetIdEmailError("ERROR")
+        )
+        login_test_client, logins = get_login_test_client(
+            router_client, fetch_id_email=True, concurrent=concurrent
+        )
+        state = authorize(login_test_client)
+
+        response = login_test_client.get(
+            "/auth/callback", params={"code": "CODE", "state": state}
+        )
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert response.json() == {"detail": "ERROR"}
+        assert logins == []
+
+
+JWKS_URI = "https://www.camelot.bt/.well-known/jwks.json"
+INTROSPECTION_ENDPOINT = "https://www.camelot.bt/introspect"
+ISSUER = "https://www.camelot.bt"
+
+private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+public_jwk = {
+    **json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key())),
+    "kid": "KEY",
+}
+
+
+def generate_jwt(claims: dict, kid: str = "KEY") -> str:
+    return jwt.encode(
+        {"iss": ISSUER, "exp": int(time.time()) + 3600, **claims},
+        private_key,
+        algorithm="RS256",
+        headers={"kid": kid},
+    )
+
+
+def get_bearer_test_client(dependency: OAuth2BearerToken) -> TestClient:
+    bearer_app = FastAPI()
+
+    @bearer_app.get("/protected")
+    async def protected(claims=Depends(dependency)):
+        return claims
+
+    return TestClient(bearer_app)
+
+
+class TestOAuth2BearerToken:
+    def test_missing_token(self):
+        validator = mock.AsyncMock()
+        test_client = get_bearer_test_client(OAuth2BearerToken(validator))
+
+        response = test_client.get("/protected")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.headers["WWW-Authenticate"] == "Bearer"
+        validator.assert_not_called()
+
+    def test_valid_token_cached(self):
+        validator = mock.AsyncMock(return_value={"sub": "USER_ID"})
+        test_client = get_bearer_test_client(OAuth2BearerToken(validator))
+
+        for _ in range(2):
+            response = test_client.get(
+                "/protected", headers={"Authorization": "Bearer TOKEN"}
+            )
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json() == {"sub": "USER_ID"}
+
+        validator.assert_awaited_once_with("TOKEN")
+
+    def test_cached_claims_not_shared(self):
+        validator = mock.AsyncMock(return_value={"sub": "USER_ID"})
+        dependency = OAuth2BearerToken(validator)
+        bearer_app = FastAPI()
+
+        @bearer_app.get("/protected")
+        async def protected(claims=Depends(dependency)):
+            response = dict(claims)
+            claims["sub"] = "ALTERED"
+            return response
+
+        test_client = TestClient(bearer_app)
+        for _ in range(3):
+            response = test_client.get(
+                "/protected", headers={"Authorization": "Bearer TOKEN"}
+            )
+            assert response.json() == {"sub": "USER_ID"}
+
+    @pytest.mark.parametrize(
+        "dependency_kwargs,claims",
+        [
+            ({"max_cache_ttl": 0}, {"sub": "USER_ID"}),
+            ({}, {"sub": "USER_ID", "exp": 0}),
+        ],
+    )
+    def test_valid_token_not_cached(self, dependency_kwargs: dict, claims: dict):
+        validator = mock.AsyncMock(return_value=claims)
+        test_client = get_bearer_test_client(
+            OAuth2BearerToken(validator, **dependency_kwargs)
+        )
+
+        for _ in range(2):
+            response = test_client.get(
+                "/protected", headers={"Authorization": "Bearer TOKEN"}
+            )
+            assert response.status_code == status.HTTP_200_OK
+
+        assert validator.await_count == 2
+
+    @pytest.mark.parametrize("negative_cache_ttl,expected_calls", [(30, 1), (0, 2)])
+    def test_invalid_token(self, negative_cache_ttl: float, expected_calls: int):
+        validator = mock.AsyncMock(side_effect=InvalidBearerTokenError("INVALID"))
+        test_client = get_bearer_test_client(
+            OAuth2BearerToken(validator, negative_cache_ttl=negative_cache_ttl)
+        )
+
+        for _ in range(2):
+            response = test_client.get(
+                "/protected", headers={"Authorization": "Bearer TOKEN"}
+            )
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+            assert (
+                response.headers["WWW-Authenticate"] == 'Bearer error="invalid_token"'
+            )
+
+        assert validator.await_count == expected_calls
+
+    @pytest.mark.parametrize(
+        "error", [IntrospectTokenError("ERROR"), JWKSError("ERROR")]
+    )
+    def test_validator_unavailable(self, error: Exception):
+        validator = mock.AsyncMock(side_effect=error)
+        test_client = get_bearer_test_client(OAuth2BearerToken(validator))
+
+        for _ in range(2):
+            response = test_client.get(
+                "/protected", headers={"Authorization": "Bearer TOKEN"}
+            )
+            assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+            assert response.json() == {"detail": "ERROR"}
+
+        assert validator.await_count == 2
+
+
+@pytest.mark.asyncio
+class TestJWTBearerTokenValidator:
+    @pytest.fixture
+    def validator(self) -> JWTBearerTokenValidator:
+        return JWTBearerTokenValidator(
+            client, JWKS_URI, audience="AUDIENCE", issuer=ISSUER, jwks_cache=JWKSCache()
+        )
+
+    @respx.mock
+    async def test_valid(self, validator: JWTBearerTokenValidator):
+        respx.get(JWKS_URI).mock(
+            return_value=Response(200, json={"keys": [public_jwk]})
+        )
+        claims = await validator(generate_jwt({"sub": "USER_ID", "aud": "AUDIENCE"}))
+        assert claims["sub"] == "USER_ID"
+
+    @respx.mock
+    async def test_valid_audience(self):
+        respx.get(JWKS_URI).mock(
+            return_value=Response(200, json={"keys": [public_jwk]})
+        )
+        validator = JWTBearerTokenValidator(
+            client, JWKS_URI, audience="AUDIENCE", jwks_cache=JWKSCache()
+        )
+
+        claims = await validator(generate_jwt({"sub": "USER_ID", "aud": "AUDIENCE"}))
+        assert claims["sub"] == "USER_ID"
+
+        with pytest.raises(InvalidBearerTokenError):
+            await validator(generate_jwt({"sub": "USER_ID", "aud": "OTHER"}))
+
+    async def test_malformed(self, validator: JWTBearerTokenValidator):
+        with pytest.raises(InvalidBearerTokenError):
+            await validator("NOT_A_JWT")
+
+    @respx.mock
+    async def test_unknown_key(self, validator: JWTBearerTokenValidator):
+        respx.get(JWKS_URI).mock(
+            return_value=Response(200, json={"keys": [public_jwk]})
+        )
+        with pytest.raises(InvalidBearerTokenError):
+            await validator(generate_jwt({"sub": "USER_ID"}, kid="UNKNOWN"))
+
+    @pytest.mark.parametrize(
+        "claims",
+        [
+            {"sub": "USER_ID", "aud": "AUDIENCE", "exp": 0},
+            {"sub": "USER_ID", "aud": "AUDIENCE", "iss": "https://evil.bt"},
+            {"sub": "USER_ID"},
+        ],
+    )
+    @respx.mock
+    async def test_invalid_claims(
+        self, validator: JWTBearerTokenValidator, claims: dict
+    ):
+        respx.get(JWKS_URI).mock(
+            return_value=Response(200, json={"keys": [public_jwk]})
+        )
+        with pytest.raises(InvalidBearerTokenError):
+            await validator(generate_jwt(claims))
+
+
+@pytest.mark.asyncio
+class TestIntrospectionBearerTokenValidator:
+    @pytest.fixture
+    def validator(self) -> IntrospectionBearerTokenValidator:
+        return IntrospectionBearerTokenValidator(
+            OAuth2(
+                CLIENT_ID,
+                CLIENT_SECRET,
+                AUTHORIZE_ENDPOINT,
+                ACCESS_TOKEN_ENDPOINT,
+                introspection_endpoint=INTROSPECTION_ENDPOINT,
+            )
+        )
+
+    @respx.mock
+    async def test_active(self, validator: IntrospectionBearerTokenValidator):
+        respx.post(INTROSPECTION_ENDPOINT).mock(
+            return_value=Response(200, json={"active": True, "sub": "USER_ID"})
+        )
+        assert await validator("TOKEN") == {"active": True, "sub": "USER_ID"}
+
+    @respx.mock
+    async def test_inactive(self, validator: IntrospectionBearerTokenValidator):
+        respx.post(INTROSPECTION_ENDPOINT).mock(
+            return_value=Response(200, json={"active": False})
+        )
+        with pytest.raises(InvalidBearerTokenError):
+            await validator("TOKEN")
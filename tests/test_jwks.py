@@ -0,0 +1,195 @@
+import asyncio
+import json
+import time
+
+import pytest
+import respx
+from httpx import AsyncClient, HTTPError, Response
+
+from httpx_oauth.jwks import JWKNotFoundError, JWKSCache, JWKSError
+from httpx_oauth.oauth2 import JSONCodec
+
+JWKS_URI = "https://example.fief.dev/.well-known/jwks.json"
+KEY_1 = {"kty": "RSA", "kid": "KEY_1", "n": "N", "e": "AQAB"}
+KEY_2 = {"kty": "RSA", "kid": "KEY_2", "n": "N", "e": "AQAB"}
+
+
+@pytest.mark.asyncio
+class TestJWKSCache:
+    @respx.mock
+    async def test_get_key(self):
+        route = respx.get(JWKS_URI).mock(
+            return_value=Response(200, json={"keys": [KEY_1, KEY_2]})
+        )
+        cache = JWKSCache()
+
+        assert await cache.get_key(JWKS_URI, "KEY_1", AsyncClient) == KEY_1
+        assert await cache.get_key(JWKS_URI, "KEY_2", AsyncClient) == KEY_2
+
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_get_key_without_kid(self):
+        respx.get(JWKS_URI).mock(return_value=Response(200, json={"keys": [KEY_1]}))
+        cache = JWKSCache()
+
+        assert await cache.get_key(JWKS_URI, None, AsyncClient) == KEY_1
+
+    @respx.mock
+    async def test_get_key_without_kid_several_keys(self):
+        respx.get(JWKS_URI).mock(
+            return_value=Response(200, json={"keys": [KEY_1, KEY_2]})
+        )
+        cache = JWKSCache()
+
+        with pytest.raises(JWKNotFoundError):
+            await cache.get_key(JWKS_URI, None, AsyncClient)
+
+    @respx.mock
+    async def test_get_key_rotated(self):
+        route = respx.get(JWKS_URI).mock(
+            side_effect=[
+                Response(200, json={"keys": [KEY_1]}),
+                Response(200, json={"keys": [KEY_1, KEY_2]}),
+            ]
+        )
+        cache = JWKSCache(min_refresh_interval=0)
+
+        assert await cache.get_key(JWKS_URI, "KEY_1", AsyncClient) == KEY_1
+        assert await cache.get_key(JWKS_URI, "KEY_2", AsyncClient) == KEY_2
+
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_get_key_unknown_min_refresh_interval(self):
+        route = respx.get(JWKS_URI).mock(
+            return_value=Response(200, json={"keys": [KEY_1]})
+        )
+        cache = JWKSCache()
+
+        with pytest.raises(JWKNotFoundError):
+            await cache.get_key(JWKS_URI, "KEY_2", AsyncClient)
+        with pytest.raises(JWKNotFoundError):
+            await cache.get_key(JWKS_URI, "KEY_2", AsyncClient)
+
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_fetch_status_error(self):
+        respx.get(JWKS_URI).mock(return_value=Response(500))
+        cache = JWKSCache()
+
+        with pytest.raises(JWKSError) as excinfo:
+            await cache.fetch(JWKS_URI, AsyncClient)
+        assert isinstance(excinfo.value.response, Response)
+
+    @respx.mock
+    async def test_fetch_http_error(self):
+        respx.get(JWKS_URI).mock(side_effect=HTTPError("ERROR"))
+        cache = JWKSCache()
+
+        with pytest.raises(JWKSError) as excinfo:
+            await cache.fetch(JWKS_URI, AsyncClient)
+        assert excinfo.value.response is None
+
+    @pytest.mark.parametrize(
+        "response", [Response(200, text="NOT JSON"), Response(200, json=[])]
+    )
+    @respx.mock
+    async def test_fetch_invalid(self, response: Response):
+        respx.get(JWKS_URI).mock(return_value=response)
+        cache = JWKSCache()
+
+        with pytest.raises(JWKSError):
+            await cache.fetch(JWKS_URI, AsyncClient)
+
+    @respx.mock
+    async def test_clear(self):
+        route = respx.get(JWKS_URI).mock(
+            return_value=Response(200, json={"keys": [KEY_1]})
+        )
+        cache = JWKSCache()
+
+        await cache.get_key(JWKS_URI, "KEY_1", AsyncClient)
+        cache.clear()
+        await cache.get_key(JWKS_URI, "KEY_1", AsyncClient)
+
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_get_key_coalesced(self):
+        route = respx.get(JWKS_URI).mock(
+            return_value=Response(200, json={"keys": [KEY_1, KEY_2]})
+        )
+        cache = JWKSCache()
+
+        keys = await asyncio.gather(
+            *(cache.get_key(JWKS_URI, "KEY_1", AsyncClient) for _ in range(5))
+        )
+        assert keys == [KEY_1] * 5
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_get_key_stale(self, mocker):
+        route = respx.get(JWKS_URI).mock(
+            side_effect=[
+                Response(200, json={"keys": [KEY_1]}),
+                Response(200, json={"keys": [KEY_2]}),
+            ]
+        )
+        cache = JWKSCache(ttl=10, max_stale=10)
+        assert await cache.get_key(JWKS_URI, "KEY_1", AsyncClient) == KEY_1
+
+        now = time.monotonic()
+        mocker.patch.object(time, "monotonic", return_value=now + 15)
+        assert await cache.get_key(JWKS_URI, "KEY_1", AsyncClient) == KEY_1
+        assert await cache.get_key(JWKS_URI, "KEY_1", AsyncClient) == KEY_1
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert route.call_count == 2
+        assert await cache.get_key(JWKS_URI, "KEY_2", AsyncClient) == KEY_2
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_get_key_stale_refresh_error(self, mocker):
+        route = respx.get(JWKS_URI).mock(
+            side_effect=[Response(200, json={"keys": [KEY_1]}), Response(500)]
+        )
+        cache = JWKSCache(ttl=10, max_stale=10)
+        assert await cache.get_key(JWKS_URI, "KEY_1", AsyncClient) == KEY_1
+
+        now = time.monotonic()
+        mocker.patch.object(time, "monotonic", return_value=now + 15)
+        assert await cache.get_key(JWKS_URI, "KEY_1", AsyncClient) == KEY_1
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert route.call_count == 2
+        assert await cache.get_key(JWKS_URI, "KEY_1", AsyncClient) == KEY_1
+
+    @respx.mock
+    async def test_get_key_too_stale(self, mocker):
+        route = respx.get(JWKS_URI).mock(
+            side_effect=[
+                Response(200, json={"keys": [KEY_1]}),
+                Response(200, json={"keys": [KEY_2]}),
+            ]
+        )
+        cache = JWKSCache(ttl=10, max_stale=10)
+        assert await cache.get_key(JWKS_URI, "KEY_1", AsyncClient) == KEY_1
+
+        now = time.monotonic()
+        mocker.patch.object(time, "monotonic", return_value=now + 25)
+        with pytest.raises(JWKNotFoundError):
+            await cache.get_key(JWKS_URI, "KEY_1", AsyncClient)
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_json_codec(self, mocker):
+        respx.get(JWKS_URI).mock(return_value=Response(200, json={"keys": [KEY_1]}))
+        loads = mocker.Mock(side_effect=json.loads)
+        cache = JWKSCache(json_codec=JSONCodec(loads))
+
+        assert await cache.get_key(JWKS_URI, "KEY_1", AsyncClient) == KEY_1
+        loads.assert_called_once()
@@ -1,19 +1,34 @@
+import asyncio
+import contextlib
+import json
 import time
 
+import httpx
 import pytest
 import respx
 from httpx import HTTPError, Response
 
+from httpx_oauth._cache import hash_token
+from httpx_oauth.exceptions import GetIdEmailError, GetProfileError
 from httpx_oauth.oauth2 import (
     GetAccessTokenError,
+    HedgingPolicy,
+    HTTPXClientPool,
+    IdEmailResult,
+    IntrospectTokenError,
+    IntrospectTokenNotSupportedError,
+    JSONCodec,
     MissingRevokeTokenAuthMethodError,
     NotSupportedAuthMethodError,
     OAuth2,
+    OAuth2ErrorResponse,
+    OAuth2RequestError,
     OAuth2Token,
     RefreshTokenError,
     RefreshTokenNotSupportedError,
     RevokeTokenError,
     RevokeTokenNotSupportedError,
+    default_json_codec,
 )
 
 CLIENT_ID = "CLIENT_ID"
@@ -23,6 +38,7 @@ ACCESS_TOKEN_ENDPOINT = "https://www.camelot.bt/access-token"
 REDIRECT_URI = "https://www.tintagel.bt/oauth-callback"
 REFRESH_TOKEN_ENDPOINT = "https://www.camelot.bt/refresh"
 REVOKE_TOKEN_ENDPOINT = "https://www.camelot.bt/revoke"
+INTROSPECTION_ENDPOINT = "https://www.camelot.bt/introspect"
 
 
 @pytest.fixture(scope="module", params=["client_secret_basic", "client_secret_post"])
@@ -61,6 +77,145 @@ def client_revoke(request: pytest.FixtureRequest) -> OAuth2:
     )
 
 
+@pytest.fixture(scope="module", params=["client_secret_basic", "client_secret_post"])
+def client_introspect(request: pytest.FixtureRequest) -> OAuth2:
+    return OAuth2(
+        CLIENT_ID,
+        CLIENT_SECRET,
+        AUTHORIZE_ENDPOINT,
+        ACCESS_TOKEN_ENDPOINT,
+        introspection_endpoint=INTROSPECTION_ENDPOINT,
+        introspection_endpoint_auth_method=request.param,
+    )
+
+
+class TestClientCredentials:
+    @pytest.mark.parametrize(
+        "auth_method", ["client_secret_basic", "client_secret_post"]
+    )
+    @pytest.mark.parametrize(
+        "client_id,client_secret",
+        [(CLIENT_ID, CLIENT_SECRET), ("NEW_CLIENT_ID", "NEW_CLIENT_SECRET")],
+    )
+    def test_build_request(self, auth_method, client_id, client_secret):
+        client = OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+        client.client_id = client_id
+        client.client_secret = client_secret
+        assert client.client_id == client_id
+        assert client.client_secret == client_secret
+
+        request, auth = client.build_request(
+            httpx.AsyncClient(),
+            "POST",
+            ACCESS_TOKEN_ENDPOINT,
+            auth_method=auth_method,
+            data={"grant_type": "client_credentials"},
+        )
+
+        assert auth is None
+        content = request.read().decode()
+        if auth_method == "client_secret_basic":
+            expected_auth = httpx.BasicAuth(client_id, client_secret)
+            assert request.headers["Authorization"] == expected_auth._auth_header
+            assert "client_secret" not in content
+        else:
+            assert "Authorization" not in request.headers
+            assert f"client_id={client_id}" in content
+            assert f"client_secret={client_secret}" in content
+
+
+@pytest.mark.asyncio
+class TestRotateClientSecret:
+    @staticmethod
+    def mock_token_endpoint(accepted_secret: str, status_code: int = 401):
+        def handler(request: httpx.Request) -> Response:
+            expected_auth = httpx.BasicAuth(CLIENT_ID, accepted_secret)._auth_header
+            if request.headers.get("Authorization") == expected_auth:
+                return Response(200, json={"access_token": "ACCESS_TOKEN"})
+            return Response(status_code, json={"error": "invalid_client"})
+
+        return respx.post(ACCESS_TOKEN_ENDPOINT).mock(side_effect=handler)
+
+    @pytest.fixture
+    def client(self) -> OAuth2:
+        return OAuth2(
+            CLIENT_ID,
+            CLIENT_SECRET,
+            AUTHORIZE_ENDPOINT,
+            ACCESS_TOKEN_ENDPOINT,
+            token_endpoint_auth_method="client_secret_basic",
+        )
+
+    @respx.mock
+    async def test_new_secret_accepted(self, client: OAuth2):
+        route = self.mock_token_endpoint("NEW_SECRET")
+        credentials = client.credentials
+
+        client.rotate_client_secret("NEW_SECRET", overlap=60)
+        assert client.client_secret == "NEW_SECRET"
+        assert client.credentials is not credentials
+
+        await client.get_access_token("CODE", REDIRECT_URI)
+        assert route.call_count == 1
+
+    @pytest.mark.parametrize("status_code", [400, 401])
+    @respx.mock
+    async def test_overlap_fallback(self, client: OAuth2, status_code: int):
+        route = self.mock_token_endpoint(CLIENT_SECRET, status_code)
+
+        client.rotate_client_secret("NEW_SECRET", overlap=60)
+
+        access_token = await client.get_access_token("CODE", REDIRECT_URI)
+        assert access_token["access_token"] == "ACCESS_TOKEN"
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_no_overlap(self, client: OAuth2):
+        route = self.mock_token_endpoint(CLIENT_SECRET)
+
+        client.rotate_client_secret("NEW_SECRET")
+
+        with pytest.raises(GetAccessTokenError):
+            await client.get_access_token("CODE", REDIRECT_URI)
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_overlap_expired(self, client: OAuth2, mocker):
+        route = self.mock_token_endpoint(CLIENT_SECRET)
+
+        client.rotate_client_secret("NEW_SECRET", overlap=60)
+        mocker.patch.object(time, "monotonic", return_value=time.monotonic() + 61)
+
+        with pytest.raises(GetAccessTokenError):
+            await client.get_access_token("CODE", REDIRECT_URI)
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_other_error(self, client: OAuth2):
+        route = respx.post(ACCESS_TOKEN_ENDPOINT).mock(
+            return_value=Response(400, json={"error": "invalid_grant"})
+        )
+
+        client.rotate_client_secret("NEW_SECRET", overlap=60)
+
+        with pytest.raises(GetAccessTokenError):
+            await client.get_access_token("CODE", REDIRECT_URI)
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_shared_with_copies(self, client: OAuth2):
+        route = self.mock_token_endpoint("NEW_SECRET")
+        copy = client._copy_with(access_token_endpoint=ACCESS_TOKEN_ENDPOINT)
+
+        client.rotate_client_secret("NEW_SECRET")
+        assert copy.client_secret == "NEW_SECRET"
+
+        await copy.get_access_token("CODE", REDIRECT_URI)
+        assert route.call_count == 1
+
+
 def test_not_supported_auth_method() -> None:
     with pytest.raises(NotSupportedAuthMethodError):
         OAuth2(
@@ -72,6 +227,18 @@ def test_not_supported_auth_method() -> None:
         )
 
 
+def test_not_supported_introspection_auth_method() -> None:
+    with pytest.raises(NotSupportedAuthMethodError):
+        OAuth2(
+            CLIENT_ID,
+            CLIENT_SECRET,
+            AUTHORIZE_ENDPOINT,
+            ACCESS_TOKEN_ENDPOINT,
+            introspection_endpoint=INTROSPECTION_ENDPOINT,
+            introspection_endpoint_auth_method="invalid",  # type: ignore
+        )
+
+
 def test_missing_revoke_token_auth_method() -> None:
     with pytest.raises(MissingRevokeTokenAuthMethodError):
         OAuth2(
@@ -281,6 +448,179 @@ class TestRefreshToken:
         assert isinstance(excinfo.value.response, Response)
 
 
+@pytest.mark.asyncio
+class TestGetClientCredentialsToken:
+    @pytest.fixture
+    def client_credentials_client(self) -> OAuth2:
+        return OAuth2(
+            CLIENT_ID,
+            CLIENT_SECRET,
+            AUTHORIZE_ENDPOINT,
+            ACCESS_TOKEN_ENDPOINT,
+            base_scopes=["BASE_SCOPE"],
+            token_endpoint_auth_method="client_secret_basic",
+        )
+
+    @respx.mock
+    async def test_get_client_credentials_token(
+        self, get_respx_call_args, client_credentials_client: OAuth2
+    ):
+        request = respx.post(ACCESS_TOKEN_ENDPOINT).mock(
+            return_value=Response(
+                200, json={"access_token": "ACCESS_TOKEN", "expires_in": 3600}
+            )
+        )
+        access_token = await client_credentials_client.get_client_credentials_token(
+            ["SCOPE1", "SCOPE2"], "AUDIENCE"
+        )
+
+        url, headers, content = await get_respx_call_args(request)
+        assert headers["Authorization"].startswith("Basic ")
+        assert "grant_type=client_credentials" in content
+        assert "scope=SCOPE1+SCOPE2" in content
+        assert "audience=AUDIENCE" in content
+
+        assert type(access_token) is OAuth2Token
+        assert access_token["access_token"] == "ACCESS_TOKEN"
+
+    @respx.mock
+    async def test_base_scopes(
+        self, get_respx_call_args, client_credentials_client: OAuth2
+    ):
+        request = respx.post(ACCESS_TOKEN_ENDPOINT).mock(
+            return_value=Response(200, json={"access_token": "ACCESS_TOKEN"})
+        )
+        await client_credentials_client.get_client_credentials_token()
+
+        url, headers, content = await get_respx_call_args(request)
+        assert "scope=BASE_SCOPE" in content
+        assert "audience" not in content
+
+    @respx.mock
+    async def test_without_scopes(self, get_respx_call_args):
+        client = OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+        request = respx.post(ACCESS_TOKEN_ENDPOINT).mock(
+            return_value=Response(200, json={"access_token": "ACCESS_TOKEN"})
+        )
+        await client.get_client_credentials_token()
+
+        url, headers, content = await get_respx_call_args(request)
+        assert "scope" not in content
+
+    @pytest.mark.parametrize("expires_in", [None, 3600])
+    @respx.mock
+    async def test_cached(
+        self, client_credentials_client: OAuth2, expires_in: int | None
+    ):
+        token_response = {"access_token": "ACCESS_TOKEN"}
+        if expires_in is not None:
+            token_response["expires_in"] = expires_in
+        route = respx.post(ACCESS_TOKEN_ENDPOINT).mock(
+            return_value=Response(200, json=token_response)
+        )
+
+        access_token_1 = await client_credentials_client.get_client_credentials_token(
+            ["SCOPE"]
+        )
+        access_token_2 = await client_credentials_client.get_client_credentials_token(
+            ["SCOPE"]
+        )
+        assert access_token_1 == access_token_2
+        assert access_token_1 is not access_token_2
+        assert route.call_count == 1
+
+        await client_credentials_client.get_client_credentials_token(
+            ["SCOPE"], "AUDIENCE"
+        )
+        assert route.call_count == 2
+
+        await client_credentials_client.get_client_credentials_token(
+            ["SCOPE"], force_refresh=True
+        )
+        assert route.call_count == 3
+
+    @respx.mock
+    async def test_expired(self, client_credentials_client: OAuth2):
+        route = respx.post(ACCESS_TOKEN_ENDPOINT).mock(
+            side_effect=[
+                Response(200, json={"access_token": "TOKEN_1", "expires_in": 0}),
+                Response(200, json={"access_token": "TOKEN_2", "expires_in": 3600}),
+            ]
+        )
+
+        access_token_1 = await client_credentials_client.get_client_credentials_token()
+        access_token_2 = await client_credentials_client.get_client_credentials_token()
+
+        assert access_token_1["access_token"] == "TOKEN_1"
+        assert access_token_2["access_token"] == "TOKEN_2"
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_renewed_ahead_of_expiry(self, client_credentials_client: OAuth2):
+        route = respx.post(ACCESS_TOKEN_ENDPOINT).mock(
+            side_effect=[
+                Response(200, json={"access_token": "TOKEN_1", "expires_in": 30}),
+                Response(200, json={"access_token": "TOKEN_2", "expires_in": 3600}),
+            ]
+        )
+
+        access_token_1 = await client_credentials_client.get_client_credentials_token()
+        access_token_2 = await client_credentials_client.get_client_credentials_token()
+        access_token_3 = await client_credentials_client.get_client_credentials_token()
+        assert access_token_2 == access_token_1
+        assert access_token_3 == access_token_1
+
+        await asyncio.sleep(0)
+        access_token_4 = await client_credentials_client.get_client_credentials_token()
+        assert access_token_4["access_token"] == "TOKEN_2"
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_coalesced(self, client_credentials_client: OAuth2):
+        route = respx.post(ACCESS_TOKEN_ENDPOINT).mock(
+            return_value=Response(200, json={"access_token": "ACCESS_TOKEN"})
+        )
+
+        access_tokens = await asyncio.gather(
+            *(
+                client_credentials_client.get_client_credentials_token()
+                for _ in range(5)
+            )
+        )
+
+        assert all(token == access_tokens[0] for token in access_tokens)
+        assert len({id(token) for token in access_tokens}) == 5
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_cached_token_not_shared(self, client_credentials_client: OAuth2):
+        respx.post(ACCESS_TOKEN_ENDPOINT).mock(
+            return_value=Response(
+                200, json={"access_token": "ACCESS_TOKEN", "expires_in": 3600}
+            )
+        )
+
+        access_token_1 = await client_credentials_client.get_client_credentials_token()
+        access_token_1["access_token"] = "MUTATED"
+
+        access_token_2 = await client_credentials_client.get_client_credentials_token()
+        assert isinstance(access_token_2, OAuth2Token)
+        assert access_token_2["access_token"] == "ACCESS_TOKEN"
+        assert access_token_2["expires_at"] == access_token_1["expires_at"]
+
+    @respx.mock
+    async def test_error(self, load_mock, client_credentials_client: OAuth2):
+        respx.post(ACCESS_TOKEN_ENDPOINT).mock(
+            return_value=Response(400, json=load_mock("error"))
+        )
+
+        with pytest.raises(GetAccessTokenError) as excinfo:
+            await client_credentials_client.get_client_credentials_token()
+        assert isinstance(excinfo.value.response, Response)
+
+
 @pytest.mark.asyncio
 class TestRevokeToken:
     @respx.mock
@@ -331,6 +671,180 @@ class TestRevokeToken:
         assert excinfo.value.response is None
 
 
+@pytest.mark.asyncio
+class TestIntrospectToken:
+    async def test_unsupported_introspect_token(self, client: OAuth2):
+        with pytest.raises(IntrospectTokenNotSupportedError):
+            await client.introspect_token("TOKEN")
+
+    @respx.mock
+    async def test_introspect_token(
+        self, get_respx_call_args, client_introspect: OAuth2
+    ):
+        request = respx.post(INTROSPECTION_ENDPOINT).mock(
+            return_value=Response(200, json={"active": True, "scope": "SCOPE"})
+        )
+        introspection = await client_introspect.introspect_token(
+            "TOKEN", "access_token"
+        )
+
+        url, headers, content = await get_respx_call_args(request)
+        assert headers["Content-Type"] == "application/x-www-form-urlencoded"
+        assert headers["Accept"] == "application/json"
+        assert "token=TOKEN" in content
+        assert "token_type_hint=access_token" in content
+
+        if client_introspect.introspection_endpoint_auth_method == (
+            "client_secret_basic"
+        ):
+            assert headers["Authorization"].startswith("Basic ")
+        else:
+            assert f"client_id={CLIENT_ID}" in content
+            assert f"client_secret={CLIENT_SECRET}" in content
+
+        assert introspection == {"active": True, "scope": "SCOPE"}
+
+    @respx.mock
+    async def test_introspect_token_default_auth_method(self, get_respx_call_args):
+        client = OAuth2(
+            CLIENT_ID,
+            CLIENT_SECRET,
+            AUTHORIZE_ENDPOINT,
+            ACCESS_TOKEN_ENDPOINT,
+            token_endpoint_auth_method="client_secret_basic",
+            introspection_endpoint=INTROSPECTION_ENDPOINT,
+        )
+        request = respx.post(INTROSPECTION_ENDPOINT).mock(
+            return_value=Response(200, json={"active": False})
+        )
+        introspection = await client.introspect_token("TOKEN")
+
+        url, headers, content = await get_respx_call_args(request)
+        assert headers["Authorization"].startswith("Basic ")
+        assert "token_type_hint" not in content
+        assert introspection == {"active": False}
+
+    @respx.mock
+    async def test_introspect_token_error(self, load_mock, client_introspect: OAuth2):
+        respx.post(INTROSPECTION_ENDPOINT).mock(
+            return_value=Response(400, json=load_mock("error"))
+        )
+
+        with pytest.raises(IntrospectTokenError) as excinfo:
+            await client_introspect.introspect_token("ERROR_TOKEN")
+        assert isinstance(excinfo.value.response, Response)
+
+    @respx.mock
+    async def test_introspect_token_cached(self):
+        client = OAuth2(
+            CLIENT_ID,
+            CLIENT_SECRET,
+            AUTHORIZE_ENDPOINT,
+            ACCESS_TOKEN_ENDPOINT,
+            introspection_endpoint=INTROSPECTION_ENDPOINT,
+        )
+        route = respx.post(INTROSPECTION_ENDPOINT).mock(
+            return_value=Response(200, json={"active": True})
+        )
+
+        introspection = await client.introspect_token("TOKEN")
+        introspection["active"] = False
+        assert await client.introspect_token("TOKEN") == {"active": True}
+        assert route.call_count == 1
+
+        await client.introspect_token("TOKEN", "access_token")
+        assert route.call_count == 2
+
+    @pytest.mark.parametrize(
+        "introspection_cache_ttl,introspection",
+        [(0, {"active": True}), (60, {"active": True, "exp": 0})],
+    )
+    @respx.mock
+    async def test_introspect_token_not_cached(
+        self, introspection_cache_ttl: float, introspection: dict
+    ):
+        client = OAuth2(
+            CLIENT_ID,
+            CLIENT_SECRET,
+            AUTHORIZE_ENDPOINT,
+            ACCESS_TOKEN_ENDPOINT,
+            introspection_endpoint=INTROSPECTION_ENDPOINT,
+        )
+        client.introspection_cache_ttl = introspection_cache_ttl
+        route = respx.post(INTROSPECTION_ENDPOINT).mock(
+            return_value=Response(200, json=introspection)
+        )
+
+        await client.introspect_token("TOKEN")
+        await client.introspect_token("TOKEN")
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_introspect_token_coalesced(self):
+        client = OAuth2(
+            CLIENT_ID,
+            CLIENT_SECRET,
+            AUTHORIZE_ENDPOINT,
+            ACCESS_TOKEN_ENDPOINT,
+            introspection_endpoint=INTROSPECTION_ENDPOINT,
+        )
+        client.introspection_cache_ttl = 0
+        route = respx.post(INTROSPECTION_ENDPOINT).mock(
+            return_value=Response(200, json={"active": True})
+        )
+
+        introspections = await asyncio.gather(
+            *(client.introspect_token("TOKEN") for _ in range(5))
+        )
+
+        assert introspections == [{"active": True}] * 5
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_introspect_tokens(self):
+        client = OAuth2(
+            CLIENT_ID,
+            CLIENT_SECRET,
+            AUTHORIZE_ENDPOINT,
+            ACCESS_TOKEN_ENDPOINT,
+            introspection_endpoint=INTROSPECTION_ENDPOINT,
+        )
+
+        def introspection_response(request: httpx.Request) -> Response:
+            active = b"token=ACTIVE" in request.content
+            return Response(200, json={"active": active})
+
+        route = respx.post(INTROSPECTION_ENDPOINT).mock(
+            side_effect=introspection_response
+        )
+
+        introspections = await client.introspect_tokens(
+            ["ACTIVE", "INACTIVE", "ACTIVE"], concurrency=2
+        )
+
+        assert introspections == [
+            {"active": True},
+            {"active": False},
+            {"active": True},
+        ]
+        assert route.call_count == 2
+
+    @pytest.mark.parametrize("concurrency", [0, -1])
+    async def test_introspect_tokens_invalid_concurrency(self, concurrency: int):
+        client = OAuth2(
+            CLIENT_ID,
+            CLIENT_SECRET,
+            AUTHORIZE_ENDPOINT,
+            ACCESS_TOKEN_ENDPOINT,
+            introspection_endpoint=INTROSPECTION_ENDPOINT,
+        )
+
+        with pytest.raises(ValueError):
+            await asyncio.wait_for(
+                client.introspect_tokens(["TOKEN"], concurrency=concurrency), 1
+            )
+
+
 @pytest.mark.asyncio
 class TestGetProfile:
     async def test_not_implemented(self, client: OAuth2):
@@ -338,8 +852,819 @@ class TestGetProfile:
             await client.get_profile("TOKEN")
 
 
+PROFILE_ENDPOINT = "https://www.camelot.bt/profile"
+
+
+@pytest.mark.asyncio
+class TestRequestProfile:
+    @respx.mock
+    async def test_success(self, client: OAuth2):
+        route = respx.get(PROFILE_ENDPOINT).mock(
+            return_value=Response(200, json={"id": "USER_ID"})
+        )
+
+        profile = await client.request_profile(
+            "GET", PROFILE_ENDPOINT, "TOKEN", params={"fields": "id"}
+        )
+
+        assert profile == {"id": "USER_ID"}
+        request = route.calls.last.request
+        assert request.headers["Authorization"] == "Bearer TOKEN"
+        assert request.headers["Accept"] == "application/json"
+        assert request.url.params["fields"] == "id"
+
+    @respx.mock
+    async def test_custom_headers(self, client: OAuth2):
+        route = respx.post(PROFILE_ENDPOINT).mock(
+            return_value=Response(200, json={"id": "USER_ID"})
+        )
+
+        await client.request_profile(
+            "POST", PROFILE_ENDPOINT, "TOKEN", headers={"X-Token": "TOKEN"}
+        )
+
+        request = route.calls.last.request
+        assert request.headers["X-Token"] == "TOKEN"
+        assert "Authorization" not in request.headers
+
+    @respx.mock
+    async def test_error(self, client: OAuth2):
+        respx.get(PROFILE_ENDPOINT).mock(return_value=Response(401, json={}))
+
+        with pytest.raises(GetProfileError) as excinfo:
+            await client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN")
+        assert excinfo.value.response is not None
+        assert excinfo.value.response.status_code == 401
+
+    @respx.mock
+    async def test_invalid_json(self, client: OAuth2):
+        respx.get(PROFILE_ENDPOINT).mock(return_value=Response(200, text="NOT_JSON"))
+
+        with pytest.raises(GetProfileError) as excinfo:
+            await client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN")
+        assert excinfo.value.message == "Invalid JSON content"
+
+
+@pytest.mark.asyncio
+class TestConditionalProfileRequests:
+    @pytest.fixture
+    def client(self) -> OAuth2:
+        client = OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+        client.conditional_profile_requests = True
+        return client
+
+    @respx.mock
+    async def test_not_modified(self, client: OAuth2):
+        route = respx.get(PROFILE_ENDPOINT).mock(
+            side_effect=[
+                Response(200, json={"id": "USER_ID"}, headers={"ETag": '"V1"'}),
+                Response(304),
+            ]
+        )
+
+        first = await client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN")
+        second = await client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN")
+
+        assert first == second == {"id": "USER_ID"}
+        assert first is not second
+        assert "If-None-Match" not in route.calls[0].request.headers
+        assert route.calls[1].request.headers["If-None-Match"] == '"V1"'
+
+    @respx.mock
+    async def test_last_modified(self, client: OAuth2):
+        last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+        route = respx.get(PROFILE_ENDPOINT).mock(
+            side_effect=[
+                Response(
+                    200, json={"id": "V1"}, headers={"Last-Modified": last_modified}
+                ),
+                Response(200, json={"id": "V2"}),
+                Response(200, json={"id": "V3"}),
+            ]
+        )
+
+        assert await client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN") == {
+            "id": "V1"
+        }
+        assert await client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN") == {
+            "id": "V2"
+        }
+        await client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN")
+
+        assert route.calls[1].request.headers["If-Modified-Since"] == last_modified
+        assert "If-None-Match" not in route.calls[1].request.headers
+        assert "If-Modified-Since" not in route.calls[2].request.headers
+
+    @respx.mock
+    async def test_per_token(self, client: OAuth2):
+        route = respx.get(PROFILE_ENDPOINT).mock(
+            return_value=Response(200, json={}, headers={"ETag": '"V1"'})
+        )
+
+        await client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN")
+        await client.request_profile("GET", PROFILE_ENDPOINT, "OTHER_TOKEN")
+
+        assert "If-None-Match" not in route.calls[1].request.headers
+
+    @respx.mock
+    async def test_post_not_cached(self, client: OAuth2):
+        route = respx.post(PROFILE_ENDPOINT).mock(
+            return_value=Response(200, json={}, headers={"ETag": '"V1"'})
+        )
+
+        await client.request_profile("POST", PROFILE_ENDPOINT, "TOKEN")
+        await client.request_profile("POST", PROFILE_ENDPOINT, "TOKEN")
+
+        assert "If-None-Match" not in route.calls[1].request.headers
+
+    @respx.mock
+    async def test_disabled(self):
+        client = OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+        route = respx.get(PROFILE_ENDPOINT).mock(
+            return_value=Response(200, json={}, headers={"ETag": '"V1"'})
+        )
+
+        await client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN")
+        await client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN")
+
+        assert "If-None-Match" not in route.calls[1].request.headers
+
+
+@pytest.mark.asyncio
+class TestRejectedTokensCache:
+    @pytest.fixture
+    def client(self) -> OAuth2:
+        client = OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+        client.rejected_tokens_cache_ttl = 10
+        return client
+
+    @respx.mock
+    async def test_rejected_token(self, client: OAuth2):
+        route = respx.get(PROFILE_ENDPOINT).mock(return_value=Response(401))
+
+        with pytest.raises(GetProfileError) as excinfo:
+            await client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN")
+        assert excinfo.value.response is not None
+        assert excinfo.value.response.status_code == 401
+
+        for _ in range(2):
+            with pytest.raises(GetProfileError) as excinfo:
+                await client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN")
+            assert excinfo.value.response is None
+            assert "401" in str(excinfo.value)
+        assert route.call_count == 1
+        assert client._rejected_tokens.get(hash_token("TOKEN")) == 401
+
+        respx.get(PROFILE_ENDPOINT).mock(return_value=Response(200, json={}))
+        assert await client.request_profile("GET", PROFILE_ENDPOINT, "OTHER") == {}
+
+    @respx.mock
+    async def test_expired(self, client: OAuth2):
+        route = respx.get(PROFILE_ENDPOINT).mock(return_value=Response(401))
+
+        with pytest.raises(GetProfileError):
+            await client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN")
+        now = time.monotonic()
+        client._rejected_tokens._clock = lambda: now + 11
+        with pytest.raises(GetProfileError):
+            await client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN")
+
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_other_errors_not_cached(self, client: OAuth2):
+        route = respx.get(PROFILE_ENDPOINT).mock(return_value=Response(500))
+
+        for _ in range(2):
+            with pytest.raises(GetProfileError):
+                await client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN")
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_disabled(self):
+        client = OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+        route = respx.get(PROFILE_ENDPOINT).mock(return_value=Response(401))
+
+        for _ in range(2):
+            with pytest.raises(GetProfileError):
+                await client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN")
+        assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+class TestCoalesceProfileRequests:
+    @respx.mock
+    async def test_concurrent_requests(self):
+        client = OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+        route = respx.get(PROFILE_ENDPOINT).mock(
+            return_value=Response(200, json={"id": "USER_ID"})
+        )
+
+        profiles = await asyncio.gather(
+            *(
+                client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN")
+                for _ in range(5)
+            ),
+            client.request_profile("GET", PROFILE_ENDPOINT, "OTHER_TOKEN"),
+            client.request_profile(
+                "GET", PROFILE_ENDPOINT, "TOKEN", params={"fields": "id"}
+            ),
+        )
+
+        assert all(profile == {"id": "USER_ID"} for profile in profiles)
+        assert profiles[0] is not profiles[1]
+        assert route.call_count == 3
+
+    @respx.mock
+    async def test_concurrent_errors(self):
+        client = OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+        route = respx.get(PROFILE_ENDPOINT).mock(return_value=Response(401))
+
+        results = await asyncio.gather(
+            *(
+                client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN")
+                for _ in range(3)
+            ),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, GetProfileError) for result in results)
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_disabled(self):
+        client = OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+        client.coalesce_profile_requests = False
+        route = respx.get(PROFILE_ENDPOINT).mock(return_value=Response(200, json={}))
+
+        await asyncio.gather(
+            *(
+                client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN")
+                for _ in range(3)
+            )
+        )
+
+        assert route.call_count == 3
+
+
+class TestHedgingPolicy:
+    def test_delay_without_samples(self):
+        policy = HedgingPolicy(max_delay=0.5, min_samples=3)
+        policy.record(0.1)
+        policy.record(0.2)
+        assert policy.delay == 0.5
+
+    def test_delay_percentile(self):
+        policy = HedgingPolicy(90, window=10, min_samples=1)
+        for latency in range(20, 0, -1):
+            policy.record(latency / 100)
+        assert policy.delay == 0.09
+
+    def test_delay_bounds(self):
+        policy = HedgingPolicy(0, min_delay=0.05, max_delay=0.2, min_samples=1)
+        policy.record(0.01)
+        assert policy.delay == 0.05
+
+        policy = HedgingPolicy(100, min_delay=0.05, max_delay=0.2, min_samples=1)
+        policy.record(1.0)
+        assert policy.delay == 0.2
+
+
+class DelayedResponses:
+    """Mock side effect answering each request after a delay, in order."""
+
+    def __init__(self, *responses: tuple[float, Response | Exception]) -> None:
+        self.responses = list(responses)
+        self.requests: list[httpx.Request] = []
+        self.cancelled: list[int] = []
+
+    async def __call__(self, request: httpx.Request) -> Response:
+        index = len(self.requests)
+        self.requests.append(request)
+        delay, response = self.responses[index]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(index)
+            raise
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.mark.asyncio
+class TestHedgedProfileRequests:
+    @pytest.fixture
+    def hedged_client(self) -> OAuth2:
+        client = OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+        client.hedging_policy = HedgingPolicy(max_delay=0.01)
+        return client
+
+    @respx.mock
+    async def test_fast_response(self, hedged_client: OAuth2):
+        responses = DelayedResponses((0, Response(200, json={"id": "1"})))
+        respx.get(PROFILE_ENDPOINT).mock(side_effect=responses)
+
+        profile = await hedged_client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN")
+
+        assert profile == {"id": "1"}
+        assert len(responses.requests) == 1
+        assert hedged_client.hedging_policy is not None
+        assert len(hedged_client.hedging_policy._latencies) == 1
+
+    @respx.mock
+    async def test_hedged_response_wins(self, hedged_client: OAuth2):
+        responses = DelayedResponses(
+            (5, Response(200, json={"id": "slow"})),
+            (0, Response(200, json={"id": "hedged"})),
+        )
+        respx.get(PROFILE_ENDPOINT).mock(side_effect=responses)
+
+        profile = await hedged_client.request_profile(
+            "GET", PROFILE_ENDPOINT, "TOKEN", params={"fields": "id"}
+        )
+
+        assert profile == {"id": "hedged"}
+        assert len(responses.requests) == 2
+        first, hedged = responses.requests
+        assert hedged.url == first.url
+        assert hedged.headers["Authorization"] == "Bearer TOKEN"
+        await asyncio.sleep(0)
+        assert responses.cancelled == [0]
+
+    @respx.mock
+    async def test_first_successful_response_wins(self, hedged_client: OAuth2):
+        responses = DelayedResponses(
+            (0.05, Response(200, json={"id": "first"})),
+            (0, Response(503)),
+        )
+        respx.get(PROFILE_ENDPOINT).mock(side_effect=responses)
+
+        profile = await hedged_client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN")
+
+        assert profile == {"id": "first"}
+        assert len(responses.requests) == 2
+
+    @respx.mock
+    async def test_fast_error_not_hedged(self, hedged_client: OAuth2):
+        responses = DelayedResponses((0, Response(500)))
+        respx.get(PROFILE_ENDPOINT).mock(side_effect=responses)
+
+        with pytest.raises(GetProfileError):
+            await hedged_client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN")
+        assert len(responses.requests) == 1
+        assert hedged_client.hedging_policy is not None
+        assert len(hedged_client.hedging_policy._latencies) == 0
+
+    @respx.mock
+    async def test_all_attempts_failed(self, hedged_client: OAuth2):
+        responses = DelayedResponses(
+            (0.05, httpx.ConnectError("Connection failed")),
+            (0, Response(502)),
+        )
+        respx.get(PROFILE_ENDPOINT).mock(side_effect=responses)
+
+        with pytest.raises(httpx.ConnectError):
+            await hedged_client.request_profile("GET", PROFILE_ENDPOINT, "TOKEN")
+        assert len(responses.requests) == 2
+
+    @respx.mock
+    async def test_post_not_hedged(self, hedged_client: OAuth2):
+        responses = DelayedResponses((0.05, Response(200, json={})))
+        respx.post(PROFILE_ENDPOINT).mock(side_effect=responses)
+
+        await hedged_client.request_profile("POST", PROFILE_ENDPOINT, "TOKEN")
+        assert len(responses.requests) == 1
+
+    @respx.mock
+    async def test_token_endpoint_not_hedged(self, hedged_client: OAuth2):
+        responses = DelayedResponses(
+            (0.05, Response(200, json={"access_token": "ACCESS_TOKEN"}))
+        )
+        respx.post(ACCESS_TOKEN_ENDPOINT).mock(side_effect=responses)
+
+        await hedged_client.get_access_token("CODE", REDIRECT_URI)
+        assert len(responses.requests) == 1
+
+
 @pytest.mark.asyncio
 class TestGetIdEmail:
     async def test_not_implemented(self, client: OAuth2):
         with pytest.raises(NotImplementedError):
             await client.get_id_email("TOKEN")
+
+
+def test_get_warmup_endpoints(client_revoke: OAuth2):
+    assert client_revoke.get_warmup_endpoints() == [
+        ACCESS_TOKEN_ENDPOINT,
+        REVOKE_TOKEN_ENDPOINT,
+    ]
+
+
+@pytest.mark.asyncio
+class TestWarmup:
+    @pytest.fixture
+    def client(self) -> OAuth2:
+        return OAuth2(
+            CLIENT_ID,
+            CLIENT_SECRET,
+            AUTHORIZE_ENDPOINT,
+            ACCESS_TOKEN_ENDPOINT,
+            refresh_token_endpoint=REFRESH_TOKEN_ENDPOINT,
+            introspection_endpoint="https://auth.camelot.bt/introspect",
+        )
+
+    @respx.mock
+    async def test_warmup(self, client: OAuth2):
+        route = respx.head(host="www.camelot.bt").mock(return_value=Response(405))
+        other_route = respx.head(host="auth.camelot.bt").mock(
+            side_effect=HTTPError("ERROR")
+        )
+
+        async with client:
+            await client.warmup(connections=3)
+            assert client.is_open
+            assert route.call_count == 3
+            assert other_route.call_count == 3
+            assert client._keepalive_task is None
+
+    @respx.mock
+    async def test_keepalive(self, client: OAuth2):
+        route = respx.head(host="www.camelot.bt").mock(return_value=Response(405))
+        respx.head(host="auth.camelot.bt").mock(return_value=Response(405))
+
+        await client.warmup(keepalive_interval=0.01)
+        keepalive_task = client._keepalive_task
+        assert keepalive_task is not None
+        await client.warmup(keepalive_interval=0.01)
+        assert client._keepalive_task is keepalive_task
+
+        while route.call_count < 4:
+            await asyncio.sleep(0.01)
+
+        await client.aclose()
+        assert keepalive_task.cancelled()
+        assert client._keepalive_task is None
+
+    async def test_warmup_closed(self, client: OAuth2):
+        await client._warmup(1)
+
+
+@pytest.mark.asyncio
+class TestGetIdEmails:
+    @pytest.fixture
+    def client(self) -> OAuth2:
+        return OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+
+    async def test_results(self, client: OAuth2, mocker):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_id_email(token: str) -> tuple[str, str | None]:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if token == "INVALID":
+                raise GetIdEmailError()
+            return f"ID_{token}", None
+
+        mocker.patch.object(client, "get_id_email", side_effect=get_id_email)
+        create_httpx_client = mocker.spy(client, "create_httpx_client")
+        tokens = (token for token in ["A", "INVALID", "B", "C", "D"])
+
+        results = [
+            result async for result in client.get_id_emails(tokens, concurrency=2)
+        ]
+
+        assert max_in_flight == 2
+        assert not client.is_open
+        create_httpx_client.assert_called_once()
+        assert create_httpx_client.spy_return.is_closed
+        results_by_token = {result.token: result for result in results}
+        assert len(results_by_token) == 5
+        assert results_by_token["A"] == IdEmailResult("A", ("ID_A", None))
+        assert results_by_token["INVALID"].id_email is None
+        assert isinstance(results_by_token["INVALID"].error, GetIdEmailError)
+
+    async def test_rate_limit(self, client: OAuth2, mocker):
+        mocker.patch.object(client, "get_id_email", return_value=("ID", None))
+        sleep_mock = mocker.patch("asyncio.sleep", new_callable=mocker.AsyncMock)
+
+        results = [
+            result
+            async for result in client.get_id_emails(
+                ["A", "B", "C"], concurrency=3, rate_limit=10
+            )
+        ]
+
+        assert len(results) == 3
+        delays = sorted(call.args[0] for call in sleep_mock.await_args_list)
+        assert len(delays) == 2
+        assert delays[0] == pytest.approx(0.1, abs=0.05)
+        assert delays[1] == pytest.approx(0.2, abs=0.05)
+
+    async def test_break(self, client: OAuth2, mocker):
+        started: list[str] = []
+
+        async def get_id_email(token: str) -> tuple[str, str | None]:
+            started.append(token)
+            if token != "A":
+                await asyncio.Event().wait()
+            return "ID", None
+
+        mocker.patch.object(client, "get_id_email", side_effect=get_id_email)
+
+        async with contextlib.aclosing(
+            client.get_id_emails(["A", "B", "C", "D"], concurrency=2)
+        ) as results:
+            async for result in results:
+                assert result.token == "A"
+                break
+
+        assert "D" not in started
+        assert not client.is_open
+
+    @pytest.mark.parametrize("concurrency", [0, -1])
+    async def test_invalid_concurrency(self, client: OAuth2, concurrency: int):
+        with pytest.raises(ValueError):
+            async for _ in client.get_id_emails(["A"], concurrency=concurrency):
+                pass
+
+    async def test_unexpected_error(self, client: OAuth2, mocker):
+        mocker.patch.object(client, "get_id_email", side_effect=KeyError("id"))
+
+        with pytest.raises(KeyError):
+            async for _ in client.get_id_emails(["A"]):
+                pass
+
+    async def test_shared_pool_not_closed(self, client: OAuth2, mocker):
+        other_client = OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+        other_client.pool = client.pool
+
+        async def get_id_email(token: str) -> tuple[str, str | None]:
+            await other_client.open()
+            return "ID", None
+
+        mocker.patch.object(client, "get_id_email", side_effect=get_id_email)
+
+        async for _ in client.get_id_emails(["A", "B"]):
+            pass
+
+        assert other_client.is_open
+        await other_client.aclose()
+
+    async def test_already_open(self, client: OAuth2, mocker):
+        mocker.patch.object(client, "get_id_email", return_value=("ID", None))
+
+        async with client:
+            async for _ in client.get_id_emails(["A"]):
+                pass
+            assert client.is_open
+
+
+class TestJSONCodec:
+    def test_default(self):
+        client = OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+        assert client.json_codec is default_json_codec
+        assert client.json_codec.encode(["a", "b"]) == '["a", "b"]'
+
+    def test_encode_bytes(self):
+        codec = JSONCodec(dumps=lambda obj: json.dumps(obj).encode("utf-8"))
+        assert codec.encode({"a": 1}) == '{"a": 1}'
+
+
+@pytest.mark.asyncio
+class TestJSONDecoding:
+    @respx.mock
+    async def test_custom_json_codec(self, load_mock, mocker):
+        client = OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+        loads = mocker.Mock(wraps=json.loads)
+        client.json_codec = JSONCodec(loads)
+        respx.post(ACCESS_TOKEN_ENDPOINT).mock(
+            return_value=Response(200, json=load_mock("google_success_access_token"))
+        )
+
+        access_token = await client.get_access_token("CODE", REDIRECT_URI)
+        assert "access_token" in access_token
+        loads.assert_called_once()
+        assert isinstance(loads.call_args[0][0], bytes)
+
+    @respx.mock
+    async def test_default_json_codec(self, load_mock, mocker):
+        client = OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+        loads = mocker.Mock(wraps=json.loads)
+        mocker.patch.object(default_json_codec, "loads", loads)
+        respx.post(ACCESS_TOKEN_ENDPOINT).mock(
+            return_value=Response(200, json=load_mock("google_success_access_token"))
+        )
+
+        await client.get_access_token("CODE", REDIRECT_URI)
+        loads.assert_called_once()
+
+    @respx.mock
+    async def test_process_token_response(self, load_mock, mocker):
+        client = OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+        process_token_response_spy = mocker.spy(client, "process_token_response")
+        respx.post(ACCESS_TOKEN_ENDPOINT).mock(
+            return_value=Response(200, json=load_mock("google_success_access_token"))
+        )
+
+        await client.get_access_token("CODE", REDIRECT_URI)
+        process_token_response_spy.assert_called_once()
+        assert (
+            process_token_response_spy.call_args.kwargs["exc_class"]
+            is GetAccessTokenError
+        )
+
+
+class TestOAuth2ErrorResponse:
+    def test_from_dict(self):
+        assert OAuth2ErrorResponse.from_dict(
+            {
+                "error": "invalid_grant",
+                "error_description": "Expired",
+                "error_uri": "https://www.camelot.bt/errors",
+            }
+        ) == ("invalid_grant", "Expired", "https://www.camelot.bt/errors")
+        assert OAuth2ErrorResponse.from_dict(
+            {"error": "invalid_grant", "error_description": 42}
+        ) == ("invalid_grant", None, None)
+
+    @pytest.mark.parametrize("data", [{}, {"error": 401}])
+    def test_from_dict_invalid(self, data):
+        assert OAuth2ErrorResponse.from_dict(data) is None
+
+    def test_from_response(self):
+        response = Response(400, json={"error": "invalid_client"})
+        assert OAuth2ErrorResponse.from_response(response) == OAuth2ErrorResponse(
+            "invalid_client"
+        )
+
+    @pytest.mark.parametrize(
+        "response",
+        [Response(400, content=b"NOT JSON"), Response(400, json=["invalid_client"])],
+    )
+    def test_from_response_invalid(self, response: Response):
+        assert OAuth2ErrorResponse.from_response(response) is None
+
+
+class TestOAuth2RequestError:
+    def test_error_response_parsed_once(self, mocker):
+        response = Response(400, json={"error": "invalid_grant"})
+        json_spy = mocker.patch.object(
+            default_json_codec, "loads", mocker.Mock(wraps=json.loads)
+        )
+        error = GetAccessTokenError("ERROR", response)
+
+        assert json_spy.call_count == 0
+        assert error.error == "invalid_grant"
+        assert error.error_response == ("invalid_grant", None, None)
+        assert error.requires_reauthorization is True
+        assert error.is_retryable is False
+        assert json_spy.call_count == 1
+
+    def test_explicit_error_response(self):
+        error = GetAccessTokenError(
+            "ERROR", error_response=OAuth2ErrorResponse("temporarily_unavailable")
+        )
+        assert error.error == "temporarily_unavailable"
+        assert error.is_retryable is True
+        assert error.requires_reauthorization is False
+
+    @pytest.mark.parametrize(
+        "response,is_retryable",
+        [
+            (None, True),
+            (Response(500), True),
+            (Response(429), True),
+            (Response(400), False),
+            (Response(400, json={"error": "server_error"}), True),
+        ],
+    )
+    def test_is_retryable(self, response: Response | None, is_retryable: bool):
+        error = OAuth2RequestError("ERROR", response)
+        assert error.is_retryable is is_retryable
+
+    def test_no_error(self):
+        error = OAuth2RequestError("ERROR", Response(500))
+        assert error.error_response is None
+        assert error.error is None
+
+
+@pytest.mark.asyncio
+class TestHTTPXClientPool:
+    async def test_not_open(self, client: OAuth2):
+        assert client.is_open is False
+        async with client.get_httpx_client() as httpx_client:
+            assert isinstance(httpx_client, httpx.AsyncClient)
+        assert httpx_client.is_closed
+
+    async def test_open_aclose(self):
+        client = OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+        await client.open()
+        assert client.is_open is True
+
+        async with client.get_httpx_client() as httpx_client_1:
+            pass
+        async with client.get_httpx_client() as httpx_client_2:
+            pass
+        assert httpx_client_1 is httpx_client_2
+        assert not httpx_client_1.is_closed
+
+        await client.open()
+        async with client.get_httpx_client() as httpx_client_3:
+            assert httpx_client_3 is httpx_client_1
+
+        await client.aclose()
+        assert client.is_open is False
+        assert httpx_client_1.is_closed
+
+        await client.aclose()
+
+    @respx.mock
+    async def test_context_manager(self, load_mock):
+        client = OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+        respx.post(ACCESS_TOKEN_ENDPOINT).mock(
+            return_value=Response(200, json=load_mock("google_success_access_token"))
+        )
+
+        async with client as opened_client:
+            assert opened_client is client
+            assert client.is_open is True
+            access_token = await client.get_access_token("CODE", REDIRECT_URI)
+            assert "access_token" in access_token
+
+        assert client.is_open is False
+
+    async def test_copy_shares_pool(self):
+        client = OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+        copy = client._copy_with(access_token_endpoint=REFRESH_TOKEN_ENDPOINT)
+        assert copy.access_token_endpoint == REFRESH_TOKEN_ENDPOINT
+        assert client.access_token_endpoint == ACCESS_TOKEN_ENDPOINT
+        assert copy._client_credentials_tokens is not client._client_credentials_tokens
+        assert copy._introspection_cache is not client._introspection_cache
+
+        async with client:
+            assert copy.is_open is True
+            async with client.get_httpx_client() as httpx_client_1:
+                pass
+            async with copy.get_httpx_client() as httpx_client_2:
+                pass
+            assert httpx_client_1 is httpx_client_2
+        assert copy.is_open is False
+
+    async def test_shared_pool(self):
+        pool = HTTPXClientPool()
+        client_1 = OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+        client_2 = OAuth2(
+            CLIENT_ID, CLIENT_SECRET, AUTHORIZE_ENDPOINT, ACCESS_TOKEN_ENDPOINT
+        )
+        client_1.pool = pool
+        client_2.pool = pool
+        assert client_1.pool is client_2.pool is pool
+
+        async with client_1:
+            assert pool.is_open is True
+            assert client_2.is_open is True
+            async with client_2.get_httpx_client() as httpx_client:
+                assert httpx_client is pool.client
+        assert client_2.is_open is False
+        assert httpx_client.is_closed
@@ -0,0 +1,198 @@
+import asyncio
+
+import pytest
+import respx
+from httpx import Response
+
+from httpx_oauth.clients.github import GitHubOAuth2
+from httpx_oauth.clients.google import GoogleOAuth2
+from httpx_oauth.clients.okta import OktaOAuth2
+from httpx_oauth.clients.openid import OpenID
+from httpx_oauth.discovery import OpenIDDiscoveryCache
+from httpx_oauth.oauth2 import BaseOAuth2, OAuth2
+from httpx_oauth.registry import ClientRegistry
+
+CONFIG = {
+    "google": {"client_id": "GOOGLE_CLIENT_ID", "client_secret": "CLIENT_SECRET"},
+    "github-enterprise": {
+        "provider": "github",
+        "client_id": "GITHUB_CLIENT_ID",
+        "client_secret": "CLIENT_SECRET",
+    },
+}
+
+OKTA_CONFIGURATION_ENDPOINT = "https://foo.okta.com/.well-known/openid-configuration"
+OPENID_CONFIGURATION = {
+    "issuer": "https://foo.okta.com",
+    "authorization_endpoint": "https://foo.okta.com/oauth2/v1/authorize",
+    "token_endpoint": "https://foo.okta.com/oauth2/v1/token",
+    "userinfo_endpoint": "https://foo.okta.com/oauth2/v1/userinfo",
+}
+
+
+@pytest.fixture
+def registry() -> ClientRegistry:
+    return ClientRegistry.from_config(CONFIG)
+
+
+def test_from_config(registry: ClientRegistry):
+    assert len(registry) == 2
+    assert list(registry) == ["google", "github-enterprise"]
+    assert "google" in registry
+    assert "unknown" not in registry
+
+    google = registry.get("google")
+    assert isinstance(google, GoogleOAuth2)
+    assert google.client_id == "GOOGLE_CLIENT_ID"
+    assert google.name == "google"
+    assert registry["google"] is google
+
+    github = registry["github-enterprise"]
+    assert isinstance(github, GitHubOAuth2)
+    assert github.client_id == "GITHUB_CLIENT_ID"
+    assert github.name == "github-enterprise"
+
+
+def test_from_config_unknown_provider():
+    with pytest.raises(ValueError, match="Unknown provider unknown."):
+        ClientRegistry.from_config({"unknown": {"client_id": "CLIENT_ID"}})
+
+
+def test_get_not_registered(registry: ClientRegistry):
+    with pytest.raises(KeyError):
+        registry.get("unknown")
+
+
+def test_register_class(registry: ClientRegistry):
+    registry.register(
+        "custom",
+        OAuth2,
+        client_id="CLIENT_ID",
+        client_secret="CLIENT_SECRET",
+        authorize_endpoint="https://www.camelot.bt/authorize",
+        access_token_endpoint="https://www.camelot.bt/access-token",
+        name="camelot",
+    )
+
+    client = registry["custom"]
+    assert isinstance(client, BaseOAuth2)
+    assert client.name == "camelot"
+
+
+def test_register_replaces_client(registry: ClientRegistry):
+    google = registry["google"]
+    registry.register("google", "google", client_id="OTHER", client_secret="SECRET")
+
+    assert registry["google"] is not google
+    assert registry["google"].client_id == "OTHER"
+
+
+def test_rotate_client_secret(registry: ClientRegistry):
+    registry.rotate_client_secret("github-enterprise", "NOT_BUILT_SECRET")
+    assert registry["github-enterprise"].client_secret == "NOT_BUILT_SECRET"
+
+    google = registry["google"]
+    registry.rotate_client_secret("google", "NEW_SECRET", overlap=60)
+    assert registry["google"] is google
+    assert google.client_secret == "NEW_SECRET"
+
+    with pytest.raises(KeyError):
+        registry.rotate_client_secret("unknown", "NEW_SECRET")
+
+
+@pytest.mark.asyncio
+async def test_shared_pool(registry: ClientRegistry):
+    google = registry["google"]
+
+    async with registry as opened_registry:
+        assert opened_registry is registry
+        await registry.open()
+        assert registry.is_open is True
+
+        github = registry["github-enterprise"]
+        assert google.is_open is True
+        async with google.get_httpx_client() as httpx_client_1:
+            pass
+        async with github.get_httpx_client() as httpx_client_2:
+            pass
+        assert httpx_client_1 is httpx_client_2
+
+    assert registry.is_open is False
+    assert google.is_open is False
+    assert httpx_client_1.is_closed
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+class TestAget:
+    @pytest.fixture
+    def registry(self) -> ClientRegistry:
+        return ClientRegistry.from_config(
+            {
+                **CONFIG,
+                "okta-eu": {
+                    "provider": "okta",
+                    "client_id": "OKTA_CLIENT_ID",
+                    "client_secret": "CLIENT_SECRET",
+                    "okta_domain": "foo.okta.com",
+                },
+            },
+            discovery_cache=OpenIDDiscoveryCache(),
+        )
+
+    async def test_not_openid(self, registry: ClientRegistry):
+        google = await registry.aget("google")
+        assert isinstance(google, GoogleOAuth2)
+        assert await registry.aget("google") is google
+        assert registry["google"] is google
+
+    @respx.mock
+    async def test_openid(self, registry: ClientRegistry):
+        route = respx.get(OKTA_CONFIGURATION_ENDPOINT).mock(
+            return_value=Response(200, json=OPENID_CONFIGURATION)
+        )
+
+        async with registry:
+            okta, other_okta = await asyncio.gather(
+                registry.aget("okta-eu"), registry.aget("okta-eu")
+            )
+            assert isinstance(okta, OktaOAuth2)
+            assert okta is other_okta
+            assert okta.name == "okta-eu"
+            assert okta.openid_configuration == OPENID_CONFIGURATION
+            assert okta.is_open is True
+            assert registry["okta-eu"] is okta
+
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_openid_discovery_cache(self, registry: ClientRegistry):
+        registry.discovery_cache.set(OKTA_CONFIGURATION_ENDPOINT, OPENID_CONFIGURATION)
+        route = respx.get(OKTA_CONFIGURATION_ENDPOINT)
+
+        okta = await registry.aget("okta-eu")
+        assert okta.access_token_endpoint == OPENID_CONFIGURATION["token_endpoint"]
+        assert route.call_count == 0
+
+    @respx.mock
+    async def test_openid_preloaded_configuration(self, registry: ClientRegistry):
+        route = respx.get("https://example.fief.dev/.well-known/openid-configuration")
+        registry.register(
+            "fief",
+            OpenID,
+            client_id="CLIENT_ID",
+            client_secret="CLIENT_SECRET",
+            openid_configuration_endpoint=(
+                "https://example.fief.dev/.well-known/openid-configuration"
+            ),
+            openid_configuration=OPENID_CONFIGURATION,
+        )
+
+        fief = await registry.aget("fief")
+        assert isinstance(fief, OpenID)
+        assert fief.openid_configuration is OPENID_CONFIGURATION
+        assert route.call_count == 0
+
+    async def test_not_registered(self, registry: ClientRegistry):
+        with pytest.raises(KeyError):
+            await registry.aget("unknown")
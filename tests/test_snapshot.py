@@ -0,0 +1,53 @@
+import json
+import re
+
+import pytest
+import respx
+from httpx import Response
+
+from httpx_oauth.snapshot import load_snapshot, main, save_snapshot
+
+OPENID_CONFIGURATION_ENDPOINT = (
+    "https://example.fief.dev/.well-known/openid-configuration"
+)
+OPENID_CONFIGURATION = {
+    "issuer": "https://example.fief.dev",
+    "authorization_endpoint": "https://example.fief.dev/authorize",
+    "token_endpoint": "https://example.fief.dev/api/token",
+}
+
+
+def test_save_load_snapshot(tmp_path):
+    path = tmp_path / "openid-configuration.json"
+    save_snapshot(path, OPENID_CONFIGURATION)
+    assert load_snapshot(path) == OPENID_CONFIGURATION
+
+
+class TestMain:
+    @respx.mock
+    def test_output(self, tmp_path):
+        respx.get(OPENID_CONFIGURATION_ENDPOINT).mock(
+            return_value=Response(200, json=OPENID_CONFIGURATION)
+        )
+        path = tmp_path / "openid-configuration.json"
+
+        assert main([OPENID_CONFIGURATION_ENDPOINT, "-o", str(path)]) == 0
+        assert load_snapshot(path) == OPENID_CONFIGURATION
+
+    @respx.mock
+    def test_stdout(self, capsys: pytest.CaptureFixture[str]):
+        respx.get(OPENID_CONFIGURATION_ENDPOINT).mock(
+            return_value=Response(200, json=OPENID_CONFIGURATION)
+        )
+
+        assert main([OPENID_CONFIGURATION_ENDPOINT]) == 0
+        assert json.loads(capsys.readouterr().out) == OPENID_CONFIGURATION
+
+    @respx.mock
+    def test_error(self, capsys: pytest.CaptureFixture[str]):
+        respx.get(re.compile(OPENID_CONFIGURATION_ENDPOINT)).mock(
+            return_value=Response(500)
+        )
+
+        assert main([OPENID_CONFIGURATION_ENDPOINT]) == 1
+        assert capsys.readouterr().err.startswith("Error: ")
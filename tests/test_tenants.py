@@ -0,0 +1,53 @@
+import pytest
+
+from httpx_oauth.clients.shopify import ShopifyOAuth2
+from httpx_oauth.tenants import TenantRegistry
+
+
+@pytest.fixture
+def registry() -> TenantRegistry[ShopifyOAuth2]:
+    return TenantRegistry(
+        ShopifyOAuth2("CLIENT_ID", "CLIENT_SECRET", "my-shop"), maxsize=2
+    )
+
+
+def test_get(registry: TenantRegistry[ShopifyOAuth2]):
+    client = registry.get("shop-a")
+    assert client.shop == "shop-a"
+    assert (
+        client.authorize_endpoint
+        == "https://shop-a.myshopify.com/admin/oauth/authorize"
+    )
+    assert registry.get("shop-a") is client
+    assert registry["shop-a"] is client
+    assert len(registry) == 1
+
+
+def test_get_evicts_least_recently_used(registry: TenantRegistry[ShopifyOAuth2]):
+    client_a = registry.get("shop-a")
+    registry.get("shop-b")
+    registry.get("shop-a")
+    registry.get("shop-c")
+
+    assert len(registry) == 2
+    assert registry.get("shop-a") is client_a
+    assert registry.get("shop-b").shop == "shop-b"
+
+
+@pytest.mark.asyncio
+async def test_shared_pool(registry: TenantRegistry[ShopifyOAuth2]):
+    async with registry as opened_registry:
+        assert opened_registry is registry
+        assert registry.client.is_open is True
+
+        client_a = registry.get("shop-a")
+        client_b = registry.get("shop-b")
+        assert client_a.is_open is True
+        async with client_a.get_httpx_client() as httpx_client_a:
+            pass
+        async with client_b.get_httpx_client() as httpx_client_b:
+            pass
+        assert httpx_client_a is httpx_client_b
+
+    assert client_a.is_open is False
+    assert httpx_client_a.is_closed
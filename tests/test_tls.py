@@ -0,0 +1,81 @@
+import ssl
+
+import certifi
+import pytest
+
+from httpx_oauth.oauth2 import OAuth2
+from httpx_oauth.registry import ClientRegistry
+from httpx_oauth.tls import SharedSSLContext, default_ssl_context
+
+
+@pytest.fixture
+def create_default_context_spy(mocker):
+    return mocker.spy(ssl, "create_default_context")
+
+
+def test_lazy_shared_context(create_default_context_spy, monkeypatch):
+    monkeypatch.delenv("SSL_CERT_FILE", raising=False)
+    monkeypatch.delenv("SSL_CERT_DIR", raising=False)
+    shared_context = SharedSSLContext()
+    create_default_context_spy.assert_not_called()
+
+    context = shared_context.get()
+    assert isinstance(context, ssl.SSLContext)
+    assert shared_context.get() is context
+    create_default_context_spy.assert_called_once_with(
+        cafile=certifi.where(), capath=None, cadata=None
+    )
+
+
+def test_custom_ca_source(create_default_context_spy):
+    with open(certifi.where()) as f:
+        cadata = f.read()
+    shared_context = SharedSSLContext(cadata=cadata)
+
+    shared_context.get()
+    create_default_context_spy.assert_called_once_with(
+        cafile=None, capath=None, cadata=cadata
+    )
+
+
+@pytest.mark.parametrize(
+    "variable,expected_kwargs",
+    [
+        ("SSL_CERT_FILE", {"cafile": certifi.where(), "capath": None}),
+        ("SSL_CERT_DIR", {"cafile": None, "capath": "/etc/ssl/certs"}),
+    ],
+)
+def test_environment_ca_source(
+    variable, expected_kwargs, create_default_context_spy, monkeypatch, mocker
+):
+    monkeypatch.delenv("SSL_CERT_FILE", raising=False)
+    monkeypatch.delenv("SSL_CERT_DIR", raising=False)
+    monkeypatch.setenv(variable, expected_kwargs["cafile"] or expected_kwargs["capath"])
+    mocker.patch.object(ssl.SSLContext, "load_verify_locations")
+
+    SharedSSLContext().get()
+    create_default_context_spy.assert_called_once_with(**expected_kwargs, cadata=None)
+
+
+def test_configure(create_default_context_spy):
+    shared_context = SharedSSLContext()
+    context = shared_context.get()
+
+    shared_context.configure(cafile=certifi.where())
+    assert shared_context.cafile == certifi.where()
+    assert shared_context.get() is not context
+    assert create_default_context_spy.call_count == 2
+
+
+def test_clients_use_shared_context():
+    client = OAuth2("CLIENT_ID", "CLIENT_SECRET", "AUTHORIZE", "ACCESS_TOKEN")
+    assert client.ssl_context is default_ssl_context
+
+    httpx_client = client.create_httpx_client()
+    assert httpx_client._transport._pool._ssl_context is default_ssl_context.get()  # type: ignore
+
+    registry_httpx_client = ClientRegistry().create_httpx_client()
+    assert (
+        registry_httpx_client._transport._pool._ssl_context  # type: ignore
+        is default_ssl_context.get()
+    )